@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1 import auth, users, jobs, emails
+from app.api.v1 import auth, users, jobs, emails, saved_searches
 
 api_router = APIRouter()
 
@@ -7,3 +7,4 @@ api_router.include_router(auth.router)
 api_router.include_router(users.router)
 api_router.include_router(jobs.router)
 api_router.include_router(emails.router)
+api_router.include_router(saved_searches.router)
@@ -1,44 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel, HttpUrl
-from typing import Optional
-from app.models import User, Job, JobSource, JobStatus, get_db
+from typing import Optional, Literal
+import json
+from app.models import User, Job, JobSource, JobStatus, get_db, async_session
 from app.api.v1.schemas import (
-    JobSearch, JobCreate, JobResponse, AdvancedJobSearch,
+    JobSearch, JobCreate, JobResponse, AdvancedJobSearch, FreeSourceSearch, JobEnrichRequest,
     JobType, WorkMode, TimeFilter, ExperienceLevel
 )
 from app.core.security import get_current_user
-from app.services import ai_service
+from app.services import ai_service, posting_store, job_enricher, saved_search_runner
+from app.services.job_search import insert_new_postings, run_advanced_search
+from app.workers.queue import scrape_queue
 from app.scrapers import linkedin_scraper, indeed_scraper
-from app.scrapers import (
-    remotive_api,
-    remoteok_api,
-    weworkremotely_api,
-    arbeitnow_api,
-    jobicy_api,
-    himalayas_api,
-    nodesk_api,
-    findwork_api,
-    search_all_free_sources,
-)
+from app.scrapers import FREE_SOURCES
+from app.scrapers.fanout import fan_out, iter_fan_out
+from app.scrapers.circuit_breaker import get_breaker
+from app.scrapers.posting import JobPosting
+from app.scrapers.dedupe import collapse_duplicates
+from app.scrapers.browser_pool import browser_pool
+from app.scrapers.rate_limiter import rate_limiter
+from app.core.config import settings
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 
-# Free sources mapping - 8 popular job boards
-FREE_SOURCES = {
-    "remotive": remotive_api,
-    "remoteok": remoteok_api,
-    "weworkremotely": weworkremotely_api,
-    "arbeitnow": arbeitnow_api,
-    "jobicy": jobicy_api,
-    "himalayas": himalayas_api,
-    "nodesk": nodesk_api,
-    "findwork": findwork_api,
-}
-
-
 # Schema for URL import
 class JobImportURL(BaseModel):
     url: str
@@ -62,8 +50,8 @@ def detect_source(url: str) -> str:
 @router.post("/search/advanced")
 async def advanced_job_search(
     search: AdvancedJobSearch,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """
     Advanced job search with all filters.
@@ -80,110 +68,74 @@ async def advanced_job_search(
         "sources": ["linkedin", "indeed"]
     }
     ```
+
+    With SCRAPE_QUEUE_ENABLED the search is handed to the scrape workers and
+    this returns 202 with a `task_id` at once; poll /jobs/search/tasks/{task_id}
+    for the same response once the task is done.
     """
+    query = search.model_dump(mode="json")
+    if settings.SCRAPE_QUEUE_ENABLED:
+        task_id = await scrape_queue.enqueue("advanced_search", current_user.id, query)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {
+            "message": "Search queued",
+            "task_id": task_id,
+            "status": "queued",
+            "status_url": f"{settings.API_V1_PREFIX}/jobs/search/tasks/{task_id}",
+        }
 
-    all_jobs = []
+    result = await run_advanced_search(current_user.id, query)
 
-    # Build location string
-    location = search.location or ""
-    if search.city and search.country:
-        location = f"{search.city}, {search.country}"
-    elif search.country:
-        location = search.country
-    elif search.city:
-        location = search.city
+    # Search cards carry no description; fetch detail pages without holding the response
+    enrich_ids = result["new_job_ids"] if search.enrich_details else []
+    job_enricher.submit(current_user.id, enrich_ids)
 
-    # Search LinkedIn
-    if "linkedin" in search.sources:
-        try:
-            async with linkedin_scraper as scraper:
-                jobs = await scraper.search_jobs_advanced(
-                    keywords=search.keywords,
-                    location=location,
-                    country=search.country,
-                    city=search.city,
-                    job_type=search.job_type.value,
-                    work_mode=search.work_mode.value,
-                    experience_level=search.experience_level.value,
-                    posted_within=search.posted_within.value,
-                    visa_sponsorship=search.visa_sponsorship,
-                    limit=search.limit,
-                )
-                all_jobs.extend(jobs)
-        except Exception as e:
-            print(f"LinkedIn search error: {e}")
+    return {**result, "enrichment_scheduled": len(enrich_ids)}
 
-    # Search Indeed
-    if "indeed" in search.sources:
-        try:
-            jobs = await indeed_scraper.search_jobs_advanced(
-                keywords=search.keywords,
-                location=location,
-                country=search.country,
-                city=search.city,
-                job_type=search.job_type.value,
-                work_mode=search.work_mode.value,
-                experience_level=search.experience_level.value,
-                posted_within=search.posted_within.value,
-                visa_sponsorship=search.visa_sponsorship,
-                limit=search.limit,
-            )
-            all_jobs.extend(jobs)
-        except Exception as e:
-            print(f"Indeed search error: {e}")
 
-    # Save jobs to database
-    saved_jobs = []
-    for job_data in all_jobs:
-        # Check if job already exists (by URL)
-        if job_data.get("url"):
-            existing = await db.execute(
-                select(Job).where(
-                    Job.user_id == current_user.id,
-                    Job.source_url == job_data.get("url")
-                )
+@router.get("/search/tasks/{task_id}")
+async def get_search_task(
+    task_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """State of a queued search: queued, running, done (with `result`) or failed (with `error`)."""
+    task = await scrape_queue.get(task_id)
+    if task is None or task["user_id"] != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return task
+
+
+def _split_free_sources(search: FreeSourceSearch) -> tuple[dict, list[str]]:
+    """Split requested sources into store-served results and the names to search live."""
+    stored = {}
+    live = []
+    for source_name in search.sources:
+        if source_name not in FREE_SOURCES:
+            continue
+        if not search.fresh and posting_store.has(source_name):
+            stored[source_name] = posting_store.search(
+                source_name, search.keywords, limit=search.limit_per_source, match_all=search.match_all
             )
-            if existing.scalar_one_or_none():
-                continue
-
-        job = Job(
-            user_id=current_user.id,
-            title=job_data.get("title", ""),
-            company_name=job_data.get("company", ""),
-            location=job_data.get("location", ""),
-            source=JobSource(job_data.get("source", "manual")) if job_data.get("source") in ["linkedin", "indeed"] else JobSource.MANUAL,
-            source_url=job_data.get("url", ""),
-            source_job_id=job_data.get("source_job_id", ""),
-        )
-        db.add(job)
-        saved_jobs.append({
-            **job_data,
-            "saved": True
-        })
+        else:
+            live.append(source_name)
+    return stored, live
 
-    await db.commit()
 
+def _live_searches(search: FreeSourceSearch, source_names: list[str]) -> dict:
+    """Search coroutines for `source_names`; create them only right before awaiting them."""
     return {
-        "message": f"Found {len(all_jobs)} jobs, saved {len(saved_jobs)} new jobs",
-        "search_criteria": {
-            "keywords": search.keywords,
-            "location": location,
-            "work_mode": search.work_mode.value,
-            "posted_within": search.posted_within.value,
-            "visa_sponsorship": search.visa_sponsorship,
-        },
-        "total_found": len(all_jobs),
-        "new_saved": len(saved_jobs),
-        "jobs": all_jobs,
+        source_name: FREE_SOURCES[source_name].search_jobs(
+            search.keywords, limit=search.limit_per_source, match_all=search.match_all
+        )
+        for source_name in source_names
     }
 
 
-# Schema for free sources search
-class FreeSourceSearch(BaseModel):
-    keywords: str
-    sources: list[str] = ["remotive", "remoteok", "jobicy", "arbeitnow", "himalayas"]
-    limit_per_source: int = 10
-    save_to_db: bool = True
+async def _save_postings(db: AsyncSession, user_id: int, postings: list[JobPosting]) -> list[Job]:
+    """Save postings not already stored for this user. Returns the new rows."""
+    saved = await insert_new_postings(db, user_id, postings)
+    await db.commit()
+    return saved
 
 
 @router.post("/search/free")
@@ -210,81 +162,138 @@ async def search_free_sources(
         "limit_per_source": 10
     }
     ```
+
+    Results come from the local posting store (refreshed in the background)
+    unless `fresh` is true or a source has not been ingested yet.
+
+    Live sources still running at `deadline_ms` are cancelled; `source_status`
+    reports ok / timeout / error and elapsed ms for each source.
+
+    With `dedupe`, near-duplicate postings across sources are merged and each
+    result lists the other boards carrying it under `alternates`.
     """
-    import asyncio
+    stored, live = _split_free_sources(search)
 
     all_jobs = []
+    served_from = {}
+    source_status = {}
+    for source_name, jobs in stored.items():
+        all_jobs.extend(jobs)
+        served_from[source_name] = "store"
+        source_status[source_name] = {"status": "ok", "elapsed_ms": 0, "count": len(jobs)}
 
-    # Create tasks for selected sources
-    tasks = []
-    source_names = []
-
-    for source_name in search.sources:
-        if source_name in FREE_SOURCES:
-            api = FREE_SOURCES[source_name]
-            tasks.append(api.search_jobs(search.keywords, limit=search.limit_per_source))
-            source_names.append(source_name)
+    # Run all live searches in parallel, bounded by the request deadline
+    if live:
+        results = await fan_out(
+            _live_searches(search, live), search.deadline_ms or settings.FREE_SEARCH_DEADLINE_MS
+        )
 
-    # Run all searches in parallel
-    if tasks:
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for source_name, result in results.items():
+            served_from[source_name] = "live"
+            source_status[source_name] = result.status_entry()
+            all_jobs.extend(result.jobs)
 
-        for i, result in enumerate(results):
-            if isinstance(result, list):
-                all_jobs.extend(result)
-            else:
-                print(f"{source_names[i]} error: {result}")
+    found_count = len(all_jobs)
+    if search.dedupe:
+        all_jobs = collapse_duplicates(all_jobs)
 
     # Save to database if requested
     saved_count = 0
     if search.save_to_db:
-        for job_data in all_jobs:
-            # Check if job already exists
-            if job_data.get("url"):
-                existing = await db.execute(
-                    select(Job).where(
-                        Job.user_id == current_user.id,
-                        Job.source_url == job_data.get("url")
-                    )
-                )
-                if existing.scalar_one_or_none():
-                    continue
-
-            # Get source enum value
-            source_name = job_data.get("source", "manual").upper()
-            try:
-                job_source = JobSource[source_name]
-            except KeyError:
-                job_source = JobSource.MANUAL
-
-            job = Job(
-                user_id=current_user.id,
-                title=job_data.get("title", ""),
-                company_name=job_data.get("company", ""),
-                location=job_data.get("location", "Remote"),
-                description=job_data.get("description", ""),
-                salary_range=job_data.get("salary_range", ""),
-                job_type=job_data.get("job_type", ""),
-                is_remote=job_data.get("is_remote", True),
-                required_skills=job_data.get("tags", []),
-                source=job_source,
-                source_url=job_data.get("url", ""),
-                source_job_id=job_data.get("source_job_id", ""),
-            )
-            db.add(job)
-            saved_count += 1
-
-        await db.commit()
+        saved_count = len(await _save_postings(db, current_user.id, all_jobs))
 
     return {
         "message": f"Found {len(all_jobs)} jobs from {len(search.sources)} free sources",
         "sources_searched": search.sources,
+        "served_from": served_from,
+        "source_status": source_status,
         "total_found": len(all_jobs),
+        "duplicates_collapsed": found_count - len(all_jobs),
         "new_saved": saved_count,
-        "jobs": all_jobs,
+        "jobs": [posting.to_dict() for posting in all_jobs],
     }
 
 
+def _format_stream_record(record: dict, stream_format: str) -> str:
+    data = json.dumps(record, default=str)
+    if stream_format == "sse":
+        return f"event: {record['type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+@router.post("/search/free/stream")
+async def stream_free_sources(
+    search: FreeSourceSearch,
+    stream_format: Literal["ndjson", "sse"] = Query("ndjson", alias="format"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Streaming variant of /search/free.
+
+    Emits one record per source as soon as that source finishes, then a final
+    summary record, as NDJSON (default) or server-sent events (`?format=sse`):
+
+    ```
+    {"type": "source", "source": "remotive", "served_from": "live", "status": "ok", "elapsed_ms": 412, ...}
+    {"type": "summary", "total_found": 42, "new_saved": 17, "source_status": {...}}
+    ```
+    """
+    user_id = current_user.id
+
+    async def records():
+        # Nothing is started until the stream is read: a client gone before then
+        # leaves no source coroutines behind unawaited
+        stored, live = _split_free_sources(search)
+        total_found = 0
+        new_saved = 0
+        served_from = {}
+        source_status = {}
+
+        # The request-scoped session is closed before streaming starts; use our own
+        async with async_session() as db:
+            async def source_record(
+                source_name: str, origin: str, jobs: list[JobPosting], status_entry: dict
+            ) -> dict:
+                nonlocal total_found, new_saved
+                saved = len(await _save_postings(db, user_id, jobs)) if search.save_to_db and jobs else 0
+                total_found += len(jobs)
+                new_saved += saved
+                served_from[source_name] = origin
+                source_status[source_name] = status_entry
+                return {
+                    "type": "source",
+                    "source": source_name,
+                    "served_from": origin,
+                    **status_entry,
+                    "jobs": [posting.to_dict() for posting in jobs],
+                    "new_saved": saved,
+                }
+
+            for source_name, jobs in stored.items():
+                status_entry = {"status": "ok", "elapsed_ms": 0, "count": len(jobs)}
+                yield _format_stream_record(
+                    await source_record(source_name, "store", jobs, status_entry), stream_format
+                )
+
+            # iter_fan_out cancels outstanding fetches at the deadline or if the client goes away
+            deadline_ms = search.deadline_ms or settings.FREE_SEARCH_DEADLINE_MS
+            async for result in iter_fan_out(_live_searches(search, live), deadline_ms):
+                record = await source_record(result.source, "live", result.jobs, result.status_entry())
+                yield _format_stream_record(record, stream_format)
+
+        yield _format_stream_record({
+            "type": "summary",
+            "sources_searched": search.sources,
+            "served_from": served_from,
+            "source_status": source_status,
+            "total_found": total_found,
+            "new_saved": new_saved,
+        }, stream_format)
+
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(records(), media_type=media_type)
+
+
 @router.get("/sources/free")
 async def list_free_sources():
     """List all available free job sources - 8 popular boards."""
@@ -346,8 +355,25 @@ async def list_free_sources():
                 "description": "Developer jobs API",
                 "job_types": ["Remote", "On-site"],
             },
-        ]
+        ],
+        "store": posting_store.status(),
+    }
+
+
+@router.get("/sources/health")
+async def sources_health():
+    """Circuit breaker state, error rate and latency for every job source."""
+    source_names = ["linkedin", "indeed", *FREE_SOURCES]
+    health = {
+        "sources": {name: get_breaker(name).snapshot() for name in source_names},
+        "browser_pool": browser_pool.status(),
+        "rate_limiter": rate_limiter.status(),
+        "enricher": job_enricher.status(),
+        "saved_searches": saved_search_runner.status(),
     }
+    if settings.SCRAPE_QUEUE_ENABLED:
+        health["scrape_queue"] = await scrape_queue.status()
+    return health
 
 
 @router.post("/import-url")
@@ -359,40 +385,35 @@ async def import_job_from_url(
     """Import job directly from URL - scrape and parse automatically."""
 
     source = detect_source(data.url)
-    job_details = {}
+    job_details = None
 
     # Scrape based on source
     if source == "linkedin":
-        async with linkedin_scraper as scraper:
-            job_details = await scraper.get_job_details(data.url)
+        job_details = await linkedin_scraper.get_job_details(data.url)
     elif source == "indeed":
         job_details = await indeed_scraper.get_job_details(data.url)
-    else:
-        job_details = {"url": data.url, "source": source}
 
-    if not job_details.get("title"):
+    if not job_details or not job_details.title:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Could not extract job details from URL. Try manual entry.",
         )
 
     # Parse with AI for better structure
-    if job_details.get("description"):
-        parsed = await ai_service.parse_job_description(job_details["description"])
-        job_details["required_skills"] = parsed.get("required_skills", [])
-        job_details["ai_summary"] = parsed.get("summary", "")
+    required_skills = []
+    ai_summary = ""
+    if job_details.description:
+        parsed = await ai_service.parse_job_description(job_details.description)
+        required_skills = parsed.get("required_skills", [])
+        ai_summary = parsed.get("summary", "")
 
     # Create job record
-    job = Job(
-        user_id=current_user.id,
-        title=job_details.get("title", "Unknown Position"),
-        company_name=job_details.get("company", "Unknown Company"),
+    job = job_details.to_job(
+        current_user.id,
+        company_name=job_details.company or "Unknown Company",
         company_email=data.company_email,
-        location=job_details.get("location", ""),
-        description=job_details.get("description", ""),
-        required_skills=job_details.get("required_skills", []),
-        ai_summary=job_details.get("ai_summary", ""),
-        source=JobSource(source) if source in ["linkedin", "indeed"] else JobSource.MANUAL,
+        required_skills=required_skills,
+        ai_summary=ai_summary,
         source_url=data.url,
     )
 
@@ -419,12 +440,31 @@ async def import_job_from_url(
             "match_score": job.match_score,
             "required_skills": job.required_skills,
             "ai_summary": job.ai_summary,
-            "is_remote": job_details.get("is_remote", False),
-            "has_sponsorship": job_details.get("has_sponsorship", False),
+            "is_remote": job_details.is_remote,
+            "has_sponsorship": job_details.has_sponsorship,
         },
     }
 
 
+@router.post("/enrich")
+async def enrich_jobs(
+    data: JobEnrichRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Fetch full details (description, salary, job type) for saved LinkedIn and
+    Indeed jobs, concurrently and bounded by MAX_CONCURRENT_SCRAPES overall
+    and MAX_CONCURRENT_SCRAPES_PER_HOST per site. Each job row is updated as
+    soon as its details arrive. Unless `force`, jobs that already have a
+    description are skipped.
+    """
+    result = await job_enricher.enrich(current_user.id, data.job_ids, force=data.force)
+    return {
+        "message": f"Enriched {result['enriched']} of {result['fetched']} jobs",
+        **result,
+    }
+
+
 @router.post("/search")
 async def search_jobs(
     search: JobSearch,
@@ -437,13 +477,12 @@ async def search_jobs(
     all_jobs = []
 
     if "linkedin" in search.sources:
-        async with linkedin_scraper as scraper:
-            jobs = await scraper.search_jobs(
-                query=search.query,
-                location=search.location,
-                limit=search.limit,
-            )
-            all_jobs.extend(jobs)
+        jobs = await linkedin_scraper.search_jobs(
+            query=search.query,
+            location=search.location,
+            limit=search.limit,
+        )
+        all_jobs.extend(jobs)
 
     if "indeed" in search.sources:
         jobs = await indeed_scraper.search_jobs(
@@ -455,16 +494,8 @@ async def search_jobs(
 
     # Save jobs to database
     saved_jobs = []
-    for job_data in all_jobs:
-        job = Job(
-            user_id=current_user.id,
-            title=job_data.get("title", ""),
-            company_name=job_data.get("company", ""),
-            location=job_data.get("location", ""),
-            source=JobSource(job_data.get("source", "manual")),
-            source_url=job_data.get("url", ""),
-            source_job_id=job_data.get("source_job_id", ""),
-        )
+    for posting in all_jobs:
+        job = posting.to_job(current_user.id)
         db.add(job)
         saved_jobs.append(job)
 
@@ -0,0 +1,246 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete
+from pydantic import ValidationError
+from typing import Optional
+from datetime import datetime, timezone
+from app.models import User, Job, SavedSearch, SavedSearchHit, SavedSearchKind, get_db
+from app.api.v1.schemas import (
+    AdvancedJobSearch, FreeSourceSearch, JobResponse,
+    SavedSearchCreate, SavedSearchUpdate, SavedSearchResponse,
+)
+from app.core.security import get_current_user
+from app.core.config import settings
+from app.services import saved_search_runner
+from app.workers.queue import scrape_queue
+
+router = APIRouter(prefix="/saved-searches", tags=["Saved Searches"])
+
+QUERY_SCHEMAS = {
+    SavedSearchKind.ADVANCED: AdvancedJobSearch,
+    SavedSearchKind.FREE: FreeSourceSearch,
+}
+
+
+def _validate_query(kind: SavedSearchKind, query: dict) -> dict:
+    """Validate a stored query against its search schema, with defaults filled in."""
+    try:
+        return QUERY_SCHEMAS[kind](**query).model_dump(mode="json")
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.errors())
+
+
+async def _get_saved_search(db: AsyncSession, search_id: int, user_id: int) -> SavedSearch:
+    result = await db.execute(
+        select(SavedSearch).where(SavedSearch.id == search_id, SavedSearch.user_id == user_id)
+    )
+    search = result.scalar_one_or_none()
+    if not search:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved search not found")
+    return search
+
+
+async def _feed(
+    db: AsyncSession,
+    user_id: int,
+    search_id: Optional[int],
+    after: Optional[int],
+    before: Optional[int],
+    limit: int,
+) -> dict:
+    query = (
+        select(SavedSearchHit, Job)
+        .join(Job, Job.id == SavedSearchHit.job_id)
+        .where(SavedSearchHit.user_id == user_id)
+    )
+    if search_id is not None:
+        query = query.where(SavedSearchHit.saved_search_id == search_id)
+    if before is not None:
+        query = query.where(SavedSearchHit.id < before)
+    if after is not None:
+        # Oldest first, so a backlog larger than `limit` drains over several polls
+        query = query.where(SavedSearchHit.id > after).order_by(SavedSearchHit.id)
+    else:
+        query = query.order_by(SavedSearchHit.id.desc())
+    rows = (await db.execute(query.limit(limit))).all()
+    ids = [hit.id for hit, _ in rows]
+
+    return {
+        "jobs": [
+            {
+                "saved_search_id": hit.saved_search_id,
+                "found_at": hit.created_at,
+                "job": JobResponse.model_validate(job),
+            }
+            for hit, job in rows
+        ],
+        # Pass back as `after` to get the jobs found after this page
+        "cursor": max(ids) if ids else after,
+        # Pass back as `before` to page back through older jobs
+        "before": min(ids) if ids else before,
+        "has_more": len(rows) == limit,
+    }
+
+
+@router.post("/", response_model=SavedSearchResponse)
+async def create_saved_search(
+    data: SavedSearchCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Save an advanced (LinkedIn/Indeed) or free-board search to rerun on a schedule.
+
+    `query` is the body you would send to /jobs/search/advanced or
+    /jobs/search/free. The first run (on the next poll) records everything it
+    finds; later runs only store jobs posted since.
+
+    Example:
+    ```json
+    {
+        "name": "Remote Python",
+        "kind": "free",
+        "query": {"keywords": "python", "sources": ["remotive", "remoteok"]},
+        "interval_minutes": 60
+    }
+    ```
+    """
+    kind = SavedSearchKind(data.kind)
+    search = SavedSearch(
+        user_id=current_user.id,
+        name=data.name,
+        kind=kind,
+        query=_validate_query(kind, data.query),
+        interval_minutes=data.interval_minutes,
+        next_run_at=datetime.now(timezone.utc),
+        high_water_marks={},
+        last_new_count=0,
+        is_active=True,
+    )
+    db.add(search)
+    await db.commit()
+    await db.refresh(search)
+    return search
+
+
+@router.get("/", response_model=list[SavedSearchResponse])
+async def list_saved_searches(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """List the current user's saved searches."""
+    result = await db.execute(
+        select(SavedSearch).where(SavedSearch.user_id == current_user.id).order_by(SavedSearch.id)
+    )
+    return result.scalars().all()
+
+
+@router.get("/feed")
+async def new_jobs_feed(
+    after: Optional[int] = Query(None, description="`cursor` from a previous response: jobs found since, oldest first"),
+    before: Optional[int] = Query(None, description="`before` from a previous response: older jobs, newest first"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """New jobs found by any of the user's saved searches, newest first.
+
+    Poll with `after` to receive every job found since, oldest first, while
+    `has_more` is true; page back through history with `before`.
+    """
+    return await _feed(db, current_user.id, None, after, before, limit)
+
+
+@router.get("/{search_id}", response_model=SavedSearchResponse)
+async def get_saved_search(
+    search_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get a saved search."""
+    return await _get_saved_search(db, search_id, current_user.id)
+
+
+@router.patch("/{search_id}", response_model=SavedSearchResponse)
+async def update_saved_search(
+    search_id: int,
+    data: SavedSearchUpdate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Rename, reschedule, pause or change the query of a saved search.
+
+    Changing the query resets the high-water marks, so the next run starts over.
+    """
+    search = await _get_saved_search(db, search_id, current_user.id)
+    update_data = data.model_dump(exclude_unset=True)
+
+    if "query" in update_data:
+        search.query = _validate_query(search.kind, update_data.pop("query"))
+        search.high_water_marks = {}
+        search.next_run_at = datetime.now(timezone.utc)
+    for field, value in update_data.items():
+        setattr(search, field, value)
+
+    await db.commit()
+    await db.refresh(search)
+    return search
+
+
+@router.delete("/{search_id}")
+async def delete_saved_search(
+    search_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete a saved search. Jobs it found stay in the job list."""
+    search = await _get_saved_search(db, search_id, current_user.id)
+    await db.execute(delete(SavedSearchHit).where(SavedSearchHit.saved_search_id == search.id))
+    await db.delete(search)
+    await db.commit()
+    return {"message": "Saved search deleted"}
+
+
+@router.post("/{search_id}/run")
+async def run_saved_search(
+    search_id: int,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Run a saved search now; only jobs past its high-water marks are saved.
+
+    With SCRAPE_QUEUE_ENABLED it runs on a scrape worker: this returns 202 with
+    a `task_id` to poll at /jobs/search/tasks/{task_id}.
+    """
+    await _get_saved_search(db, search_id, current_user.id)
+    if settings.SCRAPE_QUEUE_ENABLED:
+        task_id = await scrape_queue.enqueue("saved_search", current_user.id, {"saved_search_id": search_id})
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {
+            "message": "Run queued",
+            "task_id": task_id,
+            "status": "queued",
+            "status_url": f"{settings.API_V1_PREFIX}/jobs/search/tasks/{task_id}",
+        }
+    result = await saved_search_runner.run(search_id)
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved search not found")
+    return {
+        "message": f"{result['new_saved']} new jobs",
+        **result,
+    }
+
+
+@router.get("/{search_id}/jobs")
+async def saved_search_jobs(
+    search_id: int,
+    after: Optional[int] = Query(None, description="`cursor` from a previous response: jobs found since, oldest first"),
+    before: Optional[int] = Query(None, description="`before` from a previous response: older jobs, newest first"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """New jobs found by one saved search; paged like /saved-searches/feed."""
+    await _get_saved_search(db, search_id, current_user.id)
+    return await _feed(db, current_user.id, search_id, after, before, limit)
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, Literal
 from datetime import datetime
 from enum import Enum
+from app.core.config import settings
 
 
 # Enums for filters
@@ -98,6 +99,22 @@ class AdvancedJobSearch(BaseModel):
     # Pagination
     limit: int = 20
 
+    # Fetch each new job's detail page (description, salary) in the background
+    enrich_details: bool = False
+
+
+class FreeSourceSearch(BaseModel):
+    """Search across the free job boards"""
+    keywords: str
+    sources: list[str] = ["remotive", "remoteok", "jobicy", "arbeitnow", "himalayas"]
+    limit_per_source: int = 10
+    save_to_db: bool = True
+    match_all: bool = False  # Require every keyword instead of any
+    fresh: bool = False  # Skip the local posting store and fetch live from every source
+    # Return partial results after this; defaults to FREE_SEARCH_DEADLINE_MS, which is also the ceiling
+    deadline_ms: Optional[int] = Field(None, ge=100, le=settings.FREE_SEARCH_DEADLINE_MS)
+    dedupe: bool = True  # Collapse the same job posted on several boards into one result
+
 
 class JobSearch(BaseModel):
     query: str
@@ -106,6 +123,11 @@ class JobSearch(BaseModel):
     limit: int = 10
 
 
+class JobEnrichRequest(BaseModel):
+    job_ids: list[int]
+    force: bool = False  # Also refetch jobs that already have a description
+
+
 class JobCreate(BaseModel):
     title: str
     company_name: str
@@ -138,6 +160,37 @@ class JobResponse(BaseModel):
         from_attributes = True
 
 
+# Saved Search Schemas
+class SavedSearchCreate(BaseModel):
+    name: str
+    kind: Literal["advanced", "free"]
+    query: dict  # An AdvancedJobSearch or FreeSourceSearch body, per `kind`
+    interval_minutes: int = Field(60, ge=5)
+
+
+class SavedSearchUpdate(BaseModel):
+    name: Optional[str] = None
+    query: Optional[dict] = None
+    interval_minutes: Optional[int] = Field(None, ge=5)
+    is_active: Optional[bool] = None
+
+
+class SavedSearchResponse(BaseModel):
+    id: int
+    name: str
+    kind: str
+    query: dict
+    is_active: bool
+    interval_minutes: int
+    next_run_at: Optional[datetime]
+    last_run_at: Optional[datetime]
+    last_new_count: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 # Email Schemas
 class EmailGenerate(BaseModel):
     job_id: int
@@ -28,8 +28,106 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
     # Scraping
-    SCRAPE_DELAY_SECONDS: int = 2
-    MAX_CONCURRENT_SCRAPES: int = 3
+    SCRAPE_DELAY_SECONDS: float = 2  # Steady-state spacing per scraped host (0 = unlimited)
+    MAX_CONCURRENT_SCRAPES: int = 3  # Detail-page fetches in flight when enriching search results
+    MAX_CONCURRENT_SCRAPES_PER_HOST: int = 2
+
+    # Per-host token buckets in front of every outbound request
+    RATE_LIMIT_DEFAULT_RATE: float = 5.0  # Requests per second per API host (0 = unlimited)
+    RATE_LIMIT_DEFAULT_BURST: int = 10
+    # Scraped sites (and subdomains) get 1 request per SCRAPE_DELAY_SECONDS instead
+    RATE_LIMIT_SCRAPED_DOMAINS: list[str] = ["linkedin.com", "indeed.com", "indeed.co.in", "indeed.ae"]
+    RATE_LIMIT_SCRAPED_BURST: int = 3  # Requests an idle scraped host serves without waiting
+    RATE_LIMIT_REDIS_ENABLED: bool = False  # Share buckets between workers via REDIS_URL
+
+    # Browser pool (Playwright scrapers)
+    BROWSER_POOL_SIZE: int = 2  # Browsers launched at startup = max concurrent browser scrapes
+    BROWSER_RECYCLE_AFTER_PAGES: int = 50
+    BROWSER_LEASE_TIMEOUT_SECONDS: float = 30.0  # Wait for a free browser before failing
+    BROWSER_BLOCK_RESOURCES: bool = True  # Abort images/fonts/CSS/media and off-allowlist domains
+
+    # HTML parsing backend for Indeed/LinkedIn: lxml, selectolax or bs4
+    HTML_PARSER_BACKEND: str = "selectolax"
+    # Worker processes for HTML/RSS parsing (0 = parse on the event loop)
+    PARSE_WORKERS: int = 2
+    PARSE_INLINE_MAX_BYTES: int = 32 * 1024  # Smaller documents are parsed inline
+
+    # Event-loop lag sampling (reported on /health)
+    LOOP_LAG_INTERVAL_MS: int = 100
+    LOOP_LAG_WARN_MS: int = 250
+
+    # Raw page archive for offline re-parsing (python -m app.scrapers.reparse)
+    PAGE_ARCHIVE_ENABLED: bool = False
+    PAGE_ARCHIVE_DIR: str = "data/page_archive"
+    PAGE_ARCHIVE_MAX_BYTES: int = 512 * 1024 * 1024  # Compressed; least recently seen pages evicted past this
+    PAGE_ARCHIVE_ZSTD_LEVEL: int = 6
+
+    # LinkedIn search: http = guest listing endpoint via httpx (browser as fallback), browser = Playwright only
+    LINKEDIN_FETCH_MODE: str = "http"
+
+    # LinkedIn page waits (upper bounds; waits end as soon as content appears)
+    LINKEDIN_PAGE_TIMEOUT_MS: int = 15000  # First job cards / job details
+    LINKEDIN_SCROLL_TIMEOUT_MS: int = 4000  # New cards after a scroll, else end of results
+    LINKEDIN_MAX_SCROLLS: int = 10
+    # xhr: parse the results list and the card fragments fetched while scrolling;
+    # dom: serialize and parse the whole rendered page
+    LINKEDIN_PARSE_MODE: str = "xhr"
+
+    # HTTP client (shared by all httpx-based sources)
+    HTTP2_ENABLED: bool = True
+    HTTP_TIMEOUT_SECONDS: float = 30.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 40
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+
+    # Feed cache (sources that always return their full feed)
+    FEED_CACHE_DEFAULT_TTL: int = 0  # Seconds, 0 = no caching
+    FEED_CACHE_TTLS: dict[str, int] = {
+        "remoteok": 300,
+        "weworkremotely": 300,
+        "arbeitnow": 300,
+        "nodesk": 600,
+    }
+    FEED_CACHE_MAX_ENTRIES: int = 64
+    FEED_CACHE_REDIS_ENABLED: bool = False
+    FEED_CACHE_REDIS_RETENTION_SECONDS: int = 60 * 60 * 24
+
+    # Free-source fan-out: request deadline and optional per-source budgets
+    FREE_SEARCH_DEADLINE_MS: int = 10000
+    SOURCE_LATENCY_BUDGETS_MS: dict[str, int] = {}
+
+    # Paginated sources: follow-up pages fetched concurrently
+    PAGINATION_MAX_PAGES: int = 5
+    PAGINATION_CONCURRENCY: int = 4
+
+    # Per-source circuit breakers
+    BREAKER_FAILURE_THRESHOLD: int = 5  # Consecutive failures before opening
+    BREAKER_ERROR_RATE_THRESHOLD: float = 0.5  # Or this error rate over a full window
+    BREAKER_WINDOW_SIZE: int = 20
+    BREAKER_COOLDOWN_SECONDS: float = 60.0  # Open time before a half-open probe
+
+    # Background ingestion of free sources into the local posting store
+    INGEST_ENABLED: bool = True
+    INGEST_INTERVAL_SECONDS: int = 600
+    INGEST_LIMIT_PER_SOURCE: int = 200
+    INGEST_MAX_AGE_SECONDS: int = 60 * 60  # Older snapshots fall back to live fetches
+
+    # Saved searches: scheduled reruns that store only postings past each source's high-water mark
+    SAVED_SEARCH_ENABLED: bool = True
+    SAVED_SEARCH_POLL_SECONDS: int = 60  # How often due searches are looked for
+    SAVED_SEARCH_BATCH_SIZE: int = 20  # Due searches picked up per poll
+    SAVED_SEARCH_MAX_CONCURRENT: int = 2
+    SAVED_SEARCH_SEEN_KEYS: int = 500  # Posting keys remembered per source for undated/same-day postings
+
+    # Scrape queue: API enqueues searches, python -m app.workers.scrape runs them (needs REDIS_URL)
+    SCRAPE_QUEUE_ENABLED: bool = False
+    SCRAPE_QUEUE_PREFIX: str = "scrape"
+    SCRAPE_WORKER_CONCURRENCY: int = 2  # Tasks each worker process runs at once
+    SCRAPE_TASK_TIMEOUT_SECONDS: int = 600
+    SCRAPE_TASK_LEASE_SECONDS: int = 60  # Running tasks without a heartbeat this long are requeued
+    SCRAPE_TASK_MAX_ATTEMPTS: int = 3
+    SCRAPE_TASK_RESULT_TTL_SECONDS: int = 60 * 60 * 24
 
     class Config:
         env_file = ".env"
@@ -4,6 +4,15 @@ from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.api.v1 import api_router
 from app.models import engine, Base
+from app.scrapers import create_http_client, bind_http_client
+from app.scrapers.feed_cache import feed_cache
+from app.scrapers.browser_pool import browser_pool
+from app.scrapers.parse_executor import parse_executor
+from app.scrapers.rate_limiter import rate_limiter
+from app.scrapers.page_archive import page_archive
+from app.utils.loop_monitor import loop_monitor
+from app.services import job_ingester, job_enricher, saved_search_runner
+from app.workers.queue import scrape_queue
 
 
 @asynccontextmanager
@@ -11,8 +20,35 @@ async def lifespan(app: FastAPI):
     # Startup: Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Startup: Shared pooled HTTP client for all job sources
+    http_client = create_http_client()
+    bind_http_client(http_client)
+    # Startup: Launch browsers once for LinkedIn scraping (in http mode they start on first fallback)
+    if settings.LINKEDIN_FETCH_MODE == "browser":
+        await browser_pool.start()
+    # Startup: Parse workers for HTML/RSS documents, and loop lag sampling
+    parse_executor.start()
+    loop_monitor.start()
+    # Startup: Keep the local posting store warm
+    if settings.INGEST_ENABLED:
+        job_ingester.start()
+    # Startup: Rerun due saved searches in the background
+    if settings.SAVED_SEARCH_ENABLED:
+        saved_search_runner.start()
     yield
     # Shutdown: Close connections
+    await saved_search_runner.stop()
+    await job_ingester.stop()
+    await job_enricher.stop()
+    bind_http_client(None)
+    await http_client.aclose()
+    await browser_pool.close()
+    parse_executor.close()
+    await loop_monitor.stop()
+    await feed_cache.close()
+    await rate_limiter.close()
+    await page_archive.close()
+    await scrape_queue.close()
     await engine.dispose()
 
 
@@ -47,4 +83,8 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "event_loop_lag": loop_monitor.snapshot(),
+        "parse_executor": parse_executor.status(),
+    }
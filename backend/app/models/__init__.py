@@ -2,6 +2,7 @@ from app.models.base import Base, get_db, engine, async_session
 from app.models.user import User
 from app.models.job import Job, JobSource, JobStatus
 from app.models.email import Email, EmailStatus, EmailType
+from app.models.saved_search import SavedSearch, SavedSearchHit, SavedSearchKind
 
 __all__ = [
     "Base",
@@ -15,4 +16,7 @@ __all__ = [
     "Email",
     "EmailStatus",
     "EmailType",
+    "SavedSearch",
+    "SavedSearchHit",
+    "SavedSearchKind",
 ]
@@ -0,0 +1,47 @@
+from sqlalchemy import Column, Integer, String, JSON, Enum, ForeignKey, DateTime, Boolean
+from sqlalchemy.orm import relationship
+import enum
+from app.models.base import Base
+
+
+class SavedSearchKind(str, enum.Enum):
+    ADVANCED = "advanced"  # AdvancedJobSearch: LinkedIn / Indeed
+    FREE = "free"  # FreeSourceSearch: the free job boards
+
+
+class SavedSearch(Base):
+    __tablename__ = "saved_searches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+
+    name = Column(String(255), nullable=False)
+    kind = Column(Enum(SavedSearchKind), nullable=False)
+    query = Column(JSON, nullable=False)  # The validated search request body
+
+    # Schedule
+    is_active = Column(Boolean, default=True)
+    interval_minutes = Column(Integer, default=60)
+    next_run_at = Column(DateTime(timezone=True), index=True)
+    last_run_at = Column(DateTime(timezone=True))
+    last_new_count = Column(Integer, default=0)
+
+    # Per source: {"posted_at": epoch seconds or null, "seen": [recent posting keys]}
+    high_water_marks = Column(JSON, default=dict)
+
+    # Relationships
+    user = relationship("User", backref="saved_searches")
+
+
+class SavedSearchHit(Base):
+    """A job first found by a saved search run - the "new jobs" feed."""
+
+    __tablename__ = "saved_search_hits"
+
+    id = Column(Integer, primary_key=True, index=True)
+    saved_search_id = Column(Integer, ForeignKey("saved_searches.id", ondelete="CASCADE"), index=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+
+    # Relationships
+    job = relationship("Job")
@@ -1,4 +1,5 @@
 from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.http_client import create_http_client
 from app.scrapers.linkedin_scraper import LinkedInScraper, linkedin_scraper
 from app.scrapers.indeed_scraper import IndeedScraper, indeed_scraper
 from app.scrapers.free_job_apis import (
@@ -10,11 +11,36 @@ from app.scrapers.free_job_apis import (
     himalayas_api,
     nodesk_api,
     findwork_api,
+    FREE_SOURCES,
     search_all_free_sources,
 )
 
+# Every source that talks HTTP through the shared pooled client
+HTTP_SOURCES = (
+    linkedin_scraper,
+    indeed_scraper,
+    remotive_api,
+    remoteok_api,
+    weworkremotely_api,
+    arbeitnow_api,
+    jobicy_api,
+    himalayas_api,
+    nodesk_api,
+    findwork_api,
+)
+
+
+def bind_http_client(client) -> None:
+    """Inject the shared HTTP client into every httpx-based source."""
+    for source in HTTP_SOURCES:
+        source.bind_client(client)
+
+
 __all__ = [
     "BaseScraper",
+    "create_http_client",
+    "bind_http_client",
+    "HTTP_SOURCES",
     "LinkedInScraper",
     "linkedin_scraper",
     "IndeedScraper",
@@ -28,5 +54,6 @@ __all__ = [
     "himalayas_api",
     "nodesk_api",
     "findwork_api",
+    "FREE_SOURCES",
     "search_all_free_sources",
 ]
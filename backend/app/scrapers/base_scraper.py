@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from playwright.async_api import async_playwright, Browser, Page
+from contextlib import asynccontextmanager
+from playwright.async_api import Page, Route
 from app.core.config import settings
-from typing import Optional
-import asyncio
+from app.scrapers.browser_pool import BrowserPool, browser_pool
+from app.scrapers.posting import JobPosting
+from app.scrapers.rate_limiter import HostRateLimiter, rate_limiter
+from typing import AsyncIterator, Optional
+from urllib.parse import urlsplit
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,38 +15,66 @@ logger = logging.getLogger(__name__)
 class BaseScraper(ABC):
     """Base class for all job scrapers."""
 
-    def __init__(self):
-        self.browser: Optional[Browser] = None
-        self.delay = settings.SCRAPE_DELAY_SECONDS
+    # Request interception: only these resource types from these domains (and
+    # their subdomains) are loaded. Images, fonts, stylesheets, media and
+    # third-party trackers are aborted since only the HTML is read afterwards.
+    # An empty ALLOWED_DOMAINS allows any domain.
+    ALLOWED_RESOURCE_TYPES: frozenset[str] = frozenset({"document", "script", "xhr", "fetch"})
+    ALLOWED_DOMAINS: tuple[str, ...] = ()
 
-    async def __aenter__(self):
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=True)
-        return self
+    def __init__(self, pool: BrowserPool = browser_pool, limiter: HostRateLimiter = rate_limiter):
+        self.pool = pool
+        self.limiter = limiter
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.browser:
-            await self.browser.close()
+    def allows_request(self, resource_type: str, url: str) -> bool:
+        if resource_type not in self.ALLOWED_RESOURCE_TYPES:
+            return False
+        if not self.ALLOWED_DOMAINS:
+            return True
+        host = urlsplit(url).hostname or ""
+        return any(host == domain or host.endswith("." + domain) for domain in self.ALLOWED_DOMAINS)
 
-    async def get_page(self) -> Page:
-        """Create new page with default settings."""
-        context = await self.browser.new_context(
+    @asynccontextmanager
+    async def get_page(self) -> AsyncIterator[Page]:
+        """Page in a fresh context leased from the browser pool; both are closed on exit."""
+        async with self.pool.context(
             user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            viewport={"width": 1920, "height": 1080},
-        )
-        return await context.new_page()
+            viewport={"width": 1280, "height": 800},
+            service_workers="block",
+        ) as context:
+            blocked = 0
 
-    async def rate_limit(self):
-        """Apply rate limiting between requests."""
-        await asyncio.sleep(self.delay)
+            async def intercept(route: Route) -> None:
+                nonlocal blocked
+                request = route.request
+                if self.allows_request(request.resource_type, request.url):
+                    await route.continue_()
+                else:
+                    blocked += 1
+                    await route.abort()
+
+            if settings.BROWSER_BLOCK_RESOURCES:
+                await context.route("**/*", intercept)
+            try:
+                yield await context.new_page()
+            finally:
+                logger.debug(f"{self.source_name} page blocked {blocked} requests")
+
+    async def rate_limit(self, url: str) -> None:
+        """Take a token from the URL host's bucket; call before navigating a page.
+
+        httpx requests are limited by the shared client's transport, so this
+        is only needed for navigations the browser makes itself.
+        """
+        await self.limiter.acquire(url)
 
     @abstractmethod
-    async def search_jobs(self, query: str, location: str = "", limit: int = 10) -> list[dict]:
+    async def search_jobs(self, query: str, location: str = "", limit: int = 10) -> list[JobPosting]:
         """Search for jobs. Must be implemented by subclasses."""
         pass
 
     @abstractmethod
-    async def get_job_details(self, job_url: str) -> dict:
+    async def get_job_details(self, job_url: str) -> Optional[JobPosting]:
         """Get detailed job information. Must be implemented by subclasses."""
         pass
 
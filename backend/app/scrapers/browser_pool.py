@@ -0,0 +1,145 @@
+"""
+Browser Pool - long-lived Chromium instances shared by browser scrapers
+
+Playwright and Chromium are started once (at app startup) instead of per
+request. Each lease gets a fresh, isolated browser context on one of
+`size` browsers, so concurrent requests never share cookies or pages and at
+most `size` scrapes drive a browser at once. A browser is relaunched in the
+background after it has served `recycle_after_pages` pages, which bounds
+Chromium's memory growth.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledBrowser:
+    def __init__(self, slot: int):
+        self.slot = slot
+        self.browser: Optional[Browser] = None
+        self.pages_served = 0
+
+    @property
+    def connected(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+
+class BrowserPool:
+    def __init__(self, size: int, recycle_after_pages: int, lease_timeout: float):
+        self.size = size
+        self.recycle_after_pages = recycle_after_pages
+        self.lease_timeout = lease_timeout
+        self._playwright: Optional[Playwright] = None
+        self._start_lock = asyncio.Lock()
+        self._idle: Optional[asyncio.Queue[_PooledBrowser]] = None
+        self._browsers: list[_PooledBrowser] = []  # Every slot, idle, leased or recycling
+        self._recycling: set[asyncio.Task] = set()
+
+    async def _ensure_started(self) -> None:
+        async with self._start_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+                self._idle = asyncio.Queue()
+                self._browsers = [_PooledBrowser(slot) for slot in range(self.size)]
+                for pooled in self._browsers:
+                    self._idle.put_nowait(pooled)
+
+    async def _launch(self, pooled: _PooledBrowser) -> None:
+        pooled.browser = await self._playwright.chromium.launch(headless=True)
+        pooled.pages_served = 0
+
+    async def start(self) -> None:
+        """Start Playwright and launch every browser up front."""
+        try:
+            await self._ensure_started()
+            idle = [self._idle.get_nowait() for _ in range(self._idle.qsize())]
+            try:
+                await asyncio.gather(*(self._launch(pooled) for pooled in idle if not pooled.connected))
+            finally:
+                for pooled in idle:
+                    self._idle.put_nowait(pooled)
+            logger.info(f"Browser pool started with {self.size} browsers")
+        except Exception as e:
+            # Browser scrapers fail on their own (and trip their breaker); the API still starts
+            logger.error(f"Browser pool failed to start, will launch on first use: {e}")
+
+    async def close(self) -> None:
+        for task in self._recycling:
+            task.cancel()
+        # Let cancelled recycles settle so none launches a browser after this
+        await asyncio.gather(*self._recycling, return_exceptions=True)
+        # Close leased and recycling browsers too, not just the idle ones
+        for pooled in self._browsers:
+            if pooled.browser is not None:
+                try:
+                    await pooled.browser.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close browser {pooled.slot}: {e}")
+                pooled.browser = None
+        self._browsers = []
+        self._idle = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _recycle(self, pooled: _PooledBrowser) -> None:
+        try:
+            await pooled.browser.close()
+            await self._launch(pooled)
+            logger.info(f"Recycled browser {pooled.slot}")
+        except Exception as e:
+            # Leave it for the next lease to relaunch
+            pooled.browser = None
+            logger.error(f"Failed to recycle browser {pooled.slot}: {e}")
+        finally:
+            self._idle.put_nowait(pooled)
+
+    def _release(self, pooled: _PooledBrowser) -> None:
+        if self._idle is None:
+            return  # Pool closed while leased
+        if pooled.connected and pooled.pages_served >= self.recycle_after_pages:
+            task = asyncio.create_task(self._recycle(pooled))
+            self._recycling.add(task)
+            task.add_done_callback(self._recycling.discard)
+        else:
+            self._idle.put_nowait(pooled)
+
+    @asynccontextmanager
+    async def context(self, **options) -> AsyncIterator[BrowserContext]:
+        """Lease a browser and yield a new context on it; `options` go to new_context()."""
+        await self._ensure_started()
+        pooled = await asyncio.wait_for(self._idle.get(), self.lease_timeout)
+        try:
+            if not pooled.connected:
+                await self._launch(pooled)
+
+            context = await pooled.browser.new_context(**options)
+            context.on("page", lambda _page: setattr(pooled, "pages_served", pooled.pages_served + 1))
+            try:
+                yield context
+            finally:
+                await context.close()
+        finally:
+            self._release(pooled)
+
+    def status(self) -> dict:
+        return {
+            "size": self.size,
+            "started": self._playwright is not None,
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "launched": sum(pooled.browser is not None for pooled in self._browsers),
+            "recycling": len(self._recycling),
+        }
+
+
+browser_pool = BrowserPool(
+    size=settings.BROWSER_POOL_SIZE,
+    recycle_after_pages=settings.BROWSER_RECYCLE_AFTER_PAGES,
+    lease_timeout=settings.BROWSER_LEASE_TIMEOUT_SECONDS,
+)
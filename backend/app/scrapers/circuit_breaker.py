@@ -0,0 +1,172 @@
+"""
+Circuit Breaker - per-source failure isolation and health tracking
+
+Each source name gets a breaker that tracks a rolling window of outcomes and
+latencies. After repeated failures the breaker opens and calls are skipped
+immediately; once the cooldown passes a single probe is let through
+(half-open) and its outcome decides whether the breaker closes again.
+"""
+
+import time
+import asyncio
+import logging
+import functools
+from collections import deque
+from typing import Callable, Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_NO_FALLBACK = object()
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is skipped because the source's breaker is open."""
+
+    def __init__(self, source: str):
+        super().__init__(f"Circuit open for {source}")
+        self.source = source
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        error_rate_threshold: float,
+        window_size: int,
+        cooldown_seconds: float,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error = ""
+        self._probe_in_flight = False
+        # (ok, latency_ms) for the most recent calls
+        self._window: deque[tuple[bool, float]] = deque(maxlen=window_size)
+
+    def allow_request(self) -> bool:
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and time.monotonic() - self.opened_at >= self.cooldown_seconds:
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self, latency_ms: float) -> None:
+        self._window.append((True, latency_ms))
+        self.consecutive_failures = 0
+        if self.state != CLOSED:
+            logger.info(f"Circuit for {self.name} closed")
+        self.state = CLOSED
+        self._probe_in_flight = False
+
+    def record_failure(self, latency_ms: float, error: str = "") -> None:
+        self._window.append((False, latency_ms))
+        self.consecutive_failures += 1
+        self.last_error = error
+        if self.state == HALF_OPEN or self._should_open():
+            if self.state != OPEN:
+                logger.warning(f"Circuit for {self.name} opened: {error}")
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Let another half-open probe through after one ended without an outcome."""
+        self._probe_in_flight = False
+
+    def _should_open(self) -> bool:
+        if self.consecutive_failures >= self.failure_threshold:
+            return True
+        # Only trust the error rate once the window has enough samples
+        if len(self._window) < self._window.maxlen:
+            return False
+        return self.error_rate >= self.error_rate_threshold
+
+    @property
+    def error_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return sum(1 for ok, _ in self._window if not ok) / len(self._window)
+
+    def snapshot(self) -> dict:
+        latencies = sorted(latency for _, latency in self._window)
+        return {
+            "state": self.state,
+            "error_rate": round(self.error_rate, 3),
+            "calls": len(self._window),
+            "consecutive_failures": self.consecutive_failures,
+            "p50_ms": int(latencies[len(latencies) // 2]) if latencies else None,
+            "p95_ms": int(latencies[int(len(latencies) * 0.95)]) if latencies else None,
+            "last_error": self.last_error,
+        }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(source: str) -> CircuitBreaker:
+    if source not in _breakers:
+        _breakers[source] = CircuitBreaker(
+            name=source,
+            failure_threshold=settings.BREAKER_FAILURE_THRESHOLD,
+            error_rate_threshold=settings.BREAKER_ERROR_RATE_THRESHOLD,
+            window_size=settings.BREAKER_WINDOW_SIZE,
+            cooldown_seconds=settings.BREAKER_COOLDOWN_SECONDS,
+        )
+    return _breakers[source]
+
+
+def breaker_states() -> dict[str, dict]:
+    return {name: breaker.snapshot() for name, breaker in sorted(_breakers.items())}
+
+
+def guarded(fallback: Callable = _NO_FALLBACK):
+    """Run a source method through its breaker (keyed by `self.source_name`).
+
+    Without a fallback, an open breaker raises CircuitOpenError and errors
+    propagate. With one, both are logged and `fallback()` is returned instead.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            breaker = get_breaker(self.source_name)
+            if not breaker.allow_request():
+                if fallback is _NO_FALLBACK:
+                    raise CircuitOpenError(self.source_name)
+                logger.info(f"Skipping {self.source_name}: circuit open")
+                return fallback()
+
+            start = time.monotonic()
+            try:
+                result = await method(self, *args, **kwargs)
+            except asyncio.CancelledError:
+                # Deadline, client disconnect or shutdown: says nothing about the source.
+                # A per-source budget timeout is recorded by the fan-out instead.
+                breaker.release_probe()
+                raise
+            except Exception as e:
+                breaker.record_failure((time.monotonic() - start) * 1000, str(e))
+                if fallback is _NO_FALLBACK:
+                    raise
+                logger.error(f"{self.source_name} {method.__name__} failed: {e}")
+                return fallback()
+            breaker.record_success((time.monotonic() - start) * 1000)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,214 @@
+"""
+Near-duplicate detection - collapse the same posting seen on several boards
+
+Remotive, RemoteOK, Himalayas, WeWorkRemotely etc. often carry the same job
+with slightly different titles, URLs and descriptions. Each posting gets a
+64-bit SimHash over its normalized title, company and description; postings
+whose fingerprints are within a small Hamming distance (or whose normalized
+title + company match exactly) are merged into one canonical posting that
+lists the other copies as alternates.
+
+Merges are checked per cluster, not per pair, so chains can't bridge what a
+direct comparison would keep apart: a cluster holds at most one posting per
+source (one board listing a role in several cities keeps every listing) and
+at most one named employer (a company-less posting can't join two). Postings
+with nothing to fingerprint are never merged.
+
+Candidate pairs come from LSH banding: the fingerprint is split into
+`max_distance + 1` bands, and by pigeonhole two fingerprints within the
+distance share at least one band exactly. Only postings sharing a band
+bucket are compared, so the stage stays near-linear in the number of
+postings.
+"""
+
+import re
+import hashlib
+from dataclasses import replace
+from functools import lru_cache
+from typing import Optional
+from app.scrapers.keyword_index import iter_tokens, tokenize
+from app.scrapers.posting import JobPosting
+
+FINGERPRINT_BITS = 64
+DEFAULT_MAX_DISTANCE = 6
+
+# Field weights: titles and companies are short, so their tokens must outweigh
+# a description's first few dozen terms for rewrites of the same ad to match
+TITLE_WEIGHT = 6
+COMPANY_WEIGHT = 4
+DESCRIPTION_WEIGHT = 1
+DESCRIPTION_TERMS = 40
+DESCRIPTION_CHARS = 2000  # Only the opening of long HTML descriptions is tokenized
+
+_TAG_RE = re.compile(r"<[^>]+>|&[a-z]+;|&#\d+;")
+# Location/format boilerplate boards append to titles ("Python Developer (Remote)")
+_TITLE_NOISE = {"remote", "worldwide", "anywhere", "global", "hybrid", "wfh", "100", "fully", "hiring", "urgent"}
+_COMPANY_SUFFIXES = {"inc", "llc", "ltd", "gmbh", "co", "corp", "corporation", "company", "the", "limited"}
+
+# Per-bit counters are packed into one int, LANE bits per fingerprint bit, so
+# accumulating a token is a single big-int add instead of 64 separate ones
+_LANE = 16
+_BYTE_SPREAD = [
+    sum(((byte >> bit) & 1) << (_LANE * bit) for bit in range(8)) for byte in range(256)
+]
+
+
+@lru_cache(maxsize=65536)
+def _token_spread(token: str) -> int:
+    digest = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+    spread = 0
+    for k in range(FINGERPRINT_BITS // 8):
+        spread |= _BYTE_SPREAD[(digest >> (8 * k)) & 0xFF] << (_LANE * 8 * k)
+    return spread
+
+
+def simhash(weighted_tokens: dict[str, int]) -> int:
+    """64-bit SimHash of `token -> weight`."""
+    total = sum(weighted_tokens.values())
+    if not total:
+        return 0
+    counters = 0
+    for token, weight in weighted_tokens.items():
+        counters += weight * _token_spread(token)
+    lanes = memoryview(counters.to_bytes(FINGERPRINT_BITS * _LANE // 8, "little")).cast("H")
+    fingerprint = 0
+    for bit, count in enumerate(lanes):
+        if count * 2 > total:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def _title_key(title: str) -> tuple[str, ...]:
+    return tuple(t for t in tokenize(title) if t not in _TITLE_NOISE)
+
+
+def _company_key(company: str) -> tuple[str, ...]:
+    # Aggregator placeholders like "Via NoDesk" don't name the employer
+    if company.lower().startswith("via "):
+        return ()
+    return tuple(t for t in tokenize(company) if t not in _COMPANY_SUFFIXES)
+
+
+def fingerprint(posting: JobPosting, company_key: Optional[tuple[str, ...]] = None) -> int:
+    weights: dict[str, int] = {}
+    for token in _title_key(posting.title):
+        weights[token] = weights.get(token, 0) + TITLE_WEIGHT
+    if company_key is None:
+        company_key = _company_key(posting.company)
+    for token in company_key:
+        weights[token] = weights.get(token, 0) + COMPANY_WEIGHT
+    description_terms = 0
+    for token in iter_tokens(_TAG_RE.sub(" ", posting.description[:DESCRIPTION_CHARS])):
+        if description_terms >= DESCRIPTION_TERMS:
+            break
+        if token not in weights:
+            weights[token] = DESCRIPTION_WEIGHT
+            description_terms += 1
+    return simhash(weights)
+
+
+def _bands(max_distance: int) -> list[tuple[int, int]]:
+    """(shift, mask) for max_distance + 1 bands covering all bits."""
+    count = max_distance + 1
+    size, extra = divmod(FINGERPRINT_BITS, count)
+    bands = []
+    shift = 0
+    for i in range(count):
+        width = size + (1 if i < extra else 0)
+        bands.append((shift, (1 << width) - 1))
+        shift += width
+    return bands
+
+
+def _richness(posting: JobPosting) -> tuple:
+    return bool(posting.salary_range), bool(posting.company), len(posting.description)
+
+
+class _Clusters:
+    """Disjoint sets of postings, each tracking its sources and named employer."""
+
+    def __init__(self, sources: list[str], companies: list[tuple[str, ...]]):
+        self.parent = list(range(len(sources)))
+        self.sources = [{source} for source in sources]
+        self.company = list(companies)
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def merge(self, a: int, b: int) -> None:
+        """Join the clusters of `a` and `b` unless that would mix sources or employers."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b or self.sources[root_a] & self.sources[root_b]:
+            return
+        company_a, company_b = self.company[root_a], self.company[root_b]
+        if company_a and company_b and company_a != company_b:
+            return
+        # Keep the earliest posting as root so clusters keep feed order
+        root, child = min(root_a, root_b), max(root_a, root_b)
+        self.parent[child] = root
+        self.sources[root] |= self.sources[child]
+        self.company[root] = company_a or company_b
+
+
+def collapse_duplicates(
+    postings: list[JobPosting], max_distance: Optional[int] = None
+) -> list[JobPosting]:
+    """Merge near-duplicate postings, keeping the first occurrence's position.
+
+    Each cluster is represented by its most complete posting (salary, company,
+    longest description); the other copies are appended to its `alternates`.
+    """
+    if len(postings) < 2:
+        return postings
+    max_distance = DEFAULT_MAX_DISTANCE if max_distance is None else max_distance
+
+    companies = [_company_key(p.company) for p in postings]
+    fingerprints = [fingerprint(p, company) for p, company in zip(postings, companies)]
+    # Different named employers and copies from the same board never merge
+    clusters = _Clusters([p.source for p in postings], companies)
+
+    exact: dict[tuple, list[int]] = {}
+    for i, posting in enumerate(postings):
+        title = _title_key(posting.title)
+        if companies[i] and title:
+            exact.setdefault((title, companies[i]), []).append(i)
+    for members in exact.values():
+        for i in members[1:]:
+            clusters.merge(members[0], i)
+
+    # An empty fingerprint (no tokens at all) says nothing about the posting
+    fingerprinted = [i for i, value in enumerate(fingerprints) if value]
+    for shift, mask in _bands(max_distance):
+        buckets: dict[int, list[int]] = {}
+        for i in fingerprinted:
+            buckets.setdefault((fingerprints[i] >> shift) & mask, []).append(i)
+        for members in buckets.values():
+            for x in range(len(members)):
+                a = members[x]
+                for b in members[x + 1:]:
+                    if (fingerprints[a] ^ fingerprints[b]).bit_count() <= max_distance:
+                        clusters.merge(a, b)
+
+    grouped: dict[int, list[int]] = {}
+    for i in range(len(postings)):
+        grouped.setdefault(clusters.find(i), []).append(i)
+
+    collapsed = []
+    for root in sorted(grouped):
+        members = grouped[root]
+        if len(members) == 1:
+            collapsed.append(postings[root])
+            continue
+        canonical = max(members, key=lambda i: _richness(postings[i]))
+        alternates = list(postings[canonical].alternates)
+        for i in members:
+            if i != canonical:
+                other = postings[i]
+                alternates.append({"source": other.source, "url": other.url, "source_job_id": other.source_job_id})
+                alternates.extend(other.alternates)
+        # Copy rather than mutate: postings may be shared with the posting store
+        collapsed.append(replace(postings[canonical], alternates=alternates))
+    return collapsed
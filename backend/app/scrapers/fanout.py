@@ -0,0 +1,95 @@
+"""
+Fan-out - run several source searches under one request deadline
+
+Each source may also have its own latency budget. When the deadline expires
+the sources still in flight are cancelled and reported as timed out, so a
+hung board can no longer hold a request for the full client timeout.
+"""
+
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Optional
+from app.core.config import settings
+from app.scrapers.circuit_breaker import CircuitOpenError, get_breaker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourceResult:
+    source: str
+    status: str  # ok / timeout / error / open (skipped by its circuit breaker)
+    elapsed_ms: int
+    jobs: list = field(default_factory=list)
+    error: str = ""
+
+    def status_entry(self) -> dict:
+        entry = {"status": self.status, "elapsed_ms": self.elapsed_ms, "count": len(self.jobs)}
+        if self.error:
+            entry["error"] = self.error
+        return entry
+
+
+def _elapsed_ms(start: float) -> int:
+    return int((time.monotonic() - start) * 1000)
+
+
+async def _run_source(source: str, search: Awaitable[list], start: float) -> SourceResult:
+    budget_ms = settings.SOURCE_LATENCY_BUDGETS_MS.get(source)
+    try:
+        if budget_ms:
+            jobs = await asyncio.wait_for(search, budget_ms / 1000)
+        else:
+            jobs = await search
+        return SourceResult(source, "ok", _elapsed_ms(start), jobs)
+    except asyncio.TimeoutError:
+        elapsed_ms = _elapsed_ms(start)
+        # Over its own budget is the source's fault; the request deadline and disconnects are not
+        if budget_ms and elapsed_ms >= budget_ms:
+            get_breaker(source).record_failure(elapsed_ms, f"exceeded {budget_ms} ms latency budget")
+        return SourceResult(source, "timeout", elapsed_ms)
+    except CircuitOpenError as e:
+        return SourceResult(source, "open", _elapsed_ms(start), error=str(e))
+    except Exception as e:
+        return SourceResult(source, "error", _elapsed_ms(start), error=str(e))
+
+
+async def iter_fan_out(
+    searches: dict[str, Awaitable[list]],
+    deadline_ms: Optional[int] = None,
+) -> AsyncIterator[SourceResult]:
+    """Yield each source's result as it completes; stragglers time out at the deadline."""
+    start = time.monotonic()
+    deadline = start + deadline_ms / 1000 if deadline_ms else None
+    tasks = {
+        asyncio.ensure_future(_run_source(source, search, start)): source
+        for source, search in searches.items()
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                yield task.result()
+
+        for task in pending:
+            task.cancel()
+            logger.warning(f"{tasks[task]} cancelled at {deadline_ms} ms deadline")
+            yield SourceResult(tasks[task], "timeout", _elapsed_ms(start))
+    finally:
+        # Consumer stopped early (e.g. client disconnect): don't leave fetches running
+        for task in tasks:
+            task.cancel()
+
+
+async def fan_out(
+    searches: dict[str, Awaitable[list]],
+    deadline_ms: Optional[int] = None,
+) -> dict[str, SourceResult]:
+    """Run all searches concurrently and return every source's result by name."""
+    return {result.source: result async for result in iter_fan_out(searches, deadline_ms)}
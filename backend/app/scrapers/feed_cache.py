@@ -0,0 +1,215 @@
+"""
+Feed Cache - TTL cache with conditional GET for full-feed sources
+
+Some boards (RemoteOK, WeWorkRemotely, Arbeitnow, NoDesk) ignore search
+parameters and always return their whole feed. This cache keeps the last body
+per URL for a per-source TTL and, once that expires, revalidates with
+If-None-Match / If-Modified-Since so an unchanged feed costs a 304 only.
+
+Tiers:
+- in-process LRU (always on)
+- Redis (optional, shared between workers) via Settings.REDIS_URL
+"""
+
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+import httpx
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FeedEntry:
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0  # Last time the body was downloaded or revalidated
+
+    def is_fresh(self, ttl: int) -> bool:
+        return time.time() - self.fetched_at < ttl
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+
+class FeedCache:
+    """Two-tier (memory LRU + optional Redis) cache for raw feed bodies."""
+
+    REDIS_PREFIX = "feedcache:"
+
+    def __init__(self, max_entries: int = 64, redis_enabled: bool = False):
+        self.max_entries = max_entries
+        self.redis_enabled = redis_enabled
+        self._entries: OrderedDict[str, FeedEntry] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: dict[str, int] = {}  # Holders + waiters per lock
+        self._redis = None
+
+    def ttl_for(self, source: str) -> int:
+        return settings.FEED_CACHE_TTLS.get(source, settings.FEED_CACHE_DEFAULT_TTL)
+
+    # Memory tier
+
+    def _memory_get(self, key: str) -> Optional[FeedEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _memory_set(self, key: str, entry: FeedEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # Redis tier
+
+    def _get_redis(self):
+        if not self.redis_enabled:
+            return None
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(settings.REDIS_URL)
+        return self._redis
+
+    async def _redis_get(self, key: str) -> Optional[FeedEntry]:
+        redis = self._get_redis()
+        if redis is None:
+            return None
+        try:
+            data = await redis.hgetall(self.REDIS_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"Feed cache Redis read failed: {e}")
+            return None
+        if not data or b"body" not in data:
+            return None
+        return FeedEntry(
+            body=data[b"body"],
+            etag=data.get(b"etag", b"").decode() or None,
+            last_modified=data.get(b"last_modified", b"").decode() or None,
+            fetched_at=float(data.get(b"fetched_at", b"0")),
+        )
+
+    async def _redis_set(self, key: str, entry: FeedEntry) -> None:
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            redis_key = self.REDIS_PREFIX + key
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.hset(redis_key, mapping={
+                    "body": entry.body,
+                    "etag": entry.etag or "",
+                    "last_modified": entry.last_modified or "",
+                    "fetched_at": entry.fetched_at,
+                })
+                # Keep validators well past the TTL so stale entries can still revalidate
+                pipe.expire(redis_key, settings.FEED_CACHE_REDIS_RETENTION_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Feed cache Redis write failed: {e}")
+
+    async def _store(self, key: str, entry: FeedEntry) -> None:
+        self._memory_set(key, entry)
+        await self._redis_set(key, entry)
+
+    async def _lookup(self, key: str) -> Optional[FeedEntry]:
+        entry = self._memory_get(key)
+        if entry is None:
+            entry = await self._redis_get(key)
+            if entry is not None:
+                self._memory_set(key, entry)
+        return entry
+
+    async def get(
+        self,
+        client: httpx.AsyncClient,
+        source: str,
+        url: str,
+        headers: Optional[dict] = None,
+    ) -> FeedEntry:
+        """Return the feed body for `url`, fetching or revalidating as needed."""
+        ttl = self.ttl_for(source)
+        if ttl <= 0:
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            return FeedEntry(body=response.content, fetched_at=time.time())
+
+        entry = await self._lookup(url)
+        if entry is not None and entry.is_fresh(ttl):
+            return entry
+
+        # Single-flight: concurrent requests for the same feed share one fetch.
+        # The lock lives only while someone holds or waits on it, so the dict
+        # stays as small as the set of feeds being fetched right now.
+        lock = self._locks.get(url)
+        if lock is None:
+            lock = self._locks[url] = asyncio.Lock()
+        self._lock_users[url] = self._lock_users.get(url, 0) + 1
+        try:
+            async with lock:
+                return await self._refresh(client, source, url, headers, ttl)
+        finally:
+            self._lock_users[url] -= 1
+            if not self._lock_users[url]:
+                del self._lock_users[url]
+                del self._locks[url]
+
+    async def _refresh(
+        self,
+        client: httpx.AsyncClient,
+        source: str,
+        url: str,
+        headers: Optional[dict],
+        ttl: int,
+    ) -> FeedEntry:
+        """Fetch or revalidate `url` unless another caller refreshed it meanwhile."""
+        entry = await self._lookup(url)
+        if entry is not None and entry.is_fresh(ttl):
+            return entry
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        response = await client.get(url, headers=request_headers)
+
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"Feed cache: {source} not modified")
+            entry.fetched_at = time.time()
+            await self._store(url, entry)
+            return entry
+
+        response.raise_for_status()
+        entry = FeedEntry(
+            body=response.content,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            fetched_at=time.time(),
+        )
+        await self._store(url, entry)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+feed_cache = FeedCache(
+    max_entries=settings.FEED_CACHE_MAX_ENTRIES,
+    redis_enabled=settings.FEED_CACHE_REDIS_ENABLED,
+)
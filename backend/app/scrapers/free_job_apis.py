@@ -3,19 +3,110 @@ Free Job APIs - No API Key Required
 Popular job boards with free public APIs
 """
 
-import httpx
-import asyncio
+import json
 import logging
-from typing import Optional
-from bs4 import BeautifulSoup
+from typing import Callable, Optional
+from app.core.config import settings
+from app.scrapers.http_client import HTTPClientMixin
+from app.scrapers.fanout import fan_out
+from app.scrapers.circuit_breaker import guarded
+from app.scrapers.feed_cache import feed_cache
+from app.scrapers.keyword_index import filter_items, KeywordMatcher
+from app.scrapers.rss import iter_rss_items
+from app.scrapers.json_stream import iter_json_items, aiter_json_items
+from app.scrapers.pagination import Page, fetch_pages, total_pages
+from app.scrapers.posting import JobPosting
+from app.scrapers.dedupe import collapse_duplicates
+from app.scrapers.parse_executor import parse_executor
 
 logger = logging.getLogger(__name__)
 
 
-class RemotiveAPI:
+# RSS feeds are parsed by module-level functions so they can run in parse workers.
+# A parse limited to a few items stops streaming early, so it stays on the loop:
+# pickling the whole (~1 MB) cached feed to a worker would cost more than it.
+# Only parses that walk most of the feed (ingestion, backfills) are offloaded.
+RSS_INLINE_MAX_LIMIT = 100
+
+
+async def _parse_feed(parse: Callable[..., list[JobPosting]], body: bytes, keywords: str, limit: int, match_all: bool) -> list[JobPosting]:
+    if limit <= RSS_INLINE_MAX_LIMIT:
+        return parse_executor.inline(parse, body, keywords, limit, match_all)
+    return await parse_executor.run(parse, body, keywords, limit, match_all)
+
+
+def parse_weworkremotely_feed(body: bytes, keywords: str, limit: int, match_all: bool = False) -> list[JobPosting]:
+    jobs = []
+    matcher = KeywordMatcher(keywords, match_all=match_all)
+
+    # Stream items and stop parsing as soon as `limit` matches are found
+    for item in iter_rss_items(body):
+        if len(jobs) >= limit:
+            break
+
+        # Feed titles are "Company: Title", so matching the raw title covers both
+        title = item.get("title", "")
+        if not matcher.matches(title):
+            continue
+
+        company = ""
+        if ": " in title:
+            company, title = title.split(": ", 1)
+
+        description = item.get("description", "")
+        link = item.get("link", "")
+        pub_date = item.get("pubDate", "")
+
+        jobs.append(JobPosting(
+            title=title.strip(),
+            company=company.strip(),
+            location="Remote",
+            url=link,
+            description=description or "",
+            posted_date=pub_date,
+            source="weworkremotely",
+            source_job_id=link.split("/")[-1] if link else "",
+            is_remote=True,
+        ))
+    return jobs
+
+
+def parse_nodesk_feed(body: bytes, keywords: str, limit: int, match_all: bool = False) -> list[JobPosting]:
+    jobs = []
+    matcher = KeywordMatcher(keywords, match_all=match_all)
+
+    for item in iter_rss_items(body):
+        if len(jobs) >= limit:
+            break
+
+        title = item.get("title", "")
+        if not matcher.matches(title):
+            continue
+
+        description = item.get("description", "")
+        link = item.get("link", "")
+        pub_date = item.get("pubDate", "")
+
+        jobs.append(JobPosting(
+            title=title,
+            company="Via NoDesk",
+            location="Remote",
+            url=link,
+            description=description or "",
+            posted_date=pub_date,
+            source="nodesk",
+            source_job_id=link.split("/")[-2] if link else "",
+            is_remote=True,
+        ))
+    return jobs
+
+
+class RemotiveAPI(HTTPClientMixin):
     """Remotive.com - Free Remote Jobs API (Tech Focused)"""
 
     BASE_URL = "https://remotive.com/api/remote-jobs"
+    REMOTE_ONLY = True  # Lists remote roles only
+    SEARCHES_SERVER_SIDE = True  # Narrows by category upstream; an unfiltered pull is a sample
 
     CATEGORY_MAP = {
         "software": "software-dev",
@@ -44,7 +135,10 @@ class RemotiveAPI:
                 return category
         return None
 
-    async def search_jobs(self, keywords: str = "", category: Optional[str] = None, limit: int = 20) -> list[dict]:
+    @guarded()
+    async def search_jobs(
+        self, keywords: str = "", category: Optional[str] = None, limit: int = 20, match_all: bool = False
+    ) -> list[JobPosting]:
         jobs = []
         try:
             params = {"limit": min(limit * 2, 100)}
@@ -53,164 +147,131 @@ class RemotiveAPI:
             if category:
                 params["category"] = category
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-            all_jobs = data.get("jobs", [])
-            keywords_lower = keywords.lower().split()
-
-            for job in all_jobs:
-                if len(jobs) >= limit:
-                    break
-                title = job.get("title", "").lower()
-                company = job.get("company_name", "").lower()
-                tags = " ".join(job.get("tags", [])).lower()
-
-                if keywords_lower:
-                    if not any(kw in title or kw in company or kw in tags for kw in keywords_lower):
-                        continue
-
-                jobs.append({
-                    "title": job.get("title", ""),
-                    "company": job.get("company_name", ""),
-                    "location": job.get("candidate_required_location", "Remote"),
-                    "url": job.get("url", ""),
-                    "description": job.get("description", ""),
-                    "salary_range": job.get("salary", ""),
-                    "job_type": job.get("job_type", ""),
-                    "posted_date": job.get("publication_date", ""),
-                    "tags": job.get("tags", []),
-                    "source": self.source_name,
-                    "source_job_id": str(job.get("id", "")),
-                    "is_remote": True,
-                    "company_logo": job.get("company_logo", ""),
-                })
+            response = await self.http.get(self.BASE_URL, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            matched = filter_items(
+                data.get("jobs", []),
+                lambda job: (job.get("title", ""), job.get("company_name", ""), " ".join(job.get("tags", []))),
+                keywords, limit, match_all=match_all,
+            )
+
+            for job in matched:
+                jobs.append(JobPosting(
+                    title=job.get("title", ""),
+                    company=job.get("company_name", ""),
+                    location=job.get("candidate_required_location", "Remote"),
+                    url=job.get("url", ""),
+                    description=job.get("description", ""),
+                    salary_range=job.get("salary", ""),
+                    job_type=job.get("job_type", ""),
+                    posted_date=job.get("publication_date", ""),
+                    tags=job.get("tags", []),
+                    source=self.source_name,
+                    source_job_id=str(job.get("id", "")),
+                    is_remote=True,
+                    company_logo=job.get("company_logo", ""),
+                ))
             logger.info(f"Remotive: Found {len(jobs)} jobs")
         except Exception as e:
             logger.error(f"Remotive API error: {e}")
+            raise
         return jobs
 
 
-class RemoteOKAPI:
+class RemoteOKAPI(HTTPClientMixin):
     """RemoteOK.com - 100,000+ Remote Jobs (All Categories)"""
 
     BASE_URL = "https://remoteok.com/api"
+    REMOTE_ONLY = True  # Lists remote roles only
 
     @property
     def source_name(self) -> str:
         return "remoteok"
 
-    async def search_jobs(self, keywords: str = "", limit: int = 20) -> list[dict]:
+    def _format_job(self, job: dict) -> JobPosting:
+        slug = job.get("slug", "")
+        job_url = f"https://remoteok.com/remote-jobs/{slug}" if slug else ""
+
+        return JobPosting(
+            title=job.get("position", ""),
+            company=job.get("company", ""),
+            location=job.get("location", "Remote"),
+            url=job_url,
+            description=job.get("description", ""),
+            salary_range=f"${job.get('salary_min', '')}-${job.get('salary_max', '')}" if job.get('salary_min') else "",
+            posted_date=job.get("date", ""),
+            tags=job.get("tags", []),
+            source=self.source_name,
+            source_job_id=str(job.get("id", "")),
+            is_remote=True,
+            company_logo=job.get("company_logo", ""),
+        )
+
+    def _accept(self, job, matcher: KeywordMatcher) -> bool:
+        # The first element is the API legal notice, not a posting
+        if not isinstance(job, dict) or "position" not in job:
+            return False
+        return matcher.matches(job.get("position", ""), job.get("company", ""), " ".join(job.get("tags", [])))
+
+    @guarded()
+    async def search_jobs(self, keywords: str = "", limit: int = 20, match_all: bool = False) -> list[JobPosting]:
         jobs = []
         try:
             headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
-            async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-                response = await client.get(self.BASE_URL)
-                response.raise_for_status()
-                data = response.json()
-
-            all_jobs = data[1:] if len(data) > 1 else []
-            keywords_lower = keywords.lower().split() if keywords else []
-
-            for job in all_jobs:
-                if len(jobs) >= limit:
-                    break
-                if not isinstance(job, dict) or "position" not in job:
-                    continue
-
-                title = job.get("position", "").lower()
-                company = job.get("company", "").lower()
-                job_tags = " ".join(job.get("tags", [])).lower()
-
-                if keywords_lower:
-                    if not any(kw in title or kw in company or kw in job_tags for kw in keywords_lower):
-                        continue
-
-                slug = job.get("slug", "")
-                job_url = f"https://remoteok.com/remote-jobs/{slug}" if slug else ""
-
-                jobs.append({
-                    "title": job.get("position", ""),
-                    "company": job.get("company", ""),
-                    "location": job.get("location", "Remote"),
-                    "url": job_url,
-                    "description": job.get("description", ""),
-                    "salary_range": f"${job.get('salary_min', '')}-${job.get('salary_max', '')}" if job.get('salary_min') else "",
-                    "posted_date": job.get("date", ""),
-                    "tags": job.get("tags", []),
-                    "source": self.source_name,
-                    "source_job_id": str(job.get("id", "")),
-                    "is_remote": True,
-                    "company_logo": job.get("company_logo", ""),
-                })
+            matcher = KeywordMatcher(keywords, match_all=match_all)
+
+            # The dump is one huge array: decode postings one at a time and stop at `limit`
+            if feed_cache.ttl_for(self.source_name) > 0:
+                feed = await feed_cache.get(self.http, self.source_name, self.BASE_URL, headers=headers)
+                for job in iter_json_items(feed.body):
+                    if len(jobs) >= limit:
+                        break
+                    if self._accept(job, matcher):
+                        jobs.append(self._format_job(job))
+            else:
+                # Uncached: stop reading the response body itself once we have enough
+                async with self.http.stream("GET", self.BASE_URL, headers=headers) as response:
+                    response.raise_for_status()
+                    async for job in aiter_json_items(response):
+                        if len(jobs) >= limit:
+                            break
+                        if self._accept(job, matcher):
+                            jobs.append(self._format_job(job))
+
             logger.info(f"RemoteOK: Found {len(jobs)} jobs")
         except Exception as e:
             logger.error(f"RemoteOK API error: {e}")
+            raise
         return jobs
 
 
-class WeWorkRemotelyAPI:
+class WeWorkRemotelyAPI(HTTPClientMixin):
     """WeWorkRemotely.com - One of the oldest trusted remote job boards"""
 
     BASE_URL = "https://weworkremotely.com/remote-jobs.rss"
+    REMOTE_ONLY = True  # Lists remote roles only
 
     @property
     def source_name(self) -> str:
         return "weworkremotely"
 
-    async def search_jobs(self, keywords: str = "", limit: int = 20) -> list[dict]:
+    @guarded()
+    async def search_jobs(self, keywords: str = "", limit: int = 20, match_all: bool = False) -> list[JobPosting]:
         jobs = []
         try:
             headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
-            async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-                response = await client.get(self.BASE_URL)
-                response.raise_for_status()
-                content = response.text
-
-            soup = BeautifulSoup(content, "xml")
-            items = soup.find_all("item")
-            keywords_lower = keywords.lower().split() if keywords else []
-
-            for item in items:
-                if len(jobs) >= limit:
-                    break
-
-                title = item.find("title").text if item.find("title") else ""
-                company = ""
-                if ": " in title:
-                    company, title = title.split(": ", 1)
-
-                title_lower = title.lower()
-                company_lower = company.lower()
-
-                if keywords_lower:
-                    if not any(kw in title_lower or kw in company_lower for kw in keywords_lower):
-                        continue
-
-                description = item.find("description").text if item.find("description") else ""
-                link = item.find("link").text if item.find("link") else ""
-                pub_date = item.find("pubDate").text if item.find("pubDate") else ""
-
-                jobs.append({
-                    "title": title.strip(),
-                    "company": company.strip(),
-                    "location": "Remote",
-                    "url": link,
-                    "description": description or "",
-                    "posted_date": pub_date,
-                    "source": self.source_name,
-                    "source_job_id": link.split("/")[-1] if link else "",
-                    "is_remote": True,
-                })
+            feed = await feed_cache.get(self.http, self.source_name, self.BASE_URL, headers=headers)
+            jobs = await _parse_feed(parse_weworkremotely_feed, feed.body, keywords, limit, match_all)
             logger.info(f"WeWorkRemotely: Found {len(jobs)} jobs")
         except Exception as e:
             logger.error(f"WeWorkRemotely error: {e}")
+            raise
         return jobs
 
 
-class ArbeitnowAPI:
+class ArbeitnowAPI(HTTPClientMixin):
     """Arbeitnow.com - EU/German Jobs"""
 
     BASE_URL = "https://www.arbeitnow.com/api/job-board-api"
@@ -219,247 +280,244 @@ class ArbeitnowAPI:
     def source_name(self) -> str:
         return "arbeitnow"
 
-    async def search_jobs(self, keywords: str = "", limit: int = 20) -> list[dict]:
+    async def _fetch_page(self, page: int) -> Page:
+        # Each page is its own feed-cache entry; the API reports a next link but no total
+        url = self.BASE_URL if page == 1 else f"{self.BASE_URL}?page={page}"
+        feed = await feed_cache.get(self.http, self.source_name, url)
+        data = json.loads(feed.body)
+        return Page(data.get("data", []), has_next=bool((data.get("links") or {}).get("next")))
+
+    @guarded()
+    async def search_jobs(self, keywords: str = "", limit: int = 20, match_all: bool = False) -> list[JobPosting]:
         jobs = []
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.BASE_URL)
-                response.raise_for_status()
-                data = response.json()
-
-            all_jobs = data.get("data", [])
-            keywords_lower = keywords.lower().split() if keywords else []
-
-            for job in all_jobs:
-                if len(jobs) >= limit:
-                    break
-
-                title = job.get("title", "").lower()
-                company = job.get("company_name", "").lower()
-                tags = " ".join(job.get("tags", [])).lower()
-
-                if keywords_lower:
-                    if not any(kw in title or kw in company or kw in tags for kw in keywords_lower):
-                        continue
-
-                jobs.append({
-                    "title": job.get("title", ""),
-                    "company": job.get("company_name", ""),
-                    "location": job.get("location", ""),
-                    "url": job.get("url", ""),
-                    "description": job.get("description", ""),
-                    "posted_date": job.get("created_at", ""),
-                    "tags": job.get("tags", []),
-                    "source": self.source_name,
-                    "source_job_id": str(job.get("slug", "")),
-                    "is_remote": job.get("remote", False),
-                })
+            matched = []
+
+            def on_page(items: list) -> bool:
+                matched.extend(filter_items(
+                    items,
+                    lambda job: (job.get("title", ""), job.get("company_name", ""), " ".join(job.get("tags", []))),
+                    keywords, limit - len(matched), match_all=match_all,
+                ))
+                return len(matched) >= limit
+
+            await fetch_pages(self._fetch_page, on_page)
+
+            for job in matched:
+                jobs.append(JobPosting(
+                    title=job.get("title", ""),
+                    company=job.get("company_name", ""),
+                    location=job.get("location", ""),
+                    url=job.get("url", ""),
+                    description=job.get("description", ""),
+                    posted_date=job.get("created_at", ""),
+                    tags=job.get("tags", []),
+                    source=self.source_name,
+                    source_job_id=str(job.get("slug", "")),
+                    is_remote=job.get("remote", False),
+                ))
             logger.info(f"Arbeitnow: Found {len(jobs)} jobs")
         except Exception as e:
             logger.error(f"Arbeitnow API error: {e}")
+            raise
         return jobs
 
 
-class JobicyAPI:
+class JobicyAPI(HTTPClientMixin):
     """Jobicy.com - Remote Jobs"""
 
     BASE_URL = "https://jobicy.com/api/v2/remote-jobs"
+    REMOTE_ONLY = True  # Lists remote roles only
+    MAX_COUNT = 50
 
     @property
     def source_name(self) -> str:
         return "jobicy"
 
-    async def search_jobs(self, keywords: str = "", limit: int = 20) -> list[dict]:
+    @guarded()
+    async def search_jobs(self, keywords: str = "", limit: int = 20, match_all: bool = False) -> list[JobPosting]:
         jobs = []
         try:
-            params = {"count": min(limit * 2, 50)}
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-            all_jobs = data.get("jobs", [])
-            keywords_lower = keywords.lower().split() if keywords else []
-
-            for job in all_jobs:
-                if len(jobs) >= limit:
-                    break
-
-                title = job.get("jobTitle", "").lower()
-                company = job.get("companyName", "").lower()
-
-                if keywords_lower:
-                    if not any(kw in title or kw in company for kw in keywords_lower):
-                        continue
-
-                jobs.append({
-                    "title": job.get("jobTitle", ""),
-                    "company": job.get("companyName", ""),
-                    "location": job.get("jobGeo", "Remote"),
-                    "url": job.get("url", ""),
-                    "description": job.get("jobExcerpt", ""),
-                    "salary_range": f"${job.get('annualSalaryMin', '')}-${job.get('annualSalaryMax', '')}" if job.get('annualSalaryMin') else "",
-                    "job_type": job.get("jobType", ""),
-                    "posted_date": job.get("pubDate", ""),
-                    "source": self.source_name,
-                    "source_job_id": str(job.get("id", "")),
-                    "is_remote": True,
-                    "company_logo": job.get("companyLogo", ""),
-                })
+            # No page cursor: a filtered search asks for the largest window the API serves
+            params = {"count": self.MAX_COUNT if keywords else min(limit, self.MAX_COUNT)}
+            response = await self.http.get(self.BASE_URL, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            matched = filter_items(
+                data.get("jobs", []),
+                lambda job: (job.get("jobTitle", ""), job.get("companyName", "")),
+                keywords, limit, match_all=match_all,
+            )
+
+            for job in matched:
+                jobs.append(JobPosting(
+                    title=job.get("jobTitle", ""),
+                    company=job.get("companyName", ""),
+                    location=job.get("jobGeo", "Remote"),
+                    url=job.get("url", ""),
+                    description=job.get("jobExcerpt", ""),
+                    salary_range=f"${job.get('annualSalaryMin', '')}-${job.get('annualSalaryMax', '')}" if job.get('annualSalaryMin') else "",
+                    job_type=job.get("jobType", ""),
+                    posted_date=job.get("pubDate", ""),
+                    source=self.source_name,
+                    source_job_id=str(job.get("id", "")),
+                    is_remote=True,
+                    company_logo=job.get("companyLogo", ""),
+                ))
             logger.info(f"Jobicy: Found {len(jobs)} jobs")
         except Exception as e:
             logger.error(f"Jobicy API error: {e}")
+            raise
         return jobs
 
 
-class HimalayasAPI:
+class HimalayasAPI(HTTPClientMixin):
     """Himalayas.app - Remote Jobs"""
 
     BASE_URL = "https://himalayas.app/jobs/api"
+    REMOTE_ONLY = True  # Lists remote roles only
+    PAGE_SIZE = 20  # Largest page the API serves
 
     @property
     def source_name(self) -> str:
         return "himalayas"
 
-    async def search_jobs(self, keywords: str = "", limit: int = 20) -> list[dict]:
+    async def _fetch_page(self, page: int) -> Page:
+        offset = (page - 1) * self.PAGE_SIZE
+        response = await self.http.get(self.BASE_URL, params={"limit": self.PAGE_SIZE, "offset": offset})
+        response.raise_for_status()
+        data = response.json()
+        items = data.get("jobs", [])
+        total = data.get("totalCount") or 0
+        return Page(
+            items,
+            has_next=bool(items) and offset + len(items) < total,
+            total_pages=total_pages(total, self.PAGE_SIZE),
+        )
+
+    @guarded()
+    async def search_jobs(self, keywords: str = "", limit: int = 20, match_all: bool = False) -> list[JobPosting]:
         jobs = []
         try:
-            params = {"limit": min(limit * 2, 50)}
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-            all_jobs = data.get("jobs", [])
-            keywords_lower = keywords.lower().split() if keywords else []
-
-            for job in all_jobs:
-                if len(jobs) >= limit:
-                    break
-
-                title = job.get("title", "").lower()
-                company = job.get("companyName", "").lower()
-
-                if keywords_lower:
-                    if not any(kw in title or kw in company for kw in keywords_lower):
-                        continue
-
-                jobs.append({
-                    "title": job.get("title", ""),
-                    "company": job.get("companyName", ""),
-                    "location": job.get("locationRestrictions", ["Remote"])[0] if job.get("locationRestrictions") else "Remote",
-                    "url": f"https://himalayas.app/jobs/{job.get('slug', '')}",
-                    "description": job.get("description", ""),
-                    "salary_range": f"{job.get('salaryCurrency', '')} {job.get('minSalary', '')}" if job.get("minSalary") else "",
-                    "posted_date": job.get("pubDate", ""),
-                    "tags": job.get("categories", []),
-                    "source": self.source_name,
-                    "source_job_id": str(job.get("id", "")),
-                    "is_remote": True,
-                    "company_logo": job.get("companyLogo", ""),
-                })
+            matched = []
+
+            def on_page(items: list) -> bool:
+                matched.extend(filter_items(
+                    items,
+                    lambda job: (job.get("title", ""), job.get("companyName", "")),
+                    keywords, limit - len(matched), match_all=match_all,
+                ))
+                return len(matched) >= limit
+
+            await fetch_pages(self._fetch_page, on_page)
+
+            for job in matched:
+                jobs.append(JobPosting(
+                    title=job.get("title", ""),
+                    company=job.get("companyName", ""),
+                    location=job.get("locationRestrictions", ["Remote"])[0] if job.get("locationRestrictions") else "Remote",
+                    url=f"https://himalayas.app/jobs/{job.get('slug', '')}",
+                    description=job.get("description", ""),
+                    salary_range=f"{job.get('salaryCurrency', '')} {job.get('minSalary', '')}" if job.get("minSalary") else "",
+                    posted_date=job.get("pubDate", ""),
+                    tags=job.get("categories", []),
+                    source=self.source_name,
+                    source_job_id=str(job.get("id", "")),
+                    is_remote=True,
+                    company_logo=job.get("companyLogo", ""),
+                ))
             logger.info(f"Himalayas: Found {len(jobs)} jobs")
         except Exception as e:
             logger.error(f"Himalayas API error: {e}")
+            raise
         return jobs
 
 
-class NoDeskAPI:
+class NoDeskAPI(HTTPClientMixin):
     """NoDesk.co - Remote Jobs with Tech Stack Details"""
 
     BASE_URL = "https://nodesk.co/api/job-board-api"
+    REMOTE_ONLY = True  # Lists remote roles only
 
     @property
     def source_name(self) -> str:
         return "nodesk"
 
-    async def search_jobs(self, keywords: str = "", limit: int = 20) -> list[dict]:
+    @guarded()
+    async def search_jobs(self, keywords: str = "", limit: int = 20, match_all: bool = False) -> list[JobPosting]:
         jobs = []
         try:
             # NoDesk uses RSS feed
             rss_url = "https://nodesk.co/remote-jobs/feed/"
             headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
 
-            async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-                response = await client.get(rss_url)
-                response.raise_for_status()
-                content = response.text
-
-            soup = BeautifulSoup(content, "xml")
-            items = soup.find_all("item")
-            keywords_lower = keywords.lower().split() if keywords else []
-
-            for item in items:
-                if len(jobs) >= limit:
-                    break
-
-                title = item.find("title").text if item.find("title") else ""
-                title_lower = title.lower()
-
-                if keywords_lower:
-                    if not any(kw in title_lower for kw in keywords_lower):
-                        continue
-
-                description = item.find("description").text if item.find("description") else ""
-                link = item.find("link").text if item.find("link") else ""
-                pub_date = item.find("pubDate").text if item.find("pubDate") else ""
-
-                jobs.append({
-                    "title": title,
-                    "company": "Via NoDesk",
-                    "location": "Remote",
-                    "url": link,
-                    "description": description or "",
-                    "posted_date": pub_date,
-                    "source": self.source_name,
-                    "source_job_id": link.split("/")[-2] if link else "",
-                    "is_remote": True,
-                })
+            feed = await feed_cache.get(self.http, self.source_name, rss_url, headers=headers)
+            jobs = await _parse_feed(parse_nodesk_feed, feed.body, keywords, limit, match_all)
             logger.info(f"NoDesk: Found {len(jobs)} jobs")
         except Exception as e:
             logger.error(f"NoDesk error: {e}")
+            raise
         return jobs
 
 
-class FindWorkAPI:
+class FindWorkAPI(HTTPClientMixin):
     """Findwork.dev - Developer Jobs API"""
 
     BASE_URL = "https://findwork.dev/api/jobs/"
+    SEARCHES_SERVER_SIDE = True  # Searches upstream; an unfiltered pull is a sample
 
     @property
     def source_name(self) -> str:
         return "findwork"
 
-    async def search_jobs(self, keywords: str = "", limit: int = 20) -> list[dict]:
+    async def _fetch_page(self, keywords: str, page: int) -> Page:
+        params = {"search": keywords} if keywords else {}
+        if page > 1:
+            params["page"] = page
+        headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
+
+        response = await self.http.get(self.BASE_URL, params=params, headers=headers)
+        response.raise_for_status()
+        data = response.json()
+        items = data.get("results", [])
+        return Page(
+            items,
+            has_next=bool(data.get("next")),
+            total_pages=total_pages(data.get("count") or 0, len(items)),
+        )
+
+    @guarded()
+    async def search_jobs(self, keywords: str = "", limit: int = 20, match_all: bool = False) -> list[JobPosting]:
         jobs = []
         try:
-            params = {"search": keywords} if keywords else {}
-            headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
+            # Findwork filters server-side, so every result on every page counts
+            all_jobs = []
 
-            async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
+            def on_page(items: list) -> bool:
+                all_jobs.extend(items)
+                return len(all_jobs) >= limit
 
-            all_jobs = data.get("results", [])
+            await fetch_pages(lambda page: self._fetch_page(keywords, page), on_page)
 
             for job in all_jobs[:limit]:
-                jobs.append({
-                    "title": job.get("role", ""),
-                    "company": job.get("company_name", ""),
-                    "location": job.get("location", "Remote"),
-                    "url": job.get("url", ""),
-                    "description": job.get("text", ""),
-                    "posted_date": job.get("date_posted", ""),
-                    "tags": job.get("keywords", []),
-                    "source": self.source_name,
-                    "source_job_id": str(job.get("id", "")),
-                    "is_remote": job.get("remote", False),
-                    "company_logo": job.get("company_logo", ""),
-                })
+                jobs.append(JobPosting(
+                    title=job.get("role", ""),
+                    company=job.get("company_name", ""),
+                    location=job.get("location", "Remote"),
+                    url=job.get("url", ""),
+                    description=job.get("text", ""),
+                    posted_date=job.get("date_posted", ""),
+                    tags=job.get("keywords", []),
+                    source=self.source_name,
+                    source_job_id=str(job.get("id", "")),
+                    is_remote=job.get("remote", False),
+                    company_logo=job.get("company_logo", ""),
+                ))
             logger.info(f"Findwork: Found {len(jobs)} jobs")
         except Exception as e:
             logger.error(f"Findwork error: {e}")
+            raise
         return jobs
 
 
@@ -470,7 +528,8 @@ class GitHubJobsAPI:
     def source_name(self) -> str:
         return "github"
 
-    async def search_jobs(self, keywords: str = "", limit: int = 20) -> list[dict]:
+    @guarded()
+    async def search_jobs(self, keywords: str = "", limit: int = 20, match_all: bool = False) -> list[JobPosting]:
         # GitHub Jobs is deprecated, return empty
         logger.info("GitHub Jobs API is deprecated")
         return []
@@ -487,26 +546,40 @@ nodesk_api = NoDeskAPI()
 findwork_api = FindWorkAPI()
 
 
-async def search_all_free_sources(keywords: str = "", limit_per_source: int = 10) -> list[dict]:
-    """Search all free job sources in parallel."""
-    tasks = [
-        remotive_api.search_jobs(keywords, limit=limit_per_source),
-        remoteok_api.search_jobs(keywords, limit=limit_per_source),
-        weworkremotely_api.search_jobs(keywords, limit=limit_per_source),
-        arbeitnow_api.search_jobs(keywords, limit=limit_per_source),
-        jobicy_api.search_jobs(keywords, limit=limit_per_source),
-        himalayas_api.search_jobs(keywords, limit=limit_per_source),
-        nodesk_api.search_jobs(keywords, limit=limit_per_source),
-        findwork_api.search_jobs(keywords, limit=limit_per_source),
-    ]
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+# Free sources mapping - 8 popular job boards
+FREE_SOURCES = {
+    "remotive": remotive_api,
+    "remoteok": remoteok_api,
+    "weworkremotely": weworkremotely_api,
+    "arbeitnow": arbeitnow_api,
+    "jobicy": jobicy_api,
+    "himalayas": himalayas_api,
+    "nodesk": nodesk_api,
+    "findwork": findwork_api,
+}
+
+
+async def search_all_free_sources(
+    keywords: str = "",
+    limit_per_source: int = 10,
+    match_all: bool = False,
+    deadline_ms: Optional[int] = None,
+) -> list[JobPosting]:
+    """Search all free job sources in parallel, returning whatever arrives before the deadline.
+
+    Copies of the same posting from several boards are collapsed into one.
+    """
+    searches = {
+        name: api.search_jobs(keywords, limit=limit_per_source, match_all=match_all)
+        for name, api in FREE_SOURCES.items()
+    }
+    results = await fan_out(searches, deadline_ms or settings.FREE_SEARCH_DEADLINE_MS)
 
     all_jobs = []
-    for result in results:
-        if isinstance(result, list):
-            all_jobs.extend(result)
-        elif isinstance(result, Exception):
-            logger.error(f"Source error: {result}")
+    for result in results.values():
+        if result.status == "ok":
+            all_jobs.extend(result.jobs)
+        else:
+            logger.error(f"Source {result.source} {result.status} after {result.elapsed_ms} ms {result.error}")
 
-    return all_jobs
+    return collapse_duplicates(all_jobs)
@@ -0,0 +1,92 @@
+"""
+Shared HTTP client for all httpx-based job sources.
+
+One pooled client is created in the app lifespan and injected into every
+source, so connections (and TLS sessions) are reused across searches instead
+of being re-negotiated on every call.
+"""
+
+import httpx
+import asyncio
+import logging
+from typing import Optional
+from app.core.config import settings
+from app.scrapers.rate_limiter import HostRateLimiter, rate_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HostLimitedTransport(httpx.AsyncHTTPTransport):
+    """Transport that rate-limits requests and caps in-flight requests per host."""
+
+    def __init__(self, max_per_host: int, limiter: Optional[HostRateLimiter] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.max_per_host = max_per_host
+        self.limiter = limiter
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    def _slot(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_slots[host]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # Wait for the token before taking a connection slot, so throttled requests don't hold one
+        if self.limiter is not None:
+            await self.limiter.acquire(request.url.host)
+        async with self._slot(request.url.host):
+            return await super().handle_async_request(request)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build the app-scoped pooled client (HTTP/2 when h2 is installed)."""
+    http2 = settings.HTTP2_ENABLED and _http2_available()
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    transport = HostLimitedTransport(
+        max_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+        limiter=rate_limiter,
+        http2=http2,
+        limits=limits,
+    )
+    logger.info(f"Creating shared HTTP client (http2={http2})")
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=settings.HTTP_TIMEOUT_SECONDS,
+        headers={"User-Agent": DEFAULT_USER_AGENT},
+    )
+
+
+# Fallback client for code paths that run outside the app lifespan (scripts, shells)
+_fallback_client: Optional[httpx.AsyncClient] = None
+
+
+class HTTPClientMixin:
+    """Gives a source an injectable shared `httpx.AsyncClient`."""
+
+    client: Optional[httpx.AsyncClient] = None
+
+    def bind_client(self, client: Optional[httpx.AsyncClient]) -> None:
+        self.client = client
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        global _fallback_client
+        if self.client is not None:
+            return self.client
+        if _fallback_client is None or _fallback_client.is_closed:
+            _fallback_client = create_http_client()
+        return _fallback_client
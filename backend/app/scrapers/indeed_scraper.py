@@ -1,14 +1,132 @@
-import httpx
-from bs4 import BeautifulSoup
+from app.scrapers.http_client import HTTPClientMixin
+from app.scrapers.circuit_breaker import guarded
+from app.scrapers.html_parser import Selector, get_backend
+from app.scrapers.parse_executor import parse_executor
+from app.scrapers.page_archive import page_archive
+from app.scrapers.posting import JobPosting
 from urllib.parse import urlencode
 from typing import Optional
 import logging
-import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; see app.scrapers.html_parser
+_CARDS = Selector(".job_seen_beacon, .jobsearch-ResultsList > li, .resultContent")
+_CARDS_ALT = Selector("[data-testid='job-result'], .tapItem")
+_CARD_TITLE = Selector(".jobTitle span, [data-testid='job-title'], .jcs-JobTitle, h2.jobTitle a")
+_CARD_COMPANY = Selector("[data-testid='company-name'], .companyName, .company, span.css-92r8pb")
+_CARD_LOCATION = Selector("[data-testid='text-location'], .companyLocation, .location")
+_CARD_LINK = Selector("a.jcs-JobTitle, a[data-jk], h2.jobTitle a")
+_CARD_DATE = Selector(".date, [data-testid='myJobsStateDate'], .css-1yxxt5t")
+
+_DETAILS_TITLE = Selector("[data-testid='jobsearch-JobInfoHeader-title'], .jobsearch-JobInfoHeader-title")
+_DETAILS_COMPANY = Selector("[data-testid='inlineHeader-companyName'], .jobsearch-InlineCompanyRating-companyHeader")
+_DETAILS_LOCATION = Selector("[data-testid='inlineHeader-companyLocation'], .jobsearch-JobInfoHeader-subtitle")
+_DETAILS_DESCRIPTION = Selector("#jobDescriptionText, .jobsearch-jobDescriptionText")
+_DETAILS_SALARY = Selector("#salaryInfoAndJobType, [data-testid='attribute_snippet_testid']")
+
+
+def parse_search_page(
+    content: str,
+    limit: int,
+    domain: str,
+    work_mode: str = "any",
+    visa_sponsorship: bool = False,
+    backend: Optional[str] = None,
+) -> list[JobPosting]:
+    """Parse an Indeed results page; relative job links are resolved against `domain`."""
+    html = get_backend(backend)
+    doc = html.parse(content)
+    jobs = []
+
+    # Find job cards
+    job_cards = html.select(doc, _CARDS)[:limit]
+
+    if not job_cards:
+        # Try alternative selectors
+        job_cards = html.select(doc, _CARDS_ALT)[:limit]
+
+    logger.info(f"Found {len(job_cards)} job cards")
+
+    for card in job_cards:
+        try:
+            title_elem = html.select_one(card, _CARD_TITLE)
+            company_elem = html.select_one(card, _CARD_COMPANY)
+            location_elem = html.select_one(card, _CARD_LOCATION)
+            link_elem = html.select_one(card, _CARD_LINK)
+            date_elem = html.select_one(card, _CARD_DATE)
+
+            card_text = html.text(card, strip=False).lower()
+            has_sponsorship = any(kw in card_text for kw in [
+                "visa sponsor", "sponsorship", "sponsor visa",
+                "work authorization", "immigration"
+            ])
+            is_remote = "remote" in card_text
+
+            if visa_sponsorship and not has_sponsorship:
+                continue
+
+            if title_elem is not None and company_elem is not None:
+                job_id = ""
+                job_url = ""
+
+                if link_elem is not None:
+                    job_id = html.attr(link_elem, "data-jk")
+                    href = html.attr(link_elem, "href")
+                    if href.startswith("/"):
+                        job_url = f"https://{domain}{href}"
+                    else:
+                        job_url = href
+
+                jobs.append(JobPosting(
+                    title=html.text(title_elem),
+                    company=html.text(company_elem),
+                    location=html.text(location_elem) if location_elem is not None else "",
+                    url=job_url,
+                    source_job_id=job_id,
+                    posted_date=html.text(date_elem) if date_elem is not None else "",
+                    source="indeed",
+                    has_sponsorship=has_sponsorship,
+                    is_remote=is_remote,
+                    work_mode="remote" if is_remote else work_mode,
+                ))
+
+        except Exception as e:
+            logger.warning(f"Failed to parse Indeed job card: {e}")
+            continue
+
+    return jobs
+
+
+def parse_job_details(content: str, job_url: str, backend: Optional[str] = None) -> JobPosting:
+    """Parse an Indeed job page into a posting (fields missing from the page stay empty)."""
+    html = get_backend(backend)
+    doc = html.parse(content)
 
-class IndeedScraper:
+    title = html.select_one(doc, _DETAILS_TITLE)
+    company = html.select_one(doc, _DETAILS_COMPANY)
+    location_elem = html.select_one(doc, _DETAILS_LOCATION)
+    description = html.select_one(doc, _DETAILS_DESCRIPTION)
+    salary = html.select_one(doc, _DETAILS_SALARY)
+
+    desc_text = html.text(description, strip=False).lower() if description is not None else ""
+
+    return JobPosting(
+        title=html.text(title) if title is not None else "",
+        company=html.text(company) if company is not None else "",
+        location=html.text(location_elem) if location_elem is not None else "",
+        description=html.text(description) if description is not None else "",
+        salary_range=html.text(salary) if salary is not None else "",
+        url=job_url,
+        source="indeed",
+        is_remote="remote" in desc_text,
+        has_sponsorship=any(kw in desc_text for kw in [
+            "visa sponsor", "sponsorship", "work authorization"
+        ]),
+    )
+
+
+class IndeedScraper(HTTPClientMixin):
     """Indeed job scraper with httpx (no browser required)."""
 
     # Country-specific Indeed domains
@@ -110,6 +228,7 @@ class IndeedScraper:
         query_string = urlencode({k: v for k, v in params.items() if v})
         return f"https://{domain}/jobs?{query_string}"
 
+    @guarded(fallback=list)
     async def search_jobs_advanced(
         self,
         keywords: str,
@@ -122,103 +241,42 @@ class IndeedScraper:
         posted_within: str = "any",
         visa_sponsorship: bool = False,
         limit: int = 20,
-    ) -> list[dict]:
+    ) -> list[JobPosting]:
         """Advanced job search with all filters."""
-        jobs = []
+        url = self._build_search_url(
+            keywords=keywords,
+            location=location,
+            country=country,
+            city=city,
+            job_type=job_type,
+            work_mode=work_mode,
+            posted_within=posted_within,
+            visa_sponsorship=visa_sponsorship,
+        )
 
-        try:
-            url = self._build_search_url(
-                keywords=keywords,
-                location=location,
-                country=country,
-                city=city,
-                job_type=job_type,
-                work_mode=work_mode,
-                posted_within=posted_within,
-                visa_sponsorship=visa_sponsorship,
-            )
-
-            logger.info(f"Indeed search URL: {url}")
-
-            async with httpx.AsyncClient(headers=self.headers, follow_redirects=True, timeout=30.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                content = response.text
-
-            soup = BeautifulSoup(content, "lxml")
-
-            # Find job cards
-            job_cards = soup.select(".job_seen_beacon, .jobsearch-ResultsList > li, .resultContent")[:limit]
-
-            if not job_cards:
-                # Try alternative selectors
-                job_cards = soup.select("[data-testid='job-result'], .tapItem")[:limit]
-
-            logger.info(f"Found {len(job_cards)} job cards")
-
-            for card in job_cards:
-                try:
-                    title_elem = card.select_one(
-                        ".jobTitle span, [data-testid='job-title'], .jcs-JobTitle, h2.jobTitle a"
-                    )
-                    company_elem = card.select_one(
-                        "[data-testid='company-name'], .companyName, .company, span.css-92r8pb"
-                    )
-                    location_elem = card.select_one(
-                        "[data-testid='text-location'], .companyLocation, .location"
-                    )
-                    link_elem = card.select_one("a.jcs-JobTitle, a[data-jk], h2.jobTitle a")
-                    date_elem = card.select_one(".date, [data-testid='myJobsStateDate'], .css-1yxxt5t")
-
-                    card_text = card.get_text().lower()
-                    has_sponsorship = any(kw in card_text for kw in [
-                        "visa sponsor", "sponsorship", "sponsor visa",
-                        "work authorization", "immigration"
-                    ])
-                    is_remote = "remote" in card_text
-
-                    if visa_sponsorship and not has_sponsorship:
-                        continue
-
-                    if title_elem and company_elem:
-                        job_id = ""
-                        job_url = ""
-
-                        if link_elem:
-                            job_id = link_elem.get("data-jk", "")
-                            href = link_elem.get("href", "")
-                            if href.startswith("/"):
-                                domain = self._get_domain(country)
-                                job_url = f"https://{domain}{href}"
-                            else:
-                                job_url = href
-
-                        job_data = {
-                            "title": title_elem.get_text(strip=True),
-                            "company": company_elem.get_text(strip=True),
-                            "location": location_elem.get_text(strip=True) if location_elem else "",
-                            "url": job_url,
-                            "source_job_id": job_id,
-                            "posted_time": date_elem.get_text(strip=True) if date_elem else "",
-                            "source": self.source_name,
-                            "has_sponsorship": has_sponsorship,
-                            "is_remote": is_remote,
-                            "work_mode": "remote" if is_remote else work_mode,
-                        }
-                        jobs.append(job_data)
-
-                except Exception as e:
-                    logger.warning(f"Failed to parse Indeed job card: {e}")
-                    continue
-
-            await asyncio.sleep(2)  # Rate limiting
+        logger.info(f"Indeed search URL: {url}")
 
-        except Exception as e:
-            logger.error(f"Indeed search error: {e}")
+        response = await self.http.get(url, headers=self.headers, follow_redirects=True)
+        response.raise_for_status()
+        content = response.text
+        domain = self._get_domain(country)
+        page_archive.submit(
+            self.source_name, "search", str(response.url), content,
+            meta={"domain": domain, "work_mode": work_mode, "visa_sponsorship": visa_sponsorship},
+        )
+
+        jobs = await parse_executor.run(
+            parse_search_page,
+            content,
+            limit,
+            domain,
+            work_mode=work_mode,
+            visa_sponsorship=visa_sponsorship,
+        )
 
         return jobs
 
-    async def search_jobs(self, query: str, location: str = "", limit: int = 10) -> list[dict]:
+    async def search_jobs(self, query: str, location: str = "", limit: int = 10) -> list[JobPosting]:
         """Basic search (backwards compatible)."""
         return await self.search_jobs_advanced(
             keywords=query,
@@ -226,50 +284,15 @@ class IndeedScraper:
             limit=limit,
         )
 
-    async def get_job_details(self, job_url: str) -> dict:
+    @guarded(fallback=lambda: None)
+    async def get_job_details(self, job_url: str) -> Optional[JobPosting]:
         """Get detailed job information from Indeed."""
-        details = {}
+        response = await self.http.get(job_url, headers=self.headers, follow_redirects=True)
+        response.raise_for_status()
+        content = response.text
+        page_archive.submit(self.source_name, "details", job_url, content)
 
-        try:
-            async with httpx.AsyncClient(headers=self.headers, follow_redirects=True, timeout=30.0) as client:
-                response = await client.get(job_url)
-                response.raise_for_status()
-                content = response.text
-
-            soup = BeautifulSoup(content, "lxml")
-
-            title = soup.select_one(
-                "[data-testid='jobsearch-JobInfoHeader-title'], .jobsearch-JobInfoHeader-title"
-            )
-            company = soup.select_one(
-                "[data-testid='inlineHeader-companyName'], .jobsearch-InlineCompanyRating-companyHeader"
-            )
-            location_elem = soup.select_one(
-                "[data-testid='inlineHeader-companyLocation'], .jobsearch-JobInfoHeader-subtitle"
-            )
-            description = soup.select_one("#jobDescriptionText, .jobsearch-jobDescriptionText")
-            salary = soup.select_one("#salaryInfoAndJobType, [data-testid='attribute_snippet_testid']")
-
-            desc_text = description.get_text().lower() if description else ""
-
-            details = {
-                "title": title.get_text(strip=True) if title else "",
-                "company": company.get_text(strip=True) if company else "",
-                "location": location_elem.get_text(strip=True) if location_elem else "",
-                "description": description.get_text(strip=True) if description else "",
-                "salary_range": salary.get_text(strip=True) if salary else "",
-                "url": job_url,
-                "source": self.source_name,
-                "is_remote": "remote" in desc_text,
-                "has_sponsorship": any(kw in desc_text for kw in [
-                    "visa sponsor", "sponsorship", "work authorization"
-                ]),
-            }
-
-            await asyncio.sleep(2)  # Rate limiting
-
-        except Exception as e:
-            logger.error(f"Failed to get Indeed job details: {e}")
+        details = await parse_executor.run(parse_job_details, content, job_url)
 
         return details
 
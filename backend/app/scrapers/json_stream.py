@@ -0,0 +1,45 @@
+"""
+JSON Stream - incremental decoding of large JSON arrays
+
+Yields the elements of a top-level JSON array one at a time with ijson
+(C yajl2 backend when available), either from bytes already in memory or
+straight from an httpx response stream. Callers filter while decoding and
+stop once they have enough, so only one element is materialized at a time.
+"""
+
+import io
+from typing import AsyncIterator, Iterator
+import httpx
+import ijson
+
+try:
+    _ijson = ijson.get_backend("yajl2_c")
+except ImportError:
+    _ijson = ijson
+
+
+class _ResponseReader:
+    """Minimal async file object over an httpx streaming response, for ijson."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str; don't consume a chunk for it
+        if size == 0:
+            return b""
+        # ijson treats an empty read as EOF, so skip any empty chunks
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+def iter_json_items(body: bytes, prefix: str = "item") -> Iterator:
+    """Yield elements of the JSON array in `body`."""
+    return _ijson.items(io.BytesIO(body), prefix, use_float=True)
+
+
+def aiter_json_items(response: httpx.Response, prefix: str = "item") -> AsyncIterator:
+    """Yield elements of the JSON array as they arrive on `response`."""
+    return _ijson.items_async(_ResponseReader(response), prefix, use_float=True)
@@ -0,0 +1,145 @@
+"""
+Keyword Index - tokenized inverted index over job postings
+
+Maps each term from a posting's title, company and tags to the ids of the
+postings containing it, so keyword filtering becomes set unions (any keyword)
+or intersections (all keywords) instead of a substring scan over every
+posting. Prefix matching keeps short queries like "dev" matching "developer".
+"""
+
+import re
+from bisect import bisect_left
+from typing import Callable, Iterable, Iterator, Optional
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens; keeps tech terms like c++, c# and node.js intact."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def iter_tokens(text: str) -> Iterator[str]:
+    """Lazy `tokenize` for callers that stop after the first few terms."""
+    if text:
+        for match in _TOKEN_RE.finditer(text.lower()):
+            yield match.group()
+
+
+class KeywordIndex:
+    """Inverted index: term -> set of posting ids."""
+
+    def __init__(self):
+        self._terms: dict[str, set[int]] = {}
+        self._sorted_terms: Optional[list[str]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, posting_id: int, *texts: str) -> None:
+        for text in texts:
+            for term in tokenize(text):
+                self._terms.setdefault(term, set()).add(posting_id)
+        self._size = max(self._size, posting_id + 1)
+        self._sorted_terms = None
+
+    @classmethod
+    def build(cls, items: Iterable, fields: Callable[[object], Iterable[str]]) -> "KeywordIndex":
+        """Index `items` by position; `fields` returns the texts to index for one item."""
+        index = cls()
+        for posting_id, item in enumerate(items):
+            index.add(posting_id, *fields(item))
+        return index
+
+    def _lookup(self, term: str, prefix: bool) -> set[int]:
+        if not prefix:
+            return self._terms.get(term, set())
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._terms)
+        matches: set[int] = set()
+        start = bisect_left(self._sorted_terms, term)
+        for candidate in self._sorted_terms[start:]:
+            if not candidate.startswith(term):
+                break
+            matches |= self._terms[candidate]
+        return matches
+
+    def search(self, keywords: str, match_all: bool = False, prefix: bool = True) -> list[int]:
+        """Return matching posting ids in insertion order.
+
+        An empty query matches every posting. With `match_all` every keyword
+        must match; otherwise any keyword is enough.
+        """
+        terms = tokenize(keywords)
+        if not terms:
+            return list(range(self._size))
+
+        result: Optional[set[int]] = None
+        for term in terms:
+            ids = self._lookup(term, prefix)
+            if result is None:
+                result = set(ids)
+            elif match_all:
+                result &= ids
+            else:
+                result |= ids
+            if match_all and not result:
+                break
+        return sorted(result or ())
+
+
+class KeywordMatcher:
+    """Per-posting matcher with the same semantics as KeywordIndex.search.
+
+    For streaming parsers that test postings one at a time and stop early,
+    where building an index over the whole payload would defeat the purpose.
+    """
+
+    def __init__(self, keywords: str, match_all: bool = False, prefix: bool = True):
+        self.terms = tokenize(keywords)
+        self.match_all = match_all
+        self.prefix = prefix
+
+    def matches(self, *texts: str) -> bool:
+        if not self.terms:
+            return True
+        text = " ".join(texts).lower()
+        # A term can only match a token it is a substring of, which rules most postings out untokenized
+        candidates = [term for term in self.terms if term in text]
+        if not candidates or (self.match_all and len(candidates) < len(self.terms)):
+            return False
+        tokens = set(tokenize(text))
+
+        def hit(term: str) -> bool:
+            if term in tokens:
+                return True
+            return self.prefix and any(token.startswith(term) for token in tokens)
+
+        if self.match_all:
+            return all(hit(term) for term in candidates)
+        return any(hit(term) for term in candidates)
+
+
+def filter_items(
+    items: list,
+    fields: Callable[[object], Iterable[str]],
+    keywords: str,
+    limit: int,
+    match_all: bool = False,
+) -> list:
+    """Return up to `limit` items matching `keywords`, preserving feed order.
+
+    One-shot filtering of a fetched payload: a scan that stops at `limit`.
+    Building a KeywordIndex only pays off where it is reused (PostingStore).
+    """
+    matcher = KeywordMatcher(keywords, match_all=match_all)
+    if not matcher.terms:
+        return items[:limit]
+    matched = []
+    for item in items:
+        if matcher.matches(*fields(item)):
+            matched.append(item)
+            if len(matched) >= limit:
+                break
+    return matched
@@ -1,16 +1,176 @@
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from app.core.config import settings
 from app.scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
-from urllib.parse import quote_plus, urlencode
+from app.scrapers.http_client import HTTPClientMixin
+from app.scrapers.pagination import Page as ResultsPage, fetch_pages
+from app.scrapers.html_parser import Selector, get_backend
+from app.scrapers.parse_executor import parse_executor
+from app.scrapers.page_archive import page_archive
+from app.scrapers.circuit_breaker import guarded
+from app.scrapers.posting import JobPosting
+from urllib.parse import quote_plus, urlencode, urlsplit
 from typing import Optional
+import asyncio
 import logging
+import math
+import httpx
 
 logger = logging.getLogger(__name__)
 
-
-class LinkedInScraper(BaseScraper):
+CARD_SELECTOR = ".base-card, .job-search-card"
+
+# Compiled once at import; see app.scrapers.html_parser
+_RESULTS_LIST = Selector("ul.jobs-search__results-list")
+_CARD = Selector(CARD_SELECTOR)
+_CARD_TITLE = Selector(".base-search-card__title, .job-search-card__title")
+_CARD_COMPANY = Selector(".base-search-card__subtitle, .job-search-card__subtitle")
+_CARD_LOCATION = Selector(".job-search-card__location")
+_CARD_LINK = Selector("a.base-card__full-link, a.job-search-card__link")
+_CARD_TIME = Selector("time")
+
+_DETAILS_TITLE = Selector(".top-card-layout__title, .topcard__title")
+_DETAILS_COMPANY = Selector(".topcard__org-name-link, .topcard__flavor--black-link")
+_DETAILS_LOCATION = Selector(".topcard__flavor--bullet")
+_DETAILS_DESCRIPTION = Selector(".description__text, .show-more-less-html__markup")
+_DETAILS_CRITERIA = Selector(".description__job-criteria-item")
+_CRITERIA_HEADER = Selector(".description__job-criteria-subheader")
+_CRITERIA_VALUE = Selector(".description__job-criteria-text")
+
+
+def results_fragment(document: str, backend: Optional[str] = None) -> str:
+    """Cut the results list out of a search document (the whole document if it
+    has none). Parses the document, so call it off the event loop; the replay
+    server uses it to serve the first page as the guest endpoint would.
+    """
+    html = get_backend(backend)
+    results = html.select_one(html.parse(document), _RESULTS_LIST)
+    return html.outer_html(results) if results is not None else document
+
+
+def _parse_card(html, card, work_mode: str, visa_sponsorship: bool) -> Optional[JobPosting]:
+    title_elem = html.select_one(card, _CARD_TITLE)
+    company_elem = html.select_one(card, _CARD_COMPANY)
+    location_elem = html.select_one(card, _CARD_LOCATION)
+    link_elem = html.select_one(card, _CARD_LINK)
+    time_elem = html.select_one(card, _CARD_TIME)
+
+    # Check for sponsorship keywords in listing
+    card_text = html.text(card, strip=False).lower()
+    has_sponsorship = any(kw in card_text for kw in [
+        "visa sponsor", "sponsorship", "sponsor visa",
+        "work permit", "immigration support"
+    ])
+
+    if visa_sponsorship and not has_sponsorship:
+        return None
+    if title_elem is None or company_elem is None:
+        return None
+
+    urn = html.attr(card, "data-entity-urn")
+    return JobPosting(
+        title=html.text(title_elem),
+        company=html.text(company_elem),
+        location=html.text(location_elem) if location_elem is not None else "",
+        url=html.attr(link_elem, "href") if link_elem is not None else "",
+        posted_date=html.attr(time_elem, "datetime") if time_elem is not None else "",
+        source="linkedin",
+        source_job_id=urn.rsplit(":", 1)[-1] if urn else "",
+        has_sponsorship=has_sponsorship,
+        is_remote=work_mode == "remote",
+        work_mode=work_mode if work_mode != "any" else "unknown",
+    )
+
+
+def parse_search_payloads(
+    payloads: list[str],
+    limit: int,
+    work_mode: str = "any",
+    visa_sponsorship: bool = False,
+    backend: Optional[str] = None,
+) -> list[JobPosting]:
+    """Parse job cards from search pages or card fragments, in order, without repeats."""
+    html = get_backend(backend)
+    jobs = []
+    seen = set()
+    for payload in payloads:
+        for card in html.select(html.parse(payload), _CARD):
+            if len(jobs) >= limit:
+                return jobs
+            try:
+                job = _parse_card(html, card, work_mode, visa_sponsorship)
+            except Exception as e:
+                logger.warning(f"Failed to parse LinkedIn job card: {e}")
+                continue
+            if job is None:
+                continue
+            key = job.source_job_id or job.url
+            if key in seen:
+                continue
+            seen.add(key)
+            jobs.append(job)
+    return jobs
+
+
+def parse_job_details(content: str, job_url: str, backend: Optional[str] = None) -> JobPosting:
+    """Parse a rendered job page into a posting (fields missing from the page stay empty)."""
+    html = get_backend(backend)
+    doc = html.parse(content)
+
+    # Extract details
+    title = html.select_one(doc, _DETAILS_TITLE)
+    company = html.select_one(doc, _DETAILS_COMPANY)
+    location_elem = html.select_one(doc, _DETAILS_LOCATION)
+    description = html.select_one(doc, _DETAILS_DESCRIPTION)
+
+    # Check for remote/sponsorship in description
+    desc_text = html.text(description, strip=False).lower() if description is not None else ""
+
+    # Parse criteria (experience level, job type, etc.)
+    job_criteria = {}
+    for item in html.select(doc, _DETAILS_CRITERIA):
+        header = html.select_one(item, _CRITERIA_HEADER)
+        value = html.select_one(item, _CRITERIA_VALUE)
+        if header is not None and value is not None:
+            key = html.text(header).lower().replace(" ", "_")
+            job_criteria[key] = html.text(value)
+
+    return JobPosting(
+        title=html.text(title) if title is not None else "",
+        company=html.text(company) if company is not None else "",
+        location=html.text(location_elem) if location_elem is not None else "",
+        description=html.text(description) if description is not None else "",
+        job_type=job_criteria.get("employment_type", ""),
+        url=job_url,
+        source="linkedin",
+        is_remote="remote" in desc_text,
+        has_sponsorship=any(kw in desc_text for kw in [
+            "visa sponsor", "sponsorship", "work permit"
+        ]),
+        extra=job_criteria or None,
+    )
+
+
+class LinkedInScraper(BaseScraper, HTTPClientMixin):
     """LinkedIn job scraper with advanced filters."""
 
     BASE_URL = "https://www.linkedin.com/jobs/search"
+    # Public endpoint behind the search page's infinite scroll: card fragments, no browser needed
+    GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    GUEST_PAGE_SIZE = 25  # Cards per response; `start` must step by this
+    GUEST_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+        "Accept": "text/html,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+
+    # Pages and their infinite-scroll XHRs; static.licdn.com serves the scripts
+    ALLOWED_DOMAINS = ("linkedin.com", "licdn.com")
+
+    CARD_SELECTOR = CARD_SELECTOR
+    # Infinite scroll fetches further cards as HTML fragments from this endpoint
+    FRAGMENT_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/"
+    SHOW_MORE_SELECTOR = "button.infinite-scroller__show-more-button"
+    DETAILS_SELECTOR = ".top-card-layout__title, .topcard__title, .description__text"
 
     # LinkedIn filter mappings
     TIME_FILTERS = {
@@ -99,6 +259,42 @@ class LinkedInScraper(BaseScraper):
         query_string = urlencode({k: v for k, v in params.items() if v})
         return f"{self.BASE_URL}?{query_string}"
 
+    async def _count_cards(self, page: Page) -> int:
+        return await page.locator(self.CARD_SELECTOR).count()
+
+    async def _load_cards(self, page: Page, limit: int) -> int:
+        """Wait for the first cards, then scroll until `limit` cards exist or no more load.
+
+        Every wait is event-driven (selector / card count); the settings
+        timeouts only cap how long a slow or exhausted page can hold us.
+        """
+        try:
+            await page.wait_for_selector(self.CARD_SELECTOR, timeout=settings.LINKEDIN_PAGE_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            logger.info("LinkedIn: no job cards rendered")
+            return 0
+
+        count = await self._count_cards(page)
+        for _ in range(settings.LINKEDIN_MAX_SCROLLS):
+            if count >= limit:
+                break
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            # Past the first few pages LinkedIn swaps infinite scroll for a button
+            show_more = page.locator(self.SHOW_MORE_SELECTOR)
+            if await show_more.is_visible():
+                await show_more.click()
+            try:
+                await page.wait_for_function(
+                    "([selector, count]) => document.querySelectorAll(selector).length > count",
+                    arg=[self.CARD_SELECTOR, count],
+                    timeout=settings.LINKEDIN_SCROLL_TIMEOUT_MS,
+                )
+            except PlaywrightTimeoutError:
+                break  # Nothing new loaded: end of results
+            count = await self._count_cards(page)
+        return count
+
+    @guarded(fallback=list)
     async def search_jobs_advanced(
         self,
         keywords: str,
@@ -111,86 +307,101 @@ class LinkedInScraper(BaseScraper):
         posted_within: str = "any",
         visa_sponsorship: bool = False,
         limit: int = 20,
-    ) -> list[dict]:
+    ) -> list[JobPosting]:
         """Advanced job search with all filters."""
 
+        url = self._build_search_url(
+            keywords=keywords,
+            location=location,
+            country=country,
+            city=city,
+            job_type=job_type,
+            work_mode=work_mode,
+            experience_level=experience_level,
+            posted_within=posted_within,
+            visa_sponsorship=visa_sponsorship,
+        )
+        logger.info(f"LinkedIn search URL: {url}")
+
+        if settings.LINKEDIN_FETCH_MODE == "http":
+            try:
+                return await self._search_guest_api(urlsplit(url).query, limit, work_mode, visa_sponsorship)
+            except httpx.HTTPError as e:
+                logger.warning(f"LinkedIn guest API failed, falling back to browser: {e}")
+
+        return await self._search_browser(url, limit, work_mode, visa_sponsorship)
+
+    async def _search_guest_api(
+        self, query: str, limit: int, work_mode: str, visa_sponsorship: bool
+    ) -> list[JobPosting]:
+        """Fetch card fragments straight from the guest endpoint, pages in parallel."""
+
+        archive_meta = {"work_mode": work_mode, "visa_sponsorship": visa_sponsorship}
+
+        async def fetch_page(page_number: int) -> ResultsPage:
+            start = (page_number - 1) * self.GUEST_PAGE_SIZE
+            response = await self.http.get(f"{self.GUEST_SEARCH_URL}?{query}&start={start}", headers=self.GUEST_HEADERS)
+            response.raise_for_status()
+            page_archive.submit(self.source_name, "search", str(response.url), response.text, meta=archive_meta)
+            # Past the last result the endpoint answers with an empty body
+            return ResultsPage([response.text], has_next=bool(response.text.strip()))
+
+        payloads = []
+
+        def on_page(items: list) -> bool:
+            payloads.extend(items)
+            return False  # Page count is already sized to the limit
+
+        # Each page request takes its own token in the shared client's transport
+        await fetch_pages(fetch_page, on_page, max_pages=math.ceil(limit / self.GUEST_PAGE_SIZE))
+        return await parse_executor.run(parse_search_payloads, payloads, limit, work_mode, visa_sponsorship)
+
+    async def _search_browser(
+        self, url: str, limit: int, work_mode: str, visa_sponsorship: bool
+    ) -> list[JobPosting]:
         jobs = []
-        page = await self.get_page()
 
-        try:
-            url = self._build_search_url(
-                keywords=keywords,
-                location=location,
-                country=country,
-                city=city,
-                job_type=job_type,
-                work_mode=work_mode,
-                experience_level=experience_level,
-                posted_within=posted_within,
-                visa_sponsorship=visa_sponsorship,
-            )
-
-            logger.info(f"LinkedIn search URL: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await page.wait_for_timeout(3000)
-
-            # Scroll to load more jobs
-            for _ in range(min(5, (limit // 10) + 1)):
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(1500)
-
-            # Parse HTML
-            content = await page.content()
-            soup = BeautifulSoup(content, "lxml")
-
-            # Find job cards
-            job_cards = soup.select(".base-card, .job-search-card")[:limit]
-
-            for card in job_cards:
-                try:
-                    title_elem = card.select_one(".base-search-card__title, .job-search-card__title")
-                    company_elem = card.select_one(".base-search-card__subtitle, .job-search-card__subtitle")
-                    location_elem = card.select_one(".job-search-card__location")
-                    link_elem = card.select_one("a.base-card__full-link, a.job-search-card__link")
-                    time_elem = card.select_one("time")
-
-                    # Check for sponsorship keywords in listing
-                    card_text = card.get_text().lower()
-                    has_sponsorship = any(kw in card_text for kw in [
-                        "visa sponsor", "sponsorship", "sponsor visa",
-                        "work permit", "immigration support"
-                    ])
-
-                    if visa_sponsorship and not has_sponsorship:
-                        continue
-
-                    if title_elem and company_elem:
-                        job_data = {
-                            "title": title_elem.get_text(strip=True),
-                            "company": company_elem.get_text(strip=True),
-                            "location": location_elem.get_text(strip=True) if location_elem else "",
-                            "url": link_elem.get("href") if link_elem else "",
-                            "posted_time": time_elem.get("datetime") if time_elem else "",
-                            "source": self.source_name,
-                            "has_sponsorship": has_sponsorship,
-                            "work_mode": work_mode if work_mode != "any" else "unknown",
-                        }
-                        jobs.append(job_data)
-
-                except Exception as e:
-                    logger.warning(f"Failed to parse LinkedIn job card: {e}")
-                    continue
-
-            await self.rate_limit()
-
-        except Exception as e:
-            logger.error(f"LinkedIn advanced search failed: {e}")
-        finally:
-            await page.close()
+        # Wait out the rate limit before leasing a browser, not while holding one
+        await self.rate_limit(url)
+        async with self.get_page() as page:
+            capture = settings.LINKEDIN_PARSE_MODE == "xhr"
+            fragments: list[tuple[str, asyncio.Future]] = []
+            archive_meta = {"work_mode": work_mode, "visa_sponsorship": visa_sponsorship}
+
+            def on_response(response) -> None:
+                # Keep the card fragments the page fetches while scrolling
+                if self.FRAGMENT_PATH in response.url and response.ok:
+                    fragments.append((response.url, asyncio.ensure_future(response.text())))
+
+            if capture:
+                page.on("response", on_response)
+
+            response = await page.goto(url, wait_until="domcontentloaded")
+            await self._load_cards(page, limit)
+
+            if capture:
+                # First cards come from the navigation response, the rest from fragments.
+                # The document goes to the parse worker whole: cutting out the results
+                # list here would mean building its DOM on the event loop
+                payloads = [await response.text()] if response else []
+                if payloads:
+                    page_archive.submit(self.source_name, "search", url, payloads[0], meta=archive_meta)
+                bodies = await asyncio.gather(*(text for _, text in fragments), return_exceptions=True)
+                for (fragment_url, _), payload in zip(fragments, bodies):
+                    if isinstance(payload, str):
+                        payloads.append(payload)
+                        page_archive.submit(self.source_name, "search", fragment_url, payload, meta=archive_meta)
+                jobs = await parse_executor.run(parse_search_payloads, payloads, limit, work_mode, visa_sponsorship)
+
+            if not jobs:
+                # DOM mode, or nothing usable was captured: serialize and parse the live page
+                content = await page.content()
+                page_archive.submit(self.source_name, "search", url, content, meta=archive_meta)
+                jobs = await parse_executor.run(parse_search_payloads, [content], limit, work_mode, visa_sponsorship)
 
         return jobs
 
-    async def search_jobs(self, query: str, location: str = "", limit: int = 10) -> list[dict]:
+    async def search_jobs(self, query: str, location: str = "", limit: int = 10) -> list[JobPosting]:
         """Basic search (backwards compatible)."""
         return await self.search_jobs_advanced(
             keywords=query,
@@ -198,58 +409,22 @@ class LinkedInScraper(BaseScraper):
             limit=limit,
         )
 
-    async def get_job_details(self, job_url: str) -> dict:
+    @guarded(fallback=lambda: None)
+    async def get_job_details(self, job_url: str) -> Optional[JobPosting]:
         """Get detailed job information from LinkedIn."""
 
-        page = await self.get_page()
-        details = {}
-
-        try:
+        await self.rate_limit(job_url)
+        async with self.get_page() as page:
             await page.goto(job_url, wait_until="domcontentloaded")
-            await page.wait_for_timeout(3000)
+            try:
+                await page.wait_for_selector(self.DETAILS_SELECTOR, timeout=settings.LINKEDIN_PAGE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                logger.info(f"LinkedIn: job details did not render for {job_url}")
 
             content = await page.content()
-            soup = BeautifulSoup(content, "lxml")
-
-            # Extract details
-            title = soup.select_one(".top-card-layout__title, .topcard__title")
-            company = soup.select_one(".topcard__org-name-link, .topcard__flavor--black-link")
-            location_elem = soup.select_one(".topcard__flavor--bullet")
-            description = soup.select_one(".description__text, .show-more-less-html__markup")
-            criteria = soup.select(".description__job-criteria-item")
-
-            # Check for remote/sponsorship in description
-            desc_text = description.get_text().lower() if description else ""
-
-            details = {
-                "title": title.get_text(strip=True) if title else "",
-                "company": company.get_text(strip=True) if company else "",
-                "location": location_elem.get_text(strip=True) if location_elem else "",
-                "description": description.get_text(strip=True) if description else "",
-                "url": job_url,
-                "source": self.source_name,
-                "is_remote": "remote" in desc_text,
-                "has_sponsorship": any(kw in desc_text for kw in [
-                    "visa sponsor", "sponsorship", "work permit"
-                ]),
-            }
-
-            # Parse criteria (experience level, job type, etc.)
-            for item in criteria:
-                header = item.select_one(".description__job-criteria-subheader")
-                value = item.select_one(".description__job-criteria-text")
-                if header and value:
-                    key = header.get_text(strip=True).lower().replace(" ", "_")
-                    details[key] = value.get_text(strip=True)
-
-            await self.rate_limit()
-
-        except Exception as e:
-            logger.error(f"Failed to get LinkedIn job details: {e}")
-        finally:
-            await page.close()
-
-        return details
+
+        page_archive.submit(self.source_name, "details", job_url, content)
+        return await parse_executor.run(parse_job_details, content, job_url)
 
 
 linkedin_scraper = LinkedInScraper()
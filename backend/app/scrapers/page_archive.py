@@ -0,0 +1,220 @@
+"""
+Page Archive - content-addressed store of raw fetched pages
+
+Every LinkedIn/Indeed page body a scraper parses can be kept on disk so it
+can be re-parsed later (python -m app.scrapers.reparse) without touching the
+network: after a selector fix, to backfill new fields, or as a fixed corpus
+for parser benchmarks.
+
+Layout under Settings.PAGE_ARCHIVE_DIR:
+- objects/ab/cdef...zst   zstd-compressed body, named by its SHA-256, so a
+                          page fetched many times unchanged is stored once
+- index.sqlite3           blobs (hash, sizes, last seen) and fetches
+                          (url, source, kind, hash, time, parse arguments)
+
+Writes run in a worker thread off the request path. Once the compressed
+total passes PAGE_ARCHIVE_MAX_BYTES, the least recently seen blobs and their
+fetches are evicted.
+"""
+
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional, Union
+import zstandard
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    content_type TEXT NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_last_seen ON blobs (last_seen);
+CREATE TABLE IF NOT EXISTS fetches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    hash TEXT NOT NULL REFERENCES blobs (hash),
+    fetched_at REAL NOT NULL,
+    meta TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS fetches_source_kind ON fetches (source, kind, fetched_at);
+CREATE INDEX IF NOT EXISTS fetches_url ON fetches (url);
+CREATE INDEX IF NOT EXISTS fetches_hash ON fetches (hash);
+"""
+
+
+@dataclass
+class ArchivedFetch:
+    id: int
+    url: str
+    source: str
+    kind: str  # "search" or "details"
+    hash: str
+    fetched_at: float
+    meta: dict = field(default_factory=dict)  # Arguments the page was parsed with
+
+
+class PageArchive:
+    def __init__(self, root: Union[str, Path], max_bytes: int, level: int = 6):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.level = level
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._pending: set[asyncio.Task] = set()
+
+    # Storage
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            (self.root / "objects").mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.root / "index.sqlite3", check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def _path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest[2:]}.zst"
+
+    def store(
+        self,
+        source: str,
+        kind: str,
+        url: str,
+        body: Union[str, bytes],
+        content_type: str = "text/html",
+        meta: Optional[dict] = None,
+    ) -> str:
+        """Archive one fetched body (blocking). Returns its content hash."""
+        data = body.encode() if isinstance(body, str) else body
+        digest = hashlib.sha256(data).hexdigest()
+        now = time.time()
+        with self._lock:
+            db = self._connect()
+            known = db.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone()
+            if known:
+                db.execute("UPDATE blobs SET last_seen = ? WHERE hash = ?", (now, digest))
+            else:
+                compressed = zstandard.ZstdCompressor(level=self.level).compress(data)
+                path = self._path(digest)
+                path.parent.mkdir(exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(compressed)
+                tmp.replace(path)
+                db.execute(
+                    "INSERT INTO blobs (hash, size, stored_size, content_type, last_seen) VALUES (?, ?, ?, ?, ?)",
+                    (digest, len(data), len(compressed), content_type, now),
+                )
+            db.execute(
+                "INSERT INTO fetches (url, source, kind, hash, fetched_at, meta) VALUES (?, ?, ?, ?, ?, ?)",
+                (url, source, kind, digest, now, json.dumps(meta or {})),
+            )
+            db.commit()
+            if not known:
+                self._evict(db)
+        return digest
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        total = db.execute("SELECT COALESCE(SUM(stored_size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Evict down to 90% so a full archive doesn't evict on every write
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for digest, stored_size in db.execute(
+            "SELECT hash, stored_size FROM blobs ORDER BY last_seen"
+        ).fetchall():
+            if total <= target:
+                break
+            db.execute("DELETE FROM fetches WHERE hash = ?", (digest,))
+            db.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+            self._path(digest).unlink(missing_ok=True)
+            total -= stored_size
+            evicted += 1
+        db.commit()
+        logger.info(f"Page archive evicted {evicted} pages, {total / 1024 / 1024:.1f} MiB kept")
+
+    def load(self, digest: str) -> bytes:
+        return zstandard.ZstdDecompressor().decompress(self._path(digest).read_bytes())
+
+    def fetches(
+        self,
+        source: Optional[str] = None,
+        kind: Optional[str] = None,
+        since: Optional[float] = None,
+        url: Optional[str] = None,
+    ) -> Iterator[ArchivedFetch]:
+        """Archived fetches, oldest first, optionally filtered."""
+        clauses, params = [], []
+        for column, value in (("source", source), ("kind", kind), ("url", url)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("fetched_at >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT id, url, source, kind, hash, fetched_at, meta FROM fetches {where} ORDER BY id", params
+            ).fetchall()
+        for row in rows:
+            yield ArchivedFetch(*row[:6], meta=json.loads(row[6]))
+
+    def stats(self) -> dict:
+        with self._lock:
+            db = self._connect()
+            blobs, size, stored = db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM blobs"
+            ).fetchone()
+            fetches = db.execute("SELECT COUNT(*) FROM fetches").fetchone()[0]
+        return {
+            "pages": blobs,
+            "fetches": fetches,
+            "raw_bytes": size,
+            "stored_bytes": stored,
+            "max_bytes": self.max_bytes,
+        }
+
+    # Async entry points
+
+    def submit(self, source: str, kind: str, url: str, body: Union[str, bytes], **kwargs) -> None:
+        """Archive in a worker thread without holding up the caller (no-op when disabled)."""
+        if not settings.PAGE_ARCHIVE_ENABLED or not body:
+            return
+        task = asyncio.ensure_future(asyncio.to_thread(self.store, source, kind, url, body, **kwargs))
+        self._pending.add(task)
+        task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Page archive write failed: {task.exception()}")
+
+    async def close(self) -> None:
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+page_archive = PageArchive(
+    root=settings.PAGE_ARCHIVE_DIR,
+    max_bytes=settings.PAGE_ARCHIVE_MAX_BYTES,
+    level=settings.PAGE_ARCHIVE_ZSTD_LEVEL,
+)
@@ -0,0 +1,84 @@
+"""
+Pagination - concurrent follow-up page fetches for paginated APIs
+
+The first page tells us how many pages exist (or at least whether there is a
+next one). Follow-up pages are then requested concurrently under a semaphore
+and handed to the caller in page order until it has enough results, so a
+large limit costs roughly one extra round-trip instead of one per page.
+"""
+
+import math
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Page:
+    items: list = field(default_factory=list)
+    has_next: bool = False
+    total_pages: Optional[int] = None  # None when the API doesn't report a total
+
+
+def total_pages(total_items: int, page_size: int) -> Optional[int]:
+    return math.ceil(total_items / page_size) if total_items and page_size else None
+
+
+async def fetch_pages(
+    fetch_page: Callable[[int], Awaitable[Page]],
+    on_page: Callable[[list], bool],
+    max_pages: Optional[int] = None,
+    concurrency: Optional[int] = None,
+) -> int:
+    """Fetch pages 1..N and pass each page's items to `on_page` in order.
+
+    `on_page` returns True once the caller has enough results; pages still in
+    flight are then cancelled. When the total is known all remaining pages are
+    scheduled at once, otherwise they are requested in windows of
+    `concurrency` until a page reports no successor. A failing follow-up page
+    ends pagination with the results gathered so far; a failing first page
+    raises. Returns the number of pages consumed; `max_pages=0` fetches nothing.
+    """
+    if max_pages is None:
+        max_pages = settings.PAGINATION_MAX_PAGES
+    if max_pages <= 0:
+        return 0
+    concurrency = concurrency or settings.PAGINATION_CONCURRENCY
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(page_number: int) -> Page:
+        async with semaphore:
+            return await fetch_page(page_number)
+
+    first = await fetch_page(1)
+    if on_page(first.items) or not first.has_next:
+        return 1
+
+    last_page = min(first.total_pages or max_pages, max_pages)
+    window = last_page if first.total_pages else concurrency
+    next_page = 2
+    consumed = 1
+
+    while next_page <= last_page:
+        stop = min(last_page, next_page + window - 1)
+        tasks = [asyncio.ensure_future(bounded(n)) for n in range(next_page, stop + 1)]
+        next_page = stop + 1
+        try:
+            for page_number, task in enumerate(tasks, start=stop - len(tasks) + 1):
+                try:
+                    page = await task
+                except Exception as e:
+                    logger.warning(f"Page {page_number} failed, keeping {consumed} pages: {e}")
+                    return consumed
+                consumed += 1
+                if on_page(page.items) or not page.has_next or not page.items:
+                    return consumed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return consumed
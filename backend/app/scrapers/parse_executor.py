@@ -0,0 +1,108 @@
+"""
+Parse Executor - CPU-bound HTML/XML parsing off the event loop
+
+Building a DOM for an Indeed or LinkedIn results page, or walking a large RSS
+feed, takes milliseconds of pure CPU. Run inline, every concurrent search
+stalls behind it. Scrapers hand the raw markup plus a module-level parse
+function to `parse_executor.run()`; it runs in a worker process and only the
+normalized JobPostings come back.
+
+Small documents are parsed inline because shipping them to a worker costs
+more than parsing them. Parses that stop early regardless of document size
+(a streaming RSS parse with a small limit) are called through `inline()`
+by the scraper, since pickling a whole feed to a worker would cost more than
+the parse. PARSE_WORKERS=0 parses everything inline.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _payload_size(args: tuple) -> int:
+    size = 0
+    for arg in args:
+        if isinstance(arg, (str, bytes)):
+            size += len(arg)
+        elif isinstance(arg, (list, tuple)):
+            size += sum(len(item) for item in arg if isinstance(item, (str, bytes)))
+    return size
+
+
+class ParseExecutor:
+    def __init__(self, workers: int, inline_max_bytes: int):
+        self.workers = workers
+        self.inline_max_bytes = inline_max_bytes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.offloaded = 0
+        self.inline_calls = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def start(self) -> None:
+        if self.enabled and self._pool is None:
+            # spawn: workers must not inherit the server's event loop, sockets and threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Parse executor started with {self.workers} workers")
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def inline(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call `fn` on the event loop, for parses known to be cheap whatever the payload size."""
+        self.inline_calls += 1
+        return fn(*args, **kwargs)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call `fn(*args, **kwargs)` in a worker process (or inline when small).
+
+        `fn` must be a module-level function and its arguments and result
+        picklable.
+        """
+        if not self.enabled or _payload_size(args) < self.inline_max_bytes:
+            self.inline_calls += 1
+            return fn(*args, **kwargs)
+
+        self.start()
+        pool = self._pool
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(pool, partial(fn, *args, **kwargs))
+        except BrokenProcessPool:
+            # A worker died (OOM, segfault in a C parser); replace the pool and parse inline once.
+            # Shut the broken one down so its management thread and queues go with it
+            logger.error(f"Parse worker died running {fn.__name__}, restarting the pool")
+            pool.shutdown(wait=False, cancel_futures=True)
+            if self._pool is pool:  # Another caller may have replaced it already
+                self._pool = None
+            self.inline_calls += 1
+            return fn(*args, **kwargs)
+        self.offloaded += 1
+        return result
+
+    def status(self) -> dict:
+        return {
+            "workers": self.workers,
+            "started": self._pool is not None,
+            "offloaded": self.offloaded,
+            "inline": self.inline_calls,
+        }
+
+
+parse_executor = ParseExecutor(
+    workers=settings.PARSE_WORKERS,
+    inline_max_bytes=settings.PARSE_INLINE_MAX_BYTES,
+)
@@ -0,0 +1,69 @@
+"""
+Job Posting - the normalized record every source produces
+
+One slotted dataclass replaces the per-source dicts (which disagreed on keys
+like posted_date vs posted_time), with a single conversion to the Job ORM
+model and one to response JSON.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Optional
+from app.models import Job, JobSource
+
+
+@dataclass(slots=True)
+class JobPosting:
+    title: str
+    company: str
+    source: str
+    location: str = ""
+    url: str = ""
+    description: str = ""
+    salary_range: str = ""
+    job_type: str = ""
+    posted_date: str = ""
+    tags: list[str] = field(default_factory=list)
+    source_job_id: str = ""
+    is_remote: bool = False
+    company_logo: str = ""
+    has_sponsorship: bool = False
+    work_mode: str = ""
+    extra: Optional[dict] = None  # Source-specific details (e.g. LinkedIn job criteria)
+    alternates: list[dict] = field(default_factory=list)  # Same job on other boards (source, url, source_job_id)
+
+    @property
+    def job_source(self) -> JobSource:
+        try:
+            return JobSource(self.source)
+        except ValueError:
+            return JobSource.MANUAL
+
+    def to_dict(self) -> dict:
+        """Response JSON for this posting."""
+        data = {name: getattr(self, name) for name in _FIELD_NAMES}
+        extra = data.pop("extra")
+        if extra:
+            data.update(extra)
+        return data
+
+    def to_job(self, user_id: int, **overrides) -> Job:
+        """New Job row for `user_id`; keyword arguments override mapped columns."""
+        values = {
+            "user_id": user_id,
+            "title": self.title,
+            "company_name": self.company,
+            "location": self.location,
+            "description": self.description,
+            "salary_range": self.salary_range,
+            "job_type": self.job_type,
+            "is_remote": self.is_remote,
+            "required_skills": self.tags,
+            "source": self.job_source,
+            "source_url": self.url,
+            "source_job_id": self.source_job_id,
+        }
+        values.update(overrides)
+        return Job(**values)
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(JobPosting))
@@ -0,0 +1,151 @@
+"""
+Rate Limiter - per-host token buckets for outbound requests
+
+Every request to a host first takes a token from that host's bucket. Buckets
+refill at `rate` tokens per second up to `burst`, so a host that has been
+idle answers immediately, while a busy one is held to its rate no matter how
+many searches run at once. Callers reserve a token and sleep only for their
+own place in line; there is no lock to queue behind.
+
+Tiers:
+- in-process buckets (default; per uvicorn worker)
+- Redis (optional, shared by every worker) via Settings.REDIS_URL, updated
+  atomically by a Lua script using the Redis server clock
+"""
+
+import time
+import asyncio
+import logging
+from typing import Optional
+from urllib.parse import urlsplit
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = bucket, ARGV = rate, burst. Reserves one token and returns the
+# wait in milliseconds before it may be used (0 when one was available).
+_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1000)
+if tokens >= 0 then
+    return 0
+end
+return math.ceil(-tokens / rate * 1000)
+"""
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float):
+        self.tokens = tokens
+        self.updated = time.monotonic()
+
+
+class HostRateLimiter:
+    REDIS_PREFIX = "ratelimit:"
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        domain_limits: Optional[dict[str, tuple[float, int]]] = None,
+        redis_enabled: bool = False,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.domain_limits = domain_limits or {}
+        self.redis_enabled = redis_enabled
+        self._buckets: dict[str, _Bucket] = {}
+        self._redis = None
+        self._reserve = None
+        self.throttled = 0
+
+    def limits_for(self, host: str) -> tuple[float, int]:
+        """(rate, burst) for a host: its domain's limits, else the defaults."""
+        for domain, limits in self.domain_limits.items():
+            if host == domain or host.endswith("." + domain):
+                return limits
+        return self.rate, self.burst
+
+    def _memory_reserve(self, host: str, rate: float, burst: int) -> float:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(burst)
+        now = time.monotonic()
+        # Tokens go negative while callers are queued; each waits out its own deficit
+        bucket.tokens = min(burst, bucket.tokens + (now - bucket.updated) * rate) - 1
+        bucket.updated = now
+        return 0.0 if bucket.tokens >= 0 else -bucket.tokens / rate
+
+    def _get_redis(self):
+        if not self.redis_enabled:
+            return None
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(settings.REDIS_URL)
+            self._reserve = self._redis.register_script(_RESERVE_SCRIPT)
+        return self._redis
+
+    async def _redis_reserve(self, host: str, rate: float, burst: int) -> Optional[float]:
+        if self._get_redis() is None:
+            return None
+        try:
+            wait_ms = await self._reserve(keys=[self.REDIS_PREFIX + host], args=[rate, burst])
+        except Exception as e:
+            # Fall back to this worker's buckets rather than failing the request
+            logger.warning(f"Rate limiter Redis call failed, using local buckets: {e}")
+            return None
+        return int(wait_ms) / 1000
+
+    async def acquire(self, url_or_host: str) -> float:
+        """Take a token for the URL's host, sleeping until it is due. Returns the wait."""
+        host = urlsplit(url_or_host).hostname if "/" in url_or_host else url_or_host
+        if not host:
+            return 0.0
+        rate, burst = self.limits_for(host)
+        if rate <= 0:
+            return 0.0  # Unlimited
+
+        wait = await self._redis_reserve(host, rate, burst)
+        if wait is None:
+            wait = self._memory_reserve(host, rate, burst)
+        if wait > 0:
+            self.throttled += 1
+            logger.debug(f"Rate limit: waiting {wait:.2f}s for {host}")
+            await asyncio.sleep(wait)
+        return wait
+
+    def status(self) -> dict:
+        return {
+            "backend": "redis" if self.redis_enabled else "memory",
+            "hosts": len(self._buckets),
+            "throttled": self.throttled,
+        }
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+# Scraped sites: one request per SCRAPE_DELAY_SECONDS once the burst is spent
+_scraped_rate = 1 / settings.SCRAPE_DELAY_SECONDS if settings.SCRAPE_DELAY_SECONDS > 0 else 0
+
+rate_limiter = HostRateLimiter(
+    rate=settings.RATE_LIMIT_DEFAULT_RATE,
+    burst=settings.RATE_LIMIT_DEFAULT_BURST,
+    domain_limits={
+        domain: (_scraped_rate, settings.RATE_LIMIT_SCRAPED_BURST) for domain in settings.RATE_LIMIT_SCRAPED_DOMAINS
+    },
+    redis_enabled=settings.RATE_LIMIT_REDIS_ENABLED,
+)
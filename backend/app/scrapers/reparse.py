@@ -0,0 +1,137 @@
+"""
+Re-parse archived pages into postings, without network I/O
+
+    python -m app.scrapers.reparse [--source indeed] [--kind search]
+        [--since-hours 24] [--backend selectolax] [--output postings.jsonl]
+        [--backfill]
+
+Reads the page archive (see app.scrapers.page_archive) and runs today's
+parsers over every matching fetch, writing one JSON posting per line. A
+summary per source/kind goes to stderr, including fetches that now yield
+nothing, which is how a broken selector shows up.
+
+With --backfill, details pages are also written back to every Job row whose
+source_url is the archived URL, like the enricher does after a live fetch.
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+from collections import Counter
+from typing import Callable, Optional
+from app.scrapers.indeed_scraper import parse_job_details as parse_indeed_job, parse_search_page
+from app.scrapers.linkedin_scraper import parse_job_details as parse_linkedin_job, parse_search_payloads
+from app.scrapers.page_archive import ArchivedFetch, PageArchive, page_archive
+from app.scrapers.posting import JobPosting
+
+# Search pages are re-parsed in full: the limit the live search used only truncated them
+REPARSE_LIMIT = 10_000
+
+
+def _indeed_search(body: str, fetch: ArchivedFetch, backend: Optional[str]) -> list[JobPosting]:
+    meta = fetch.meta
+    return parse_search_page(
+        body, REPARSE_LIMIT, meta.get("domain", "www.indeed.com"),
+        work_mode=meta.get("work_mode", "any"), visa_sponsorship=meta.get("visa_sponsorship", False),
+        backend=backend,
+    )
+
+
+def _linkedin_search(body: str, fetch: ArchivedFetch, backend: Optional[str]) -> list[JobPosting]:
+    meta = fetch.meta
+    return parse_search_payloads(
+        [body], REPARSE_LIMIT,
+        work_mode=meta.get("work_mode", "any"), visa_sponsorship=meta.get("visa_sponsorship", False),
+        backend=backend,
+    )
+
+
+# (source, kind) -> parser(body, fetch, backend)
+PARSERS: dict[tuple[str, str], Callable[[str, ArchivedFetch, Optional[str]], list[JobPosting]]] = {
+    ("indeed", "search"): _indeed_search,
+    ("indeed", "details"): lambda body, fetch, backend: [parse_indeed_job(body, fetch.url, backend=backend)],
+    ("linkedin", "search"): _linkedin_search,
+    ("linkedin", "details"): lambda body, fetch, backend: [parse_linkedin_job(body, fetch.url, backend=backend)],
+}
+
+
+def reparse(
+    archive: PageArchive,
+    source: Optional[str] = None,
+    kind: Optional[str] = None,
+    since: Optional[float] = None,
+    backend: Optional[str] = None,
+):
+    """Yield (fetch, postings) for every archived fetch with a known parser."""
+    for fetch in archive.fetches(source=source, kind=kind, since=since):
+        parser = PARSERS.get((fetch.source, fetch.kind))
+        if parser is None:
+            continue
+        body = archive.load(fetch.hash).decode("utf-8", errors="replace")
+        postings = [p for p in parser(body, fetch, backend) if p.title]
+        yield fetch, postings
+
+
+async def _backfill(details: list[tuple[str, JobPosting]]) -> int:
+    from sqlalchemy import select
+    from app.models import Job, async_session
+    from app.services.job_enricher import apply_details
+
+    updated = 0
+    async with async_session() as db:
+        for url, posting in details:
+            rows = (await db.execute(select(Job).where(Job.source_url == url))).scalars().all()
+            for job in rows:
+                apply_details(job, posting)
+                updated += 1
+        await db.commit()
+    return updated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--source", choices=sorted({source for source, _ in PARSERS}))
+    parser.add_argument("--kind", choices=["search", "details"])
+    parser.add_argument("--since-hours", type=float, help="Only fetches archived in the last N hours")
+    parser.add_argument("--backend", help="HTML parser backend (defaults to HTML_PARSER_BACKEND)")
+    parser.add_argument("--archive", help="Archive directory (defaults to PAGE_ARCHIVE_DIR)")
+    parser.add_argument("--output", help="Write postings here instead of stdout")
+    parser.add_argument("--backfill", action="store_true", help="Update Job rows from re-parsed details pages")
+    args = parser.parse_args()
+
+    archive = page_archive if args.archive is None else PageArchive(args.archive, page_archive.max_bytes)
+    since = time.time() - args.since_hours * 3600 if args.since_hours else None
+    out = open(args.output, "w") if args.output else sys.stdout
+
+    fetches, postings, empty = Counter(), Counter(), Counter()
+    details = []
+    start = time.perf_counter()
+    try:
+        for fetch, parsed in reparse(archive, args.source, args.kind, since, args.backend):
+            key = f"{fetch.source}/{fetch.kind}"
+            fetches[key] += 1
+            postings[key] += len(parsed)
+            if not parsed:
+                empty[key] += 1
+            for posting in parsed:
+                out.write(json.dumps(posting.to_dict()) + "\n")
+            if fetch.kind == "details" and parsed:
+                details.append((fetch.url, parsed[0]))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    for key in sorted(fetches):
+        print(f"{key:<20}{fetches[key]:>6} fetches{postings[key]:>7} postings{empty[key]:>6} empty", file=sys.stderr)
+    print(f"Re-parsed {sum(fetches.values())} fetches in {elapsed:.2f}s", file=sys.stderr)
+
+    if args.backfill and details:
+        updated = asyncio.run(_backfill(details))
+        print(f"Backfilled {updated} job rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+RSS - incremental item parser for RSS feeds
+
+Walks <item> elements with lxml.iterparse and yields one small dict per item,
+freeing each element once read. No document tree is kept, every field is read
+in a single pass over the item's children, and callers can stop iterating as
+soon as they have enough matches.
+"""
+
+import io
+from typing import Iterator
+from lxml import etree
+
+RSS_FIELDS = ("title", "link", "description", "pubDate")
+
+
+def iter_rss_items(body: bytes, fields: tuple[str, ...] = RSS_FIELDS) -> Iterator[dict[str, str]]:
+    """Yield {field: text} for each <item> in an RSS document."""
+    context = etree.iterparse(
+        io.BytesIO(body),
+        events=("end",),
+        tag="item",
+        recover=True,
+        resolve_entities=False,
+        huge_tree=True,
+    )
+    for _, elem in context:
+        item = {}
+        for child in elem:
+            if not isinstance(child.tag, str):
+                continue  # Comments / processing instructions
+            name = etree.QName(child).localname
+            if name in fields and name not in item:
+                item[name] = child.text or ""
+        yield item
+
+        # Drop the item and any already-processed siblings so memory stays flat
+        elem.clear(keep_tail=False)
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
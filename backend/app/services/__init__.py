@@ -1,9 +1,20 @@
 from app.services.ai_service import AIService, ai_service
 from app.services.email_service import EmailService, email_service
+from app.services.job_ingester import PostingStore, JobIngester, posting_store, job_ingester
+from app.services.job_enricher import JobEnricher, job_enricher
+from app.services.saved_searches import SavedSearchRunner, saved_search_runner
 
 __all__ = [
     "AIService",
     "ai_service",
     "EmailService",
     "email_service",
+    "PostingStore",
+    "JobIngester",
+    "posting_store",
+    "job_ingester",
+    "JobEnricher",
+    "job_enricher",
+    "SavedSearchRunner",
+    "saved_search_runner",
 ]
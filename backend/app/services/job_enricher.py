@@ -0,0 +1,141 @@
+"""
+Job Enricher - fetch full details for scraped search results
+
+LinkedIn and Indeed search results only carry what the result cards show:
+no description and usually no salary. The enricher fetches the detail page
+of a batch of saved jobs concurrently, at most MAX_CONCURRENT_SCRAPES at a
+time overall and MAX_CONCURRENT_SCRAPES_PER_HOST per host, and writes each
+result back to its Job row as soon as it arrives.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+from urllib.parse import urlsplit
+from sqlalchemy import select
+from app.core.config import settings
+from app.models import Job, async_session
+from app.scrapers import linkedin_scraper, indeed_scraper
+from app.scrapers.posting import JobPosting
+
+logger = logging.getLogger(__name__)
+
+# Job.source value -> scraper providing get_job_details()
+DETAIL_SCRAPERS = {
+    "linkedin": linkedin_scraper,
+    "indeed": indeed_scraper,
+}
+
+# Job column <- posting field, copied when the detail page has a value
+_DETAIL_COLUMNS = (
+    ("title", "title"),
+    ("company_name", "company"),
+    ("location", "location"),
+    ("description", "description"),
+    ("salary_range", "salary_range"),
+    ("job_type", "job_type"),
+)
+
+
+def apply_details(job: Job, details: JobPosting) -> None:
+    """Copy the fields a detail page provides onto its Job row."""
+    for column, field in _DETAIL_COLUMNS:
+        value = getattr(details, field)
+        if value:
+            setattr(job, column, value)
+    job.is_remote = bool(job.is_remote or details.is_remote)
+
+
+class JobEnricher:
+    def __init__(self, max_concurrent: int, max_per_host: int):
+        self.max_per_host = max_per_host
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.enriched = 0
+        self.failed = 0
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).hostname or ""
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_slots[host]
+
+    async def _fetch(self, source: str, url: str) -> Optional[JobPosting]:
+        # Host slot first, so jobs queued behind a busy host don't hold a global slot
+        async with self._host_slot(url):
+            async with self._slots:
+                return await DETAIL_SCRAPERS[source].get_job_details(url)
+
+    async def _enrich_one(self, job_id: int, source: str, url: str) -> bool:
+        try:
+            details = await self._fetch(source, url)
+        except Exception as e:
+            logger.error(f"Enrichment failed for job {job_id} ({url}): {e}")
+            details = None
+        if details is None or not (details.title or details.description):
+            self.failed += 1
+            return False
+
+        async with async_session() as db:
+            job = await db.get(Job, job_id)
+            if job is None:
+                return False  # Deleted meanwhile
+            apply_details(job, details)
+            await db.commit()
+        self.enriched += 1
+        return True
+
+    async def enrich(self, user_id: int, job_ids: list[int], force: bool = False) -> dict:
+        """Fetch details for the user's jobs in `job_ids`.
+
+        Only LinkedIn/Indeed jobs with a source URL are fetched, and unless
+        `force` only those still missing a description.
+        """
+        async with async_session() as db:
+            rows = (await db.execute(
+                select(Job.id, Job.source, Job.source_url, Job.description).where(
+                    Job.user_id == user_id, Job.id.in_(job_ids)
+                )
+            )).all()
+
+        targets = [
+            (job_id, source.value, url)
+            for job_id, source, url, description in rows
+            if source is not None and source.value in DETAIL_SCRAPERS and url and (force or not description)
+        ]
+        results = await asyncio.gather(*(self._enrich_one(*target) for target in targets))
+        enriched = sum(results)
+        logger.info(f"Enriched {enriched}/{len(targets)} jobs for user {user_id}")
+        return {
+            "requested": len(job_ids),
+            "fetched": len(targets),
+            "enriched": enriched,
+            "failed": len(targets) - enriched,
+        }
+
+    def submit(self, user_id: int, job_ids: list[int]) -> None:
+        """Enrich in the background; rows are updated as details arrive."""
+        if not job_ids:
+            return
+        task = asyncio.create_task(self.enrich(user_id, job_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def status(self) -> dict:
+        return {
+            "running_batches": len(self._tasks),
+            "enriched": self.enriched,
+            "failed": self.failed,
+        }
+
+
+job_enricher = JobEnricher(
+    max_concurrent=settings.MAX_CONCURRENT_SCRAPES,
+    max_per_host=settings.MAX_CONCURRENT_SCRAPES_PER_HOST,
+)
@@ -0,0 +1,132 @@
+"""
+Job Ingester - keeps a local posting store warm for the free sources
+
+A background task pulls every source in FREE_SOURCES on an interval and keeps
+the latest postings in memory, so /jobs/search/free can answer from the store
+instead of waiting on the slowest upstream board.
+
+The store only answers for a source when its snapshot holds the source's
+whole feed, so a keyword search sees what a live call would. Sources that
+search upstream (SEARCHES_SERVER_SIDE) aren't ingested, and a feed larger than
+INGEST_LIMIT_PER_SOURCE is kept for status only; both are searched live.
+"""
+
+import time
+import asyncio
+import logging
+from typing import Optional
+from app.core.config import settings
+from app.scrapers import FREE_SOURCES
+from app.scrapers.keyword_index import KeywordIndex
+from app.scrapers.posting import JobPosting
+
+logger = logging.getLogger(__name__)
+
+
+def _posting_fields(posting: JobPosting) -> tuple[str, str, str]:
+    return posting.title, posting.company, " ".join(posting.tags)
+
+
+class PostingStore:
+    """In-memory store of the latest ingested postings per source.
+
+    Each snapshot is indexed once on ingest, so queries are index lookups.
+    """
+
+    def __init__(self, max_age_seconds: int):
+        self.max_age_seconds = max_age_seconds
+        self._postings: dict[str, list[JobPosting]] = {}
+        self._indexes: dict[str, KeywordIndex] = {}
+        self._updated_at: dict[str, float] = {}
+        self._complete: dict[str, bool] = {}
+
+    def replace(self, source: str, postings: list[JobPosting], complete: bool = True) -> None:
+        """Store a snapshot; `complete` if it holds the source's whole feed."""
+        self._indexes[source] = KeywordIndex.build(postings, _posting_fields)
+        self._postings[source] = postings
+        self._updated_at[source] = time.time()
+        self._complete[source] = complete
+
+    def has(self, source: str) -> bool:
+        """True if the source's whole feed was ingested recently enough to serve from."""
+        updated_at = self._updated_at.get(source)
+        if updated_at is None or not self._complete.get(source):
+            return False
+        return time.time() - updated_at < self.max_age_seconds
+
+    def search(self, source: str, keywords: str = "", limit: int = 20, match_all: bool = False) -> list[JobPosting]:
+        postings = self._postings.get(source, [])
+        index = self._indexes.get(source)
+        if index is None:
+            return []
+        return [postings[i] for i in index.search(keywords, match_all=match_all)[:limit]]
+
+    def status(self) -> dict:
+        now = time.time()
+        return {
+            source: {
+                "postings": len(self._postings.get(source, [])),
+                "complete": self._complete.get(source, False),
+                "age_seconds": int(now - updated_at),
+            }
+            for source, updated_at in self._updated_at.items()
+        }
+
+
+class JobIngester:
+    """Periodically pulls every free source into the posting store."""
+
+    def __init__(self, store: PostingStore, interval_seconds: int, limit_per_source: int):
+        self.store = store
+        self.interval_seconds = interval_seconds
+        self.limit_per_source = limit_per_source
+        self._task: Optional[asyncio.Task] = None
+
+    async def _ingest_source(self, source_name: str, api) -> None:
+        postings = await api.search_jobs("", limit=self.limit_per_source)
+        # Failed pulls raise and empty ones are skipped; either way the previous snapshot stays
+        if postings:
+            # A pull that filled the limit may have left postings a keyword search would find
+            self.store.replace(source_name, postings, complete=len(postings) < self.limit_per_source)
+        logger.info(f"Ingested {len(postings)} postings from {source_name}")
+
+    async def ingest_once(self) -> None:
+        sources = {
+            name: api for name, api in FREE_SOURCES.items() if not getattr(api, "SEARCHES_SERVER_SIDE", False)
+        }
+        results = await asyncio.gather(
+            *(self._ingest_source(name, api) for name, api in sources.items()),
+            return_exceptions=True,
+        )
+        for name, result in zip(sources, results):
+            if isinstance(result, Exception):
+                logger.error(f"Ingest failed for {name}: {result}")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.ingest_once()
+            except Exception as e:
+                logger.error(f"Ingest cycle failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+posting_store = PostingStore(max_age_seconds=settings.INGEST_MAX_AGE_SECONDS)
+job_ingester = JobIngester(
+    store=posting_store,
+    interval_seconds=settings.INGEST_INTERVAL_SECONDS,
+    limit_per_source=settings.INGEST_LIMIT_PER_SOURCE,
+)
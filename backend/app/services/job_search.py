@@ -0,0 +1,114 @@
+"""
+Job Search - LinkedIn/Indeed advanced search, shared by every entry point
+
+/jobs/search/advanced, saved-search reruns and the scrape queue workers all
+run the same code here, so a search gives the same result whether it runs
+in the API process or in a worker (python -m app.workers.scrape).
+"""
+
+import logging
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Job, async_session
+from app.scrapers import FREE_SOURCES, linkedin_scraper, indeed_scraper
+from app.scrapers.fanout import SourceResult, fan_out
+from app.scrapers.posting import JobPosting
+
+logger = logging.getLogger(__name__)
+
+ADVANCED_SCRAPERS = {
+    "linkedin": linkedin_scraper,
+    "indeed": indeed_scraper,
+}
+
+
+def search_location(query: dict) -> str:
+    """Location string for an AdvancedJobSearch body (city, country or location)."""
+    city, country = query.get("city"), query.get("country")
+    if city and country:
+        return f"{city}, {country}"
+    return country or city or query.get("location") or ""
+
+
+def job_overrides(posting: JobPosting) -> dict:
+    """Job column overrides for a posting; remote-only boards always save as remote."""
+    if getattr(FREE_SOURCES.get(posting.source), "REMOTE_ONLY", False):
+        return {"location": posting.location or "Remote", "is_remote": True}
+    return {}
+
+
+async def insert_new_postings(db: AsyncSession, user_id: int, postings: list[JobPosting]) -> list[Job]:
+    """Add postings whose URL the user doesn't have yet (flushed, not committed)."""
+    urls = [posting.url for posting in postings if posting.url]
+    known = set()
+    if urls:
+        known = set((await db.execute(
+            select(Job.source_url).where(Job.user_id == user_id, Job.source_url.in_(urls))
+        )).scalars())
+
+    jobs = []
+    for posting in postings:
+        if posting.url:
+            if posting.url in known:
+                continue
+            known.add(posting.url)
+        job = posting.to_job(user_id, **job_overrides(posting))
+        db.add(job)
+        jobs.append(job)
+    await db.flush()
+    return jobs
+
+
+async def search_advanced(query: dict, posted_within: Optional[str] = None) -> dict[str, SourceResult]:
+    """Run an AdvancedJobSearch body against each requested site concurrently.
+
+    `posted_within` overrides the query's own time filter.
+    """
+    searches = {
+        name: ADVANCED_SCRAPERS[name].search_jobs_advanced(
+            keywords=query["keywords"],
+            location=search_location(query),
+            country=query.get("country"),
+            city=query.get("city"),
+            job_type=query.get("job_type", "any"),
+            work_mode=query.get("work_mode", "any"),
+            experience_level=query.get("experience_level", "any"),
+            posted_within=posted_within or query.get("posted_within", "any"),
+            visa_sponsorship=query.get("visa_sponsorship", False),
+            limit=query.get("limit", 20),
+        )
+        for name in query.get("sources", [])
+        if name in ADVANCED_SCRAPERS
+    }
+    results = await fan_out(searches)
+    for name, result in results.items():
+        if result.status != "ok":
+            logger.error(f"{name} search failed ({result.status}): {result.error}")
+    return results
+
+
+async def run_advanced_search(user_id: int, query: dict) -> dict:
+    """Search, save the user's new jobs, and build the /jobs/search/advanced response."""
+    results = await search_advanced(query)
+    all_jobs = [posting for result in results.values() for posting in result.jobs]
+
+    async with async_session() as db:
+        saved = await insert_new_postings(db, user_id, all_jobs)
+        await db.commit()
+
+    return {
+        "message": f"Found {len(all_jobs)} jobs, saved {len(saved)} new jobs",
+        "search_criteria": {
+            "keywords": query["keywords"],
+            "location": search_location(query),
+            "work_mode": query.get("work_mode", "any"),
+            "posted_within": query.get("posted_within", "any"),
+            "visa_sponsorship": query.get("visa_sponsorship", False),
+        },
+        "source_status": {name: result.status_entry() for name, result in results.items()},
+        "total_found": len(all_jobs),
+        "new_saved": len(saved),
+        "new_job_ids": [job.id for job in saved],
+        "jobs": [posting.to_dict() for posting in all_jobs],
+    }
@@ -0,0 +1,287 @@
+"""
+Saved Searches - rerun stored queries and keep only what is new
+
+Each saved search keeps a high-water mark per source: the newest posted_date
+it has seen, plus the keys (source_job_id, else URL) of recent postings. A
+run drops every posting older than the mark or already seen before anything
+else happens, so only the delta is deduped, checked against the user's jobs
+(one query for the batch) and inserted. Each inserted job is recorded as a
+SavedSearchHit, which is what the "new jobs" feed reads.
+
+LinkedIn/Indeed searches also narrow posted_within to the smallest window
+covering the time since the last run, so the sites return fewer pages.
+Free-board searches are answered from the posting store when it is warm.
+"""
+
+import math
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from sqlalchemy import select, update, or_
+from app.core.config import settings
+from app.models import SavedSearch, SavedSearchHit, SavedSearchKind, async_session
+from app.scrapers import FREE_SOURCES
+from app.scrapers.dedupe import collapse_duplicates
+from app.scrapers.fanout import SourceResult, fan_out
+from app.scrapers.posting import JobPosting
+from app.services.job_ingester import posting_store
+from app.services.job_enricher import job_enricher
+from app.services.job_search import insert_new_postings, search_advanced
+from app.workers.queue import scrape_queue
+
+logger = logging.getLogger(__name__)
+
+# posted_within filters, narrowest first, with the span each covers
+_WINDOWS = (
+    ("24h", 24 * 3600),
+    ("48h", 48 * 3600),
+    ("1week", 7 * 24 * 3600),
+    ("1month", 30 * 24 * 3600),
+)
+
+
+def posted_timestamp(value) -> Optional[float]:
+    """Epoch seconds for a posted_date in any format the sources use, else None.
+
+    Handles epoch seconds/milliseconds, ISO 8601 and RFC 822 (RSS) dates.
+    Relative text such as Indeed's "3 days ago" gives None.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        seconds = float(value)
+    else:
+        text = str(value).strip()
+        try:
+            seconds = float(text)
+        except ValueError:
+            try:
+                parsed = datetime.fromisoformat(text)
+            except ValueError:
+                try:
+                    parsed = parsedate_to_datetime(text)
+                except (TypeError, ValueError):
+                    return None
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.timestamp()
+    return seconds / 1000 if seconds > 1e11 else seconds
+
+
+def _posting_key(posting: JobPosting) -> str:
+    return posting.source_job_id or posting.url
+
+
+def take_new(postings: list[JobPosting], mark: Optional[dict], seen_limit: int) -> tuple[list[JobPosting], dict]:
+    """Split off the postings past `mark`; returns them and the advanced mark.
+
+    A posting is new unless it is dated before the mark or its key was seen
+    by an earlier run. Undated postings rely on the seen keys alone.
+    """
+    mark = mark or {}
+    posted_at = mark.get("posted_at")
+    seen = mark.get("seen", [])
+    seen_keys = set(seen)
+
+    new = []
+    newest = posted_at
+    for posting in postings:
+        timestamp = posted_timestamp(posting.posted_date)
+        if timestamp is not None and (newest is None or timestamp > newest):
+            newest = timestamp
+        key = _posting_key(posting)
+        if key and key in seen_keys:
+            continue
+        if timestamp is not None and posted_at is not None and timestamp < posted_at:
+            continue
+        if key:
+            seen_keys.add(key)
+        new.append(posting)
+
+    new_keys = [key for key in (_posting_key(posting) for posting in new) if key]
+    return new, {"posted_at": newest, "seen": (new_keys + seen)[:seen_limit]}
+
+
+def narrow_window(posted_within: str, elapsed_seconds: Optional[float]) -> str:
+    """The narrowest posted_within covering `elapsed_seconds`, never wider than requested."""
+    if elapsed_seconds is None:
+        return posted_within
+    requested = dict(_WINDOWS).get(posted_within, math.inf)
+    for window, span in _WINDOWS:
+        if elapsed_seconds <= span:
+            return window if span < requested else posted_within
+    return posted_within
+
+
+class SavedSearchRunner:
+    """Runs due saved searches on a schedule and records the new jobs they find."""
+
+    def __init__(self, poll_seconds: int, batch_size: int, max_concurrent: int, seen_limit: int):
+        self.poll_seconds = poll_seconds
+        self.batch_size = batch_size
+        self.seen_limit = seen_limit
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.failed = 0
+        self.new_jobs = 0
+
+    async def _search_advanced(self, query: dict, last_run_at: Optional[datetime]) -> dict[str, SourceResult]:
+        elapsed = None
+        if last_run_at is not None:
+            if last_run_at.tzinfo is None:
+                last_run_at = last_run_at.replace(tzinfo=timezone.utc)
+            elapsed = (datetime.now(timezone.utc) - last_run_at).total_seconds()
+        return await search_advanced(query, narrow_window(query.get("posted_within", "any"), elapsed))
+
+    async def _search_free(self, query: dict) -> dict[str, SourceResult]:
+        results = {}
+        live = {}
+        limit, match_all = query.get("limit_per_source", 10), query.get("match_all", False)
+        for name in query.get("sources", []):
+            if name not in FREE_SOURCES:
+                continue
+            if not query.get("fresh") and posting_store.has(name):
+                jobs = posting_store.search(name, query["keywords"], limit=limit, match_all=match_all)
+                results[name] = SourceResult(name, "ok", 0, jobs)
+            else:
+                live[name] = FREE_SOURCES[name].search_jobs(query["keywords"], limit=limit, match_all=match_all)
+        if live:
+            results.update(await fan_out(live, query.get("deadline_ms") or settings.FREE_SEARCH_DEADLINE_MS))
+        return results
+
+    async def run(self, search_id: int) -> Optional[dict]:
+        """Run one saved search now and store its delta. None if it doesn't exist."""
+        async with async_session() as db:
+            search = await db.get(SavedSearch, search_id)
+        if search is None:
+            return None
+
+        started = datetime.now(timezone.utc)
+        try:
+            if search.kind == SavedSearchKind.ADVANCED:
+                results = await self._search_advanced(search.query, search.last_run_at)
+            else:
+                results = await self._search_free(search.query)
+        except Exception:
+            self.failed += 1
+            raise
+
+        marks = dict(search.high_water_marks or {})
+        delta = []
+        source_status = {}
+        for name, result in results.items():
+            new, marks[name] = take_new(result.jobs, marks.get(name), self.seen_limit)
+            delta.extend(new)
+            source_status[name] = {**result.status_entry(), "new": len(new)}
+        if search.kind == SavedSearchKind.FREE and search.query.get("dedupe", True):
+            delta = collapse_duplicates(delta)
+
+        async with async_session() as db:
+            jobs = await insert_new_postings(db, search.user_id, delta)
+            db.add_all(
+                SavedSearchHit(saved_search_id=search.id, job_id=job.id, user_id=search.user_id) for job in jobs
+            )
+            await db.execute(
+                update(SavedSearch).where(SavedSearch.id == search.id).values(
+                    high_water_marks=marks,
+                    last_run_at=started,
+                    last_new_count=len(jobs),
+                    next_run_at=started + timedelta(minutes=search.interval_minutes),
+                )
+            )
+            await db.commit()
+
+        if search.query.get("enrich_details"):
+            job_enricher.submit(search.user_id, [job.id for job in jobs])
+
+        self.runs += 1
+        self.new_jobs += len(jobs)
+        logger.info(f"Saved search {search.id}: {len(delta)} postings past the mark, {len(jobs)} new jobs")
+        return {
+            "saved_search_id": search.id,
+            "source_status": source_status,
+            "past_mark": len(delta),
+            "new_saved": len(jobs),
+            "job_ids": [job.id for job in jobs],
+        }
+
+    async def _claim(self, search_id: int, interval_minutes: int, now: datetime) -> bool:
+        # Pushing next_run_at forward only if still due makes the claim atomic across workers
+        async with async_session() as db:
+            result = await db.execute(
+                update(SavedSearch)
+                .where(
+                    SavedSearch.id == search_id,
+                    or_(SavedSearch.next_run_at.is_(None), SavedSearch.next_run_at <= now),
+                )
+                .values(next_run_at=now + timedelta(minutes=interval_minutes))
+            )
+            await db.commit()
+        return result.rowcount == 1
+
+    async def _run_claimed(self, search_id: int, user_id: int, interval_minutes: int, now: datetime) -> None:
+        async with self._slots:
+            if not await self._claim(search_id, interval_minutes, now):
+                return
+            try:
+                if settings.SCRAPE_QUEUE_ENABLED:
+                    # Scrape workers run it; this process only schedules
+                    await scrape_queue.enqueue("saved_search", user_id, {"saved_search_id": search_id})
+                else:
+                    await self.run(search_id)
+            except Exception as e:
+                logger.error(f"Saved search {search_id} failed: {e}")
+
+    async def run_due(self) -> None:
+        now = datetime.now(timezone.utc)
+        async with async_session() as db:
+            due = (await db.execute(
+                select(SavedSearch.id, SavedSearch.user_id, SavedSearch.interval_minutes)
+                .where(
+                    SavedSearch.is_active.is_(True),
+                    or_(SavedSearch.next_run_at.is_(None), SavedSearch.next_run_at <= now),
+                )
+                .order_by(SavedSearch.next_run_at)
+                .limit(self.batch_size)
+            )).all()
+        await asyncio.gather(*(self._run_claimed(*row, now) for row in due))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_due()
+            except Exception as e:
+                logger.error(f"Saved search cycle failed: {e}")
+            await asyncio.sleep(self.poll_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "runs": self.runs,
+            "failed": self.failed,
+            "new_jobs": self.new_jobs,
+        }
+
+
+saved_search_runner = SavedSearchRunner(
+    poll_seconds=settings.SAVED_SEARCH_POLL_SECONDS,
+    batch_size=settings.SAVED_SEARCH_BATCH_SIZE,
+    max_concurrent=settings.SAVED_SEARCH_MAX_CONCURRENT,
+    seen_limit=settings.SAVED_SEARCH_SEEN_KEYS,
+)
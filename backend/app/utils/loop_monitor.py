@@ -0,0 +1,72 @@
+"""
+Loop Monitor - event-loop lag sampling
+
+A background task sleeps for a fixed interval and records how late it wakes
+up. Any overshoot is time the loop spent running something else without
+yielding (parsing, JSON encoding, a blocking call), i.e. latency added to
+every request in flight at that moment.
+"""
+
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float, window: int = 600, warn_threshold: float = 0.25):
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+        self._samples: deque[float] = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - started - self.interval)
+            self._samples.append(lag)
+            if lag > self.warn_threshold:
+                logger.warning(f"Event loop blocked for {lag * 1000:.0f}ms")
+
+    def reset(self) -> None:
+        self._samples.clear()
+
+    def snapshot(self) -> dict:
+        """Lag percentiles in milliseconds over the recent window."""
+        if not self._samples:
+            return {"samples": 0}
+        ordered = sorted(self._samples)
+
+        def percentile(p: float) -> float:
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 2)
+
+        return {
+            "samples": len(ordered),
+            "p50_ms": percentile(0.50),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(ordered[-1] * 1000, 2),
+        }
+
+
+loop_monitor = LoopLagMonitor(
+    interval=settings.LOOP_LAG_INTERVAL_MS / 1000,
+    warn_threshold=settings.LOOP_LAG_WARN_MS / 1000,
+)
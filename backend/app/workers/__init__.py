@@ -0,0 +1 @@
+# Workers package: processes that run apart from the API (python -m app.workers.scrape)
@@ -0,0 +1,205 @@
+"""
+Scrape Queue - Redis-backed work queue between the API and scrape workers
+
+The API enqueues a task and answers at once; any number of worker processes
+(python -m app.workers.scrape, on any node sharing REDIS_URL) take tasks and
+run the scrapers. Keys, under Settings.SCRAPE_QUEUE_PREFIX:
+
+- <prefix>:queue         list of waiting task ids (pushed left, taken right)
+- <prefix>:processing    list of task ids a worker has taken
+- <prefix>:task:<id>     hash: kind, user_id, payload, status, attempts,
+                         worker, heartbeat, timestamps, result / error
+
+A worker moves a task id from queue to processing atomically (BLMOVE), so a
+task is never lost between the two, and refreshes its heartbeat while it
+runs. Tasks whose heartbeat is older than SCRAPE_TASK_LEASE_SECONDS (the
+worker died) are put back at the head of the queue. Failed tasks are retried
+up to SCRAPE_TASK_MAX_ATTEMPTS times. Finished tasks expire after
+SCRAPE_TASK_RESULT_TTL_SECONDS.
+"""
+
+import json
+import time
+import uuid
+import logging
+from dataclasses import dataclass
+from typing import Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueuedTask:
+    id: str
+    kind: str  # Handler name, e.g. "advanced_search"
+    user_id: int
+    payload: dict
+    attempts: int
+
+
+class ScrapeQueue:
+    def __init__(self, prefix: str, lease_seconds: int, max_attempts: int, result_ttl_seconds: int):
+        self.prefix = prefix
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.result_ttl_seconds = result_ttl_seconds
+        self._redis = None
+        self._unclaimed: set[str] = set()
+
+    def _get_redis(self):
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self._redis
+
+    @property
+    def _queue_key(self) -> str:
+        return f"{self.prefix}:queue"
+
+    @property
+    def _processing_key(self) -> str:
+        return f"{self.prefix}:processing"
+
+    def _task_key(self, task_id: str) -> str:
+        return f"{self.prefix}:task:{task_id}"
+
+    # API side
+
+    async def enqueue(self, kind: str, user_id: int, payload: dict) -> str:
+        """Queue a task for the workers. Returns its id."""
+        task_id = uuid.uuid4().hex
+        redis = self._get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._task_key(task_id), mapping={
+                "kind": kind,
+                "user_id": user_id,
+                "payload": json.dumps(payload),
+                "status": "queued",
+                "attempts": 0,
+                "enqueued_at": time.time(),
+            })
+            pipe.lpush(self._queue_key, task_id)
+            await pipe.execute()
+        logger.info(f"Queued {kind} task {task_id} for user {user_id}")
+        return task_id
+
+    async def get(self, task_id: str) -> Optional[dict]:
+        """A task's state, with its result once done. None if unknown or expired."""
+        data = await self._get_redis().hgetall(self._task_key(task_id))
+        if not data:
+            return None
+        task = {
+            "id": task_id,
+            "kind": data["kind"],
+            "user_id": int(data["user_id"]),
+            "status": data["status"],
+            "attempts": int(data["attempts"]),
+        }
+        for field in ("enqueued_at", "started_at", "finished_at"):
+            if field in data:
+                task[field] = float(data[field])
+        if "result" in data:
+            task["result"] = json.loads(data["result"])
+        if "error" in data:
+            task["error"] = data["error"]
+        return task
+
+    async def status(self) -> dict:
+        redis = self._get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.llen(self._queue_key)
+            pipe.llen(self._processing_key)
+            queued, processing = await pipe.execute()
+        return {"queued": queued, "processing": processing}
+
+    # Worker side
+
+    async def reserve(self, worker: str, timeout: float = 5) -> Optional[QueuedTask]:
+        """Take the oldest waiting task, blocking up to `timeout` seconds."""
+        redis = self._get_redis()
+        task_id = await redis.blmove(self._queue_key, self._processing_key, timeout, "RIGHT", "LEFT")
+        if task_id is None:
+            return None
+        key = self._task_key(task_id)
+        now = time.time()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"status": "running", "worker": worker, "started_at": now, "heartbeat": now})
+            pipe.hincrby(key, "attempts", 1)
+            pipe.hmget(key, "kind", "user_id", "payload")
+            _, attempts, (kind, user_id, payload) = await pipe.execute()
+        if kind is None:
+            # Hash expired or was deleted while queued
+            await redis.lrem(self._processing_key, 1, task_id)
+            await redis.delete(key)
+            return None
+        return QueuedTask(task_id, kind, int(user_id), json.loads(payload), attempts)
+
+    async def heartbeat(self, task_id: str) -> None:
+        await self._get_redis().hset(self._task_key(task_id), "heartbeat", time.time())
+
+    async def _finish(self, task_id: str, fields: dict) -> None:
+        key = self._task_key(task_id)
+        async with self._get_redis().pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={**fields, "finished_at": time.time()})
+            pipe.expire(key, self.result_ttl_seconds)
+            pipe.lrem(self._processing_key, 1, task_id)
+            await pipe.execute()
+
+    async def complete(self, task: QueuedTask, result: dict) -> None:
+        await self._finish(task.id, {"status": "done", "result": json.dumps(result, default=str)})
+
+    async def fail(self, task: QueuedTask, error: str, retry: bool = True) -> None:
+        """Requeue a failed task, or mark it failed once out of attempts."""
+        if retry and task.attempts < self.max_attempts:
+            logger.warning(f"Task {task.id} attempt {task.attempts} failed, retrying: {error}")
+            await self._requeue(task.id, error)
+            return
+        logger.error(f"Task {task.id} failed after {task.attempts} attempts: {error}")
+        await self._finish(task.id, {"status": "failed", "error": error})
+
+    async def _requeue(self, task_id: str, error: str = "") -> bool:
+        redis = self._get_redis()
+        # Whoever removes it from processing requeues it, so two reapers can't both do it
+        if not await redis.lrem(self._processing_key, 1, task_id):
+            return False
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._task_key(task_id), mapping={"status": "queued", **({"error": error} if error else {})})
+            pipe.rpush(self._queue_key, task_id)  # Head of the queue: it has waited already
+            await pipe.execute()
+        return True
+
+    async def requeue_stale(self) -> int:
+        """Put back tasks whose worker stopped sending heartbeats. Returns how many."""
+        redis = self._get_redis()
+        cutoff = time.time() - self.lease_seconds
+        requeued = 0
+        unclaimed = set()
+        for task_id in await redis.lrange(self._processing_key, 0, -1):
+            heartbeat = await redis.hget(self._task_key(task_id), "heartbeat")
+            if heartbeat is None:
+                # Just taken and not stamped yet; only stale if still unstamped next sweep
+                unclaimed.add(task_id)
+                if task_id not in self._unclaimed:
+                    continue
+            elif float(heartbeat) >= cutoff:
+                continue
+            if await self._requeue(task_id, "worker lease expired"):
+                logger.warning(f"Requeued task {task_id}: worker lease expired")
+                requeued += 1
+        self._unclaimed = unclaimed
+        return requeued
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+scrape_queue = ScrapeQueue(
+    prefix=settings.SCRAPE_QUEUE_PREFIX,
+    lease_seconds=settings.SCRAPE_TASK_LEASE_SECONDS,
+    max_attempts=settings.SCRAPE_TASK_MAX_ATTEMPTS,
+    result_ttl_seconds=settings.SCRAPE_TASK_RESULT_TTL_SECONDS,
+)
@@ -0,0 +1,165 @@
+"""
+Scrape Worker - runs queued scrape tasks outside the API process
+
+    python -m app.workers.scrape [--concurrency 2]
+
+Takes tasks from the Redis scrape queue (see app.workers.queue) and runs
+them with the same scrapers, browser pool and rate limits the API would use.
+Run as many workers on as many nodes as scraping needs; they share nothing
+but REDIS_URL and the database. SIGINT/SIGTERM stop taking new tasks and let
+the ones in flight finish; a worker killed outright has its tasks requeued
+once their lease expires.
+
+Task kinds:
+- advanced_search   an AdvancedJobSearch body; result is the
+                    /jobs/search/advanced response
+- saved_search      {"saved_search_id": id}; runs it like the scheduler does
+"""
+
+import os
+import signal
+import socket
+import asyncio
+import logging
+import argparse
+from typing import Awaitable, Callable
+from app.core.config import settings
+from app.models import engine
+from app.scrapers import create_http_client, bind_http_client
+from app.scrapers.browser_pool import browser_pool
+from app.scrapers.feed_cache import feed_cache
+from app.scrapers.page_archive import page_archive
+from app.scrapers.parse_executor import parse_executor
+from app.scrapers.rate_limiter import rate_limiter
+from app.services import job_enricher, saved_search_runner
+from app.services.job_search import run_advanced_search
+from app.workers.queue import QueuedTask, ScrapeQueue, scrape_queue
+
+logger = logging.getLogger(__name__)
+
+
+async def _advanced_search(user_id: int, payload: dict) -> dict:
+    result = await run_advanced_search(user_id, payload)
+    # Nothing is waiting on a response here, so enrich before reporting done
+    if payload.get("enrich_details") and result["new_job_ids"]:
+        result["enrichment"] = await job_enricher.enrich(user_id, result["new_job_ids"])
+    return result
+
+
+async def _saved_search(user_id: int, payload: dict) -> dict:
+    result = await saved_search_runner.run(payload["saved_search_id"])
+    return result if result is not None else {"message": "Saved search no longer exists"}
+
+
+# Task kind -> handler(user_id, payload) returning the task result
+HANDLERS: dict[str, Callable[[int, dict], Awaitable[dict]]] = {
+    "advanced_search": _advanced_search,
+    "saved_search": _saved_search,
+}
+
+
+class ScrapeWorker:
+    def __init__(self, queue: ScrapeQueue, concurrency: int, task_timeout: float):
+        self.queue = queue
+        self.concurrency = concurrency
+        self.task_timeout = task_timeout
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._stopping = asyncio.Event()
+        self.completed = 0
+        self.failed = 0
+
+    async def _heartbeat(self, task: QueuedTask) -> None:
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            try:
+                await self.queue.heartbeat(task.id)
+            except Exception as e:
+                logger.warning(f"Heartbeat for task {task.id} failed: {e}")
+
+    async def _process(self, task: QueuedTask) -> None:
+        handler = HANDLERS.get(task.kind)
+        if handler is None:
+            await self.queue.fail(task, f"Unknown task kind: {task.kind}", retry=False)
+            self.failed += 1
+            return
+
+        logger.info(f"Running {task.kind} task {task.id} (attempt {task.attempts})")
+        beat = asyncio.create_task(self._heartbeat(task))
+        try:
+            result = await asyncio.wait_for(handler(task.user_id, task.payload), self.task_timeout)
+        except Exception as e:
+            await self.queue.fail(task, str(e) or type(e).__name__)
+            self.failed += 1
+        else:
+            await self.queue.complete(task, result)
+            self.completed += 1
+        finally:
+            beat.cancel()
+
+    async def _consume(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                task = await self.queue.reserve(self.name)
+                if task is not None:
+                    await self._process(task)
+            except Exception as e:
+                logger.error(f"Worker loop error: {e}")
+                await asyncio.sleep(1)
+
+    async def _reap(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.queue.requeue_stale()
+            except Exception as e:
+                logger.error(f"Requeueing stale tasks failed: {e}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.queue.lease_seconds / 2)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        if not self._stopping.is_set():
+            logger.info(f"Worker {self.name} stopping after tasks in flight")
+            self._stopping.set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop)
+
+        http_client = create_http_client()
+        bind_http_client(http_client)
+        if settings.LINKEDIN_FETCH_MODE == "browser":
+            await browser_pool.start()
+        parse_executor.start()
+        logger.info(f"Worker {self.name} taking tasks, {self.concurrency} at a time")
+        try:
+            await asyncio.gather(self._reap(), *(self._consume() for _ in range(self.concurrency)))
+        finally:
+            await job_enricher.stop()
+            bind_http_client(None)
+            await http_client.aclose()
+            await browser_pool.close()
+            parse_executor.close()
+            await feed_cache.close()
+            await rate_limiter.close()
+            await page_archive.close()
+            await self.queue.close()
+            await engine.dispose()
+            logger.info(f"Worker {self.name} stopped: {self.completed} done, {self.failed} failed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.SCRAPE_WORKER_CONCURRENCY, help="Tasks run at once"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    worker = ScrapeWorker(scrape_queue, args.concurrency, settings.SCRAPE_TASK_TIMEOUT_SECONDS)
+    asyncio.run(worker.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Offline benchmarks for the scrapers (run from backend/: python -m benchmarks.<name>)
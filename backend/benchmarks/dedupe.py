@@ -0,0 +1,91 @@
+"""
+Near-duplicate collapse benchmark over a synthetic cross-posted aggregate
+
+    python -m benchmarks.dedupe [--count 2000]
+
+Builds `count` distinct postings and re-posts a share of them on other boards
+with the usual variations (title suffixes, company suffixes, edited or empty
+descriptions), then reports how long collapse_duplicates takes, how many
+clusters it finds and how many merges joined postings of different jobs.
+"""
+
+import argparse
+import random
+import time
+from app.scrapers.dedupe import collapse_duplicates
+from app.scrapers.posting import JobPosting
+
+from benchmarks.fixtures import _COMPANIES, _TAGS, _TITLES
+
+
+def synthetic_crossposted(count: int, seed: int = 11) -> list[JobPosting]:
+    rng = random.Random(seed)
+    postings = []
+    for i in range(count):
+        title = rng.choice(_TITLES)
+        company = f"{rng.choice(_COMPANIES)} {i}"
+        words = [f"{rng.choice(_TAGS)}{rng.randint(0, 50)}" for _ in range(150)]
+        description = "<p>" + " ".join(words) + "</p>"
+        postings.append(JobPosting(
+            title=title, company=company, source="remotive", description=description, url=f"remotive/{i}",
+        ))
+        if i % 3 == 0:
+            edited = words[:5] + ["updated"] + words[6:10] + ["benefits"] + words[10:]
+            postings.append(JobPosting(
+                title=f"{title} (Remote)", company=f"{company} Inc", source="himalayas",
+                description=" ".join(edited), url=f"himalayas/{i}",
+            ))
+        if i % 5 == 0:
+            postings.append(JobPosting(
+                title=title, company=company, source="weworkremotely", url=f"weworkremotely/{i}",
+            ))
+        if i % 7 == 0:
+            # Same ad text under another employer: must stay separate
+            postings.append(JobPosting(
+                title=title, company=f"Other {i}", source="remoteok", description=description, url=f"remoteok/{i}",
+            ))
+    rng.shuffle(postings)
+    return postings
+
+
+def _job_id(url: str) -> str:
+    return url.split("/", 1)[1]
+
+
+def run(count: int = 2000, repeat: int = 5) -> dict:
+    postings = synthetic_crossposted(count)
+    expected = count + len(range(0, count, 7))
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        collapsed = collapse_duplicates(postings)
+    elapsed_ms = (time.perf_counter() - start) / repeat * 1000
+
+    wrong = sum(
+        1
+        for posting in collapsed
+        for alternate in posting.alternates
+        if _job_id(alternate["url"]) != _job_id(posting.url) or alternate["source"] == "remoteok"
+    )
+    return {
+        "postings": len(postings),
+        "expected_clusters": expected,
+        "clusters": len(collapsed),
+        "wrong_merges": wrong,
+        "collapse_ms": round(elapsed_ms, 3),
+        "us_per_posting": round(elapsed_ms * 1000 / len(postings), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=2000, help="Distinct postings before cross-posting")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for key, value in run(args.count, args.repeat).items():
+        print(f"{key:<20}{value}")
+
+
+if __name__ == "__main__":
+    main()
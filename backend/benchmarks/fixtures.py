@@ -0,0 +1,233 @@
+"""
+Benchmark fixtures - recorded or synthetic source payloads and pages
+
+Recorded dumps live in benchmarks/data/ (not committed). Record one with:
+
+    python -m benchmarks.fixtures record remotive|remoteok|weworkremotely|arbeitnow|jobicy|himalayas|nodesk|findwork
+
+When no recording exists, a deterministic synthetic payload with the same
+shape is generated instead so benchmarks still run offline.
+
+LinkedIn and Indeed pages need a browser or get bot-checked, so synthetic
+stand-ins are committed under benchmarks/pages/ instead of captures: LinkedIn's
+guest search page, the seeMoreJobPostings card fragments fetched while
+scrolling it and a job page, and an Indeed results page and job page. They
+follow the sites' markup and card structure, but the scripts, styles and asset
+names padding them out are generated, so their sizes and parse timings are
+indicative only and say nothing exact about real-world pages.
+"""
+
+import sys
+import json
+import random
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent / "data"
+PAGES_DIR = Path(__file__).parent / "pages"
+
+# source -> (feed URL, recorded file name)
+FEEDS = {
+    "remotive": ("https://remotive.com/api/remote-jobs", "remotive.json"),
+    "remoteok": ("https://remoteok.com/api", "remoteok.json"),
+    "weworkremotely": ("https://weworkremotely.com/remote-jobs.rss", "weworkremotely.rss"),
+    "arbeitnow": ("https://www.arbeitnow.com/api/job-board-api", "arbeitnow.json"),
+    "jobicy": ("https://jobicy.com/api/v2/remote-jobs?count=50", "jobicy.json"),
+    "himalayas": ("https://himalayas.app/jobs/api?limit=20", "himalayas.json"),
+    "nodesk": ("https://nodesk.co/remote-jobs/feed/", "nodesk.rss"),
+    "findwork": ("https://findwork.dev/api/jobs/", "findwork.json"),
+}
+
+# JSON sources: where the postings sit in a recorded response
+_ITEMS_KEY = {"remotive": "jobs", "arbeitnow": "data", "jobicy": "jobs", "himalayas": "jobs", "findwork": "results"}
+
+_TITLES = [
+    "Senior Python Developer", "Frontend Engineer (React)", "Full Stack Developer",
+    "DevOps Engineer", "Data Scientist", "Machine Learning Engineer", "Product Designer",
+    "Backend Engineer, Go", "Customer Support Specialist", "Marketing Manager",
+    "Staff Software Engineer", "iOS Developer", "Android Engineer", "QA Automation Engineer",
+    "Site Reliability Engineer", "Node.js Developer", "C++ Systems Engineer", "Technical Writer",
+]
+_COMPANIES = [
+    "Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises",
+    "Cyberdyne", "Soylent", "Vandelay Industries", "Pied Piper", "Aperture Science",
+]
+_TAGS = [
+    "python", "django", "react", "typescript", "javascript", "golang", "aws", "kubernetes",
+    "docker", "sql", "postgres", "machine learning", "design", "figma", "support", "marketing",
+    "node.js", "c++", "rust", "ios", "swift", "android", "kotlin", "qa", "devops", "senior",
+]
+
+
+def synthetic_remoteok(count: int = 5000, seed: int = 42) -> list:
+    """RemoteOK-shaped payload: legal notice first, then postings with HTML descriptions."""
+    rng = random.Random(seed)
+    data: list = [{"legal": "API Terms of Service: synthetic benchmark fixture"}]
+    for i in range(count):
+        title = rng.choice(_TITLES)
+        data.append({
+            "slug": f"remote-{title.lower().replace(' ', '-')}-{i}",
+            "id": str(100000 + i),
+            "epoch": 1700000000 - i * 600,
+            "date": f"2024-01-{(i % 28) + 1:02d}T12:00:00+00:00",
+            "company": rng.choice(_COMPANIES),
+            "company_logo": "",
+            "position": title,
+            "tags": rng.sample(_TAGS, 4),
+            "description": "<p>" + " ".join(rng.choice(_TAGS) for _ in range(300)) + "</p>",
+            "location": "Worldwide",
+            "salary_min": rng.choice([0, 60000, 90000, 120000]),
+            "salary_max": rng.choice([0, 150000, 180000]),
+            "url": f"https://remoteok.com/remote-jobs/{i}",
+        })
+    return data
+
+
+def synthetic_jobs(source: str, count: int = 500, seed: int = 5) -> list[dict]:
+    """Postings shaped like one JSON API's items (remotive, arbeitnow, jobicy, himalayas, findwork)."""
+    rng = random.Random(f"{source}-{seed}")
+    jobs = []
+    for i in range(count):
+        title = rng.choice(_TITLES)
+        company = rng.choice(_COMPANIES)
+        tags = rng.sample(_TAGS, 4)
+        description = "<p>" + " ".join(rng.choice(_TAGS) for _ in range(200)) + "</p>"
+        date = f"2024-01-{(i % 28) + 1:02d}T12:00:00"
+        slug = f"{title.lower().replace(' ', '-')}-{i}"
+        if source == "remotive":
+            job = {
+                "id": 200000 + i, "url": f"https://remotive.com/remote-jobs/{slug}", "title": title,
+                "company_name": company, "company_logo": "", "tags": tags, "job_type": "full_time",
+                "publication_date": date, "candidate_required_location": "Worldwide",
+                "salary": rng.choice(["", "$80k - $120k"]), "description": description,
+            }
+        elif source == "arbeitnow":
+            job = {
+                "slug": slug, "company_name": company, "title": title, "description": description,
+                "remote": rng.random() < 0.5, "url": f"https://www.arbeitnow.com/jobs/{slug}", "tags": tags,
+                "job_types": ["full time"], "location": rng.choice(["Berlin", "Munich", "Hamburg"]),
+                "created_at": 1700000000 - i * 600,
+            }
+        elif source == "jobicy":
+            job = {
+                "id": 300000 + i, "url": f"https://jobicy.com/jobs/{slug}", "jobSlug": slug, "jobTitle": title,
+                "companyName": company, "companyLogo": "", "jobType": ["full-time"], "jobGeo": "Anywhere",
+                "jobExcerpt": description[:300], "pubDate": date,
+                "annualSalaryMin": rng.choice([0, 70000]), "annualSalaryMax": 140000,
+            }
+        elif source == "himalayas":
+            job = {
+                "id": 400000 + i, "slug": slug, "title": title, "companyName": company, "companyLogo": "",
+                "locationRestrictions": rng.choice([[], ["United States"], ["Europe"]]), "categories": tags,
+                "description": description, "pubDate": 1700000000 - i * 600,
+                "minSalary": rng.choice([None, 90000]), "salaryCurrency": "USD",
+            }
+        elif source == "findwork":
+            job = {
+                "id": 500000 + i, "role": title, "company_name": company, "location": "Remote",
+                "remote": True, "url": f"https://findwork.dev/{slug}", "text": description,
+                "date_posted": date, "keywords": tags, "company_logo": "",
+            }
+        else:
+            raise ValueError(f"No synthetic JSON postings for {source}")
+        jobs.append(job)
+    return jobs
+
+
+def synthetic_rss(count: int = 500, seed: int = 7, company_prefix: bool = True) -> bytes:
+    """RSS 2.0 feed shaped like WeWorkRemotely ("Company: Title") or NoDesk (plain titles)."""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        title = rng.choice(_TITLES)
+        if company_prefix:
+            title = f"{rng.choice(_COMPANIES)}: {title}"
+        description = "&lt;p&gt;" + " ".join(rng.choice(_TAGS) for _ in range(250)) + "&lt;/p&gt;"
+        items.append(
+            "<item>"
+            f"<title>{title}</title>"
+            f"<region>Anywhere in the World</region>"
+            f"<description>{description}</description>"
+            f"<pubDate>Mon, {(i % 28) + 1:02d} Jan 2024 12:00:00 +0000</pubDate>"
+            f"<guid>https://example.com/remote-jobs/{i}</guid>"
+            f"<link>https://example.com/remote-jobs/job-{i}/</link>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0"><channel><title>Synthetic feed</title>'
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode()
+
+
+def _recorded(source: str, path: str = "") -> Path:
+    return Path(path) if path else DATA_DIR / FEEDS[source][1]
+
+
+def load_remoteok(path: str = "") -> list:
+    """Load a recorded RemoteOK dump, falling back to the synthetic one."""
+    dump = _recorded("remoteok", path)
+    if dump.exists():
+        return json.loads(dump.read_bytes())
+    return synthetic_remoteok()
+
+
+def load_rss(source: str, path: str = "") -> bytes:
+    """Load a recorded RSS feed (weworkremotely / nodesk), falling back to a synthetic one."""
+    feed = _recorded(source, path)
+    if feed.exists():
+        return feed.read_bytes()
+    return synthetic_rss(company_prefix=source == "weworkremotely")
+
+
+def load_jobs(source: str, path: str = "") -> list[dict]:
+    """Postings of a recorded JSON API response, falling back to synthetic ones."""
+    dump = _recorded(source, path)
+    if dump.exists():
+        return json.loads(dump.read_bytes()).get(_ITEMS_KEY[source], [])
+    return synthetic_jobs(source)
+
+
+def load_linkedin_search() -> tuple[str, list[str]]:
+    """Synthetic LinkedIn search document and the card fragments loaded by scrolling it."""
+    directory = PAGES_DIR / "linkedin"
+    document = (directory / "search_page.html").read_text()
+    fragments = [path.read_text() for path in sorted(directory.glob("see_more_start_*.html"))]
+    return document, fragments
+
+
+def load_linkedin_guest_pages() -> dict[int, str]:
+    """Synthetic LinkedIn result pages by their `start` offset.
+
+    Offset 0 is the whole search document (its first page of cards); the
+    others are the see_more_start_<offset>.html fragments.
+    """
+    directory = PAGES_DIR / "linkedin"
+    pages = {0: (directory / "search_page.html").read_text()}
+    for path in directory.glob("see_more_start_*.html"):
+        pages[int(path.stem.rsplit("_", 1)[1])] = path.read_text()
+    return pages
+
+
+def load_page(source: str, name: str) -> str:
+    """A committed synthetic page, e.g. load_page("indeed", "search_page")."""
+    return (PAGES_DIR / source / f"{name}.html").read_text()
+
+
+def record(source: str) -> Path:
+    """Download the live feed for `source` into benchmarks/data/."""
+    import httpx
+
+    url, file_name = FEEDS[source]
+    response = httpx.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=60.0, follow_redirects=True)
+    response.raise_for_status()
+    DATA_DIR.mkdir(exist_ok=True)
+    target = DATA_DIR / file_name
+    target.write_bytes(response.content)
+    return target
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "record" or sys.argv[2] not in FEEDS:
+        sys.exit(f"usage: python -m benchmarks.fixtures record {{{','.join(FEEDS)}}}")
+    print(f"Recorded {record(sys.argv[2])}")
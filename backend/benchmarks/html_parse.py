@@ -0,0 +1,78 @@
+"""
+HTML parser backend benchmark over synthetic Indeed and LinkedIn pages
+
+    python -m benchmarks.html_parse [--repeat 20]
+
+For each backend in app.scrapers.html_parser (lxml, selectolax, bs4) and each
+synthetic page (see benchmarks.fixtures), reports CPU time per page and per card, and memory allocated
+per card (tracemalloc peak while parsing one page; only Python-side
+allocations are traced, not lxml's or selectolax's C heaps). Also checks
+that every backend extracts exactly the same postings as bs4.
+"""
+
+import argparse
+import time
+import tracemalloc
+from app.scrapers.indeed_scraper import parse_job_details as parse_indeed_job, parse_search_page
+from app.scrapers.linkedin_scraper import parse_job_details as parse_linkedin_job, parse_search_payloads
+from app.scrapers.html_parser import BACKENDS
+
+from benchmarks.fixtures import load_linkedin_search, load_page
+
+
+def _pages() -> dict:
+    document, fragments = load_linkedin_search()
+    search = load_page("indeed", "search_page")
+    indeed_job = load_page("indeed", "job_page")
+    linkedin_job = load_page("linkedin", "job_page")
+    return {
+        "indeed search": lambda b: parse_search_page(search, 100, "ca.indeed.com", backend=b),
+        "indeed job": lambda b: [parse_indeed_job(indeed_job, "job", backend=b)],
+        "linkedin search": lambda b: parse_search_payloads([document, *fragments], 100, backend=b),
+        "linkedin job": lambda b: [parse_linkedin_job(linkedin_job, "job", backend=b)],
+    }
+
+
+def run(repeat: int = 20) -> dict:
+    results = {}
+    for page, parse in _pages().items():
+        reference = [job.to_dict() for job in parse("bs4")]
+        cards = len(reference)
+        for backend in BACKENDS:
+            same = [job.to_dict() for job in parse(backend)] == reference
+
+            start = time.process_time()
+            for _ in range(repeat):
+                parse(backend)
+            cpu_ms = (time.process_time() - start) / repeat * 1000
+
+            tracemalloc.start()
+            parse(backend)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            results[(page, backend)] = {
+                "cards": cards,
+                "same_as_bs4": same,
+                "cpu_ms": round(cpu_ms, 3),
+                "cpu_ms_per_card": round(cpu_ms / cards, 3),
+                "peak_kib_per_card": round(peak / 1024 / cards, 1),
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'page':<17}{'backend':<12}{'cards':>6}{'same':>6}{'cpu ms':>9}{'ms/card':>9}{'KiB/card':>10}")
+    for (page, backend), row in run(args.repeat).items():
+        print(
+            f"{page:<17}{backend:<12}{row['cards']:>6}{str(row['same_as_bs4']):>6}"
+            f"{row['cpu_ms']:>9}{row['cpu_ms_per_card']:>9}{row['peak_kib_per_card']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
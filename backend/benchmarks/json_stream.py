@@ -0,0 +1,79 @@
+"""
+RemoteOK decoding benchmark: full json.loads vs incremental ijson
+
+    python -m benchmarks.json_stream [--dump benchmarks/data/remoteok.json]
+
+Peak traced memory and time to collect LIMIT postings matching a keyword,
+decoding the whole array up front versus decoding one posting at a time
+and stopping at LIMIT.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from app.scrapers.json_stream import iter_json_items
+
+from benchmarks.fixtures import load_remoteok
+
+LIMIT = 20
+KEYWORD = "engineer"
+
+
+def full_decode(body: bytes, limit: int) -> list[dict]:
+    matched = []
+    for job in json.loads(body)[1:]:
+        if len(matched) >= limit:
+            break
+        if KEYWORD in job.get("position", "").lower():
+            matched.append(job)
+    return matched
+
+
+def stream_decode(body: bytes, limit: int) -> list[dict]:
+    matched = []
+    for job in iter_json_items(body):
+        if len(matched) >= limit:
+            break
+        if isinstance(job, dict) and KEYWORD in job.get("position", "").lower():
+            matched.append(job)
+    return matched
+
+
+def measure(fn, body: bytes, limit: int, repeat: int) -> dict:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(body, limit)
+    elapsed_ms = (time.perf_counter() - start) / repeat * 1000
+
+    tracemalloc.start()
+    fn(body, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": round(elapsed_ms, 3), "peak_kib": round(peak / 1024, 1)}
+
+
+def run(dump: str = "", repeat: int = 5) -> dict:
+    body = json.dumps(load_remoteok(dump)).encode()
+    return {
+        "payload_kib": round(len(body) / 1024, 1),
+        "json_loads": measure(full_decode, body, LIMIT, repeat),
+        "ijson_stream": measure(stream_decode, body, LIMIT, repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dump", default="", help="Recorded RemoteOK JSON dump")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.dump, args.repeat)
+    print(f"RemoteOK payload {results['payload_kib']} KiB, limit {LIMIT}")
+    for name in ("json_loads", "ijson_stream"):
+        row = results[name]
+        print(f"{name:<14}{row['ms']:>10} ms{row['peak_kib']:>12} KiB peak")
+
+
+if __name__ == "__main__":
+    main()
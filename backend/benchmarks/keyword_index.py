@@ -0,0 +1,95 @@
+"""
+Keyword filtering benchmark: linear substring scan vs inverted index
+
+    python -m benchmarks.keyword_index [--dump benchmarks/data/remoteok.json]
+
+Compares, over a RemoteOK dump:
+- scan:          the previous per-request `any(kw in title ...)` filter
+- index build:   tokenizing the dump into a KeywordIndex (once per snapshot)
+- index query:   lookups against a prebuilt index (posting store path)
+- build + query: an index built per request, which is why the live path
+                 doesn't do this
+- filter_items:  the live adapter path, a KeywordMatcher scan stopping at the limit
+"""
+
+import argparse
+import time
+from app.scrapers.keyword_index import KeywordIndex, filter_items
+
+from benchmarks.fixtures import load_remoteok
+
+QUERIES = [
+    "python", "react developer", "senior engineer", "devops kubernetes",
+    "data", "design", "go", "node.js", "machine learning", "support",
+]
+LIMIT = 20
+
+
+def _fields(job: dict) -> tuple[str, str, str]:
+    return job.get("position", ""), job.get("company", ""), " ".join(job.get("tags", []))
+
+
+def scan(jobs: list[dict], keywords: str, limit: int) -> list[dict]:
+    keywords_lower = keywords.lower().split()
+    matched = []
+    for job in jobs:
+        if len(matched) >= limit:
+            break
+        title = job.get("position", "").lower()
+        company = job.get("company", "").lower()
+        tags = " ".join(job.get("tags", [])).lower()
+        if not any(kw in title or kw in company or kw in tags for kw in keywords_lower):
+            continue
+        matched.append(job)
+    return matched
+
+
+def _timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(dump: str = "", repeat: int = 20) -> dict:
+    data = load_remoteok(dump)
+    jobs = [job for job in data[1:] if isinstance(job, dict) and "position" in job]
+
+    build_ms = _timed(lambda: KeywordIndex.build(jobs, _fields), repeat)
+    index = KeywordIndex.build(jobs, _fields)
+
+    results = {"postings": len(jobs), "index_build_ms": round(build_ms, 3), "queries": {}}
+    for query in QUERIES:
+        scan_ms = _timed(lambda: scan(jobs, query, LIMIT), repeat)
+        # Full scan (no early exit) is what a query with few matches costs
+        scan_all_ms = _timed(lambda: scan(jobs, query, len(jobs)), repeat)
+        query_ms = _timed(lambda: index.search(query)[:LIMIT], repeat)
+        filter_ms = _timed(lambda: filter_items(jobs, _fields, query, LIMIT), repeat)
+        results["queries"][query] = {
+            "scan_ms": round(scan_ms, 3),
+            "scan_all_ms": round(scan_all_ms, 3),
+            "index_query_ms": round(query_ms, 3),
+            "index_build_and_query_ms": round(build_ms + query_ms, 3),
+            "filter_items_ms": round(filter_ms, 3),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dump", default="", help="Recorded RemoteOK JSON dump")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    results = run(args.dump, args.repeat)
+    print(f"{results['postings']} postings, index build {results['index_build_ms']} ms")
+    print(f"{'query':<20}{'scan':>10}{'scan all':>10}{'index':>10}{'build+q':>10}{'filter':>10}  (ms)")
+    for query, row in results["queries"].items():
+        print(
+            f"{query:<20}{row['scan_ms']:>10}{row['scan_all_ms']:>10}"
+            f"{row['index_query_ms']:>10}{row['index_build_and_query_ms']:>10}{row['filter_items_ms']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
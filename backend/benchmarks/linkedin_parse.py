@@ -0,0 +1,65 @@
+"""
+LinkedIn search parsing benchmark: rendered DOM vs captured XHR fragments
+
+    python -m benchmarks.linkedin_parse [--limit 75]
+
+Uses the synthetic guest search page and its seeMoreJobPostings fragments:
+- dom: page.content() after scrolling (the fragments' cards appended to the
+       results list), parsed whole with BeautifulSoup
+- xhr: the results list cut from the navigation response plus the raw
+       fragments, parsed directly (LINKEDIN_PARSE_MODE=xhr)
+"""
+
+import argparse
+import time
+from app.scrapers.linkedin_scraper import parse_search_payloads, results_fragment
+
+from benchmarks.fixtures import load_linkedin_search
+
+
+def rendered_document(document: str, fragments: list[str]) -> str:
+    """What page.content() returns once scrolling has inserted every fragment."""
+    marker = document.index("</ul>", document.index("jobs-search__results-list"))
+    return document[:marker] + "".join(fragments) + document[marker:]
+
+
+def _timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(limit: int = 75, repeat: int = 20) -> dict:
+    document, fragments = load_linkedin_search()
+    rendered = rendered_document(document, fragments)
+
+    def dom():
+        return parse_search_payloads([rendered], limit)
+
+    def xhr():
+        return parse_search_payloads([results_fragment(document), *fragments], limit)
+
+    dom_jobs, xhr_jobs = dom(), xhr()
+    return {
+        "cards": len(dom_jobs),
+        "same_results": [j.to_dict() for j in dom_jobs] == [j.to_dict() for j in xhr_jobs],
+        "dom_bytes": len(rendered),
+        "xhr_bytes": len(results_fragment(document)) + sum(map(len, fragments)),
+        "dom_ms": round(_timed(dom, repeat), 3),
+        "xhr_ms": round(_timed(xhr, repeat), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--limit", type=int, default=75)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for key, value in run(args.limit, args.repeat).items():
+        print(f"{key:<14}{value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Event-loop lag benchmark: parsing inline vs in parse workers
+
+    python -m benchmarks.loop_lag [--searches 40] [--workers 2] [--backend bs4]
+
+Runs `searches` concurrent searches over the synthetic Indeed, LinkedIn and
+WeWorkRemotely pages (a short simulated network wait, then the parse) once
+with parsing on the event loop and once through a ParseExecutor, sampling
+loop lag the way /health does. Lag is what every other request in flight
+pays while a parse holds the loop.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from app.scrapers.free_job_apis import parse_weworkremotely_feed
+from app.scrapers.indeed_scraper import parse_search_page
+from app.scrapers.linkedin_scraper import parse_search_payloads
+from app.scrapers.parse_executor import ParseExecutor
+from app.utils.loop_monitor import LoopLagMonitor
+
+from benchmarks.fixtures import load_linkedin_search, load_page, synthetic_rss
+
+
+def _parses(backend: str) -> list[tuple]:
+    document, fragments = load_linkedin_search()
+    return [
+        (parse_search_page, load_page("indeed", "search_page"), 100, "ca.indeed.com", "any", False, backend),
+        (parse_search_payloads, [document, *fragments], 100, "any", False, backend),
+        (parse_weworkremotely_feed, synthetic_rss(2000), "", 2000),
+    ]
+
+
+async def _run(executor: ParseExecutor, searches: int, backend: str) -> dict:
+    parses = _parses(backend)
+    rng = random.Random(3)
+    monitor = LoopLagMonitor(interval=0.01, window=100_000)
+
+    async def search(i: int) -> int:
+        await asyncio.sleep(rng.uniform(0, 0.5))  # Responses arrive spread out
+        fn, *args = parses[i % len(parses)]
+        return len(await executor.run(fn, *args))
+
+    if executor.enabled:
+        executor.start()
+        await asyncio.gather(*(executor.run(fn, *args) for fn, *args in parses * executor.workers))
+    monitor.start()
+    start = time.perf_counter()
+    postings = sum(await asyncio.gather(*(search(i) for i in range(searches))))
+    elapsed = time.perf_counter() - start
+    await monitor.stop()
+    executor.close()
+    return {"postings": postings, "wall_s": round(elapsed, 3), **monitor.snapshot()}
+
+
+def run(searches: int = 40, workers: int = 2, backend: str = "selectolax") -> dict:
+    return {
+        "inline": asyncio.run(_run(ParseExecutor(workers=0, inline_max_bytes=0), searches, backend)),
+        f"{workers} workers": asyncio.run(_run(ParseExecutor(workers=workers, inline_max_bytes=0), searches, backend)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--searches", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--backend", default="selectolax")
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'postings':>9}{'wall s':>8}{'p50 ms':>8}{'p99 ms':>8}{'max ms':>8}")
+    for mode, row in run(args.searches, args.workers, args.backend).items():
+        print(
+            f"{mode:<12}{row['postings']:>9}{row['wall_s']:>8}"
+            f"{row['p50_ms']:>8}{row['p99_ms']:>8}{row['max_ms']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
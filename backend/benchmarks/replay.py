@@ -0,0 +1,247 @@
+"""
+Replay server - a local stand-in for every job source, no network needed
+
+    python -m benchmarks.replay [--port 8765] [--latency-ms 20]
+
+Serves the fixtures from benchmarks.fixtures (recorded dumps when present,
+synthetic ones otherwise) for all eight free sources, plus the committed
+synthetic LinkedIn and Indeed pages, answering each the way the real endpoint
+pages and filters. `replay_client()` builds an httpx client whose transport
+rewrites every request to the server, so the real source adapters run
+unmodified:
+
+    with ReplayServer() as server:
+        bind_http_client(replay_client(server))
+        await search_all_free_sources("python")
+
+Requests reach the server as /<original host><original path>.
+"""
+
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+import httpx
+from app.scrapers.linkedin_scraper import LinkedInScraper, results_fragment
+
+from benchmarks.fixtures import load_jobs, load_linkedin_guest_pages, load_page, load_remoteok, load_rss
+
+# (content type, body)
+Payload = tuple[str, bytes]
+
+JSON = "application/json"
+RSS = "application/rss+xml"
+HTML = "text/html; charset=utf-8"
+
+
+def _int(query: dict, name: str, default: int) -> int:
+    try:
+        return int(query.get(name, [default])[0])
+    except ValueError:
+        return default
+
+
+def _json(data) -> Payload:
+    return JSON, json.dumps(data).encode()
+
+
+class Fixtures:
+    """Source payloads, loaded once, and the route table answering from them."""
+
+    ARBEITNOW_PAGE_SIZE = 100
+    FINDWORK_PAGE_SIZE = 100
+
+    def __init__(self):
+        self.jobs = {source: load_jobs(source) for source in ("remotive", "arbeitnow", "jobicy", "himalayas", "findwork")}
+        self.remoteok = json.dumps(load_remoteok()).encode()
+        self.rss = {source: load_rss(source) for source in ("weworkremotely", "nodesk")}
+        self.linkedin_pages = load_linkedin_guest_pages()
+        self.linkedin_pages[0] = results_fragment(self.linkedin_pages[0])
+        self.pages = {
+            ("linkedin", "job"): load_page("linkedin", "job_page").encode(),
+            ("indeed", "search"): load_page("indeed", "search_page").encode(),
+            ("indeed", "job"): load_page("indeed", "job_page").encode(),
+        }
+
+    def route(self, host: str, path: str) -> Optional[Callable[[dict], Optional[Payload]]]:
+        if host.endswith("indeed.com") or host.startswith("www.indeed."):
+            if path.startswith("/jobs"):
+                return lambda query: (HTML, self.pages[("indeed", "search")])
+            return lambda query: (HTML, self.pages[("indeed", "job")])
+        if host.endswith("linkedin.com"):
+            if path.startswith(urlsplit(LinkedInScraper.GUEST_SEARCH_URL).path):
+                return self.linkedin_guest
+            return lambda query: (HTML, self.pages[("linkedin", "job")])
+        return {
+            "remotive.com": self.remotive,
+            "remoteok.com": lambda query: (JSON, self.remoteok),
+            "weworkremotely.com": lambda query: (RSS, self.rss["weworkremotely"]),
+            "www.arbeitnow.com": self.arbeitnow,
+            "jobicy.com": self.jobicy,
+            "himalayas.app": self.himalayas,
+            "nodesk.co": lambda query: (RSS, self.rss["nodesk"]),
+            "findwork.dev": self.findwork,
+        }.get(host)
+
+    def remotive(self, query: dict) -> Payload:
+        jobs = self.jobs["remotive"]
+        return _json({"job-count": len(jobs), "jobs": jobs[:_int(query, "limit", len(jobs))]})
+
+    def arbeitnow(self, query: dict) -> Payload:
+        page = _int(query, "page", 1)
+        start = (page - 1) * self.ARBEITNOW_PAGE_SIZE
+        jobs = self.jobs["arbeitnow"]
+        next_url = f"https://www.arbeitnow.com/api/job-board-api?page={page + 1}"
+        return _json({
+            "data": jobs[start:start + self.ARBEITNOW_PAGE_SIZE],
+            "links": {"next": next_url if start + self.ARBEITNOW_PAGE_SIZE < len(jobs) else None},
+        })
+
+    def jobicy(self, query: dict) -> Payload:
+        return _json({"jobCount": _int(query, "count", 50), "jobs": self.jobs["jobicy"][:_int(query, "count", 50)]})
+
+    def himalayas(self, query: dict) -> Payload:
+        offset, limit = _int(query, "offset", 0), _int(query, "limit", 20)
+        jobs = self.jobs["himalayas"]
+        return _json({"offset": offset, "limit": limit, "totalCount": len(jobs), "jobs": jobs[offset:offset + limit]})
+
+    def findwork(self, query: dict) -> Payload:
+        # Findwork filters server-side
+        terms = query.get("search", [""])[0].lower().split()
+        jobs = [job for job in self.jobs["findwork"] if all(term in job["role"].lower() for term in terms)]
+        page = _int(query, "page", 1)
+        start = (page - 1) * self.FINDWORK_PAGE_SIZE
+        has_next = start + self.FINDWORK_PAGE_SIZE < len(jobs)
+        return _json({
+            "count": len(jobs),
+            "next": f"https://findwork.dev/api/jobs/?page={page + 1}" if has_next else None,
+            "results": jobs[start:start + self.FINDWORK_PAGE_SIZE],
+        })
+
+    def linkedin_guest(self, query: dict) -> Optional[Payload]:
+        # The page for that exact offset. Past the last one the endpoint answers with
+        # an empty body; an offset inside the covered range but without a page is a 404,
+        # so a scraper paging with the wrong step shows up instead of being papered over
+        start = _int(query, "start", 0)
+        if start in self.linkedin_pages:
+            return HTML, self.linkedin_pages[start].encode()
+        if start > max(self.linkedin_pages):
+            return HTML, b""
+        return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        self.server.requests += 1
+        route = self.server.fixtures.route(host, "/" + path)
+        if route is None:
+            self.send_error(404, f"No fixture for {host}/{path}")
+            return
+        payload = route(parse_qs(parts.query))
+        if payload is None:
+            self.send_error(404, f"No page for {self.path}")
+            return
+        content_type, body = payload
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Streaming readers (RemoteOK) hang up once they have enough
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # Quiet: benchmarks issue thousands of requests
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    fixtures: Fixtures
+    latency: float
+    requests: int
+
+
+class ReplayServer:
+    """Replay server on a background thread; use as a context manager."""
+
+    def __init__(self, port: int = 0, latency_ms: float = 0, fixtures: Optional[Fixtures] = None):
+        self._server = _Server(("127.0.0.1", port), _Handler)
+        self._server.fixtures = fixtures or Fixtures()
+        self._server.latency = latency_ms / 1000
+        self._server.requests = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def requests(self) -> int:
+        return self._server.requests
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class ReplayTransport(httpx.AsyncHTTPTransport):
+    """Sends every request to the replay server as /<host><path>."""
+
+    def __init__(self, port: int, **kwargs):
+        super().__init__(**kwargs)
+        self.port = port
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        original = request.url
+        request.url = original.copy_with(
+            scheme="http", host="127.0.0.1", port=self.port, raw_path=b"/" + original.raw_host + original.raw_path
+        )
+        return await super().handle_async_request(request)
+
+
+def replay_client(server: ReplayServer) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=40)
+    return httpx.AsyncClient(transport=ReplayTransport(server.port, limits=limits), timeout=30.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response")
+    args = parser.parse_args()
+
+    server = ReplayServer(args.port, args.latency_ms)
+    print(f"Replaying on http://127.0.0.1:{server.port}/<host>/<path> (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+RSS parsing benchmark: BeautifulSoup tree vs streaming iterparse
+
+    python -m benchmarks.rss_parse [--source weworkremotely|nodesk] [--feed PATH]
+
+Measures parse time and peak traced memory for the previous approach (full
+BeautifulSoup XML tree, item.find() per field) against iter_rss_items, both
+for a full pass and for an early-exit search that stops at LIMIT matches.
+"""
+
+import argparse
+import time
+import tracemalloc
+from bs4 import BeautifulSoup
+from app.scrapers.rss import iter_rss_items
+
+from benchmarks.fixtures import load_rss
+
+LIMIT = 20
+KEYWORD = "engineer"
+
+
+def soup_parse(body: bytes, limit: int) -> list[dict]:
+    soup = BeautifulSoup(body, "xml")
+    jobs = []
+    for item in soup.find_all("item"):
+        if len(jobs) >= limit:
+            break
+        title = item.find("title").text if item.find("title") else ""
+        if KEYWORD not in title.lower():
+            continue
+        jobs.append({
+            "title": title,
+            "description": item.find("description").text if item.find("description") else "",
+            "link": item.find("link").text if item.find("link") else "",
+            "pubDate": item.find("pubDate").text if item.find("pubDate") else "",
+        })
+    return jobs
+
+
+def stream_parse(body: bytes, limit: int) -> list[dict]:
+    jobs = []
+    for item in iter_rss_items(body):
+        if len(jobs) >= limit:
+            break
+        if KEYWORD in item.get("title", "").lower():
+            jobs.append(item)
+    return jobs
+
+
+def measure(fn, body: bytes, limit: int, repeat: int) -> dict:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(body, limit)
+    elapsed_ms = (time.perf_counter() - start) / repeat * 1000
+
+    tracemalloc.start()
+    fn(body, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": round(elapsed_ms, 3), "peak_kib": round(peak / 1024, 1)}
+
+
+def run(source: str = "weworkremotely", feed: str = "", repeat: int = 10) -> dict:
+    body = load_rss(source, feed)
+    return {
+        "feed_kib": round(len(body) / 1024, 1),
+        "full": {
+            "soup": measure(soup_parse, body, 10**9, repeat),
+            "iterparse": measure(stream_parse, body, 10**9, repeat),
+        },
+        f"limit_{LIMIT}": {
+            "soup": measure(soup_parse, body, LIMIT, repeat),
+            "iterparse": measure(stream_parse, body, LIMIT, repeat),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--source", default="weworkremotely", choices=["weworkremotely", "nodesk"])
+    parser.add_argument("--feed", default="", help="Recorded RSS feed file")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    results = run(args.source, args.feed, args.repeat)
+    print(f"{args.source}: {results['feed_kib']} KiB feed")
+    for mode in ("full", f"limit_{LIMIT}"):
+        for parser_name, row in results[mode].items():
+            print(f"{mode:<10}{parser_name:<11}{row['ms']:>10} ms{row['peak_kib']:>12} KiB peak")
+
+
+if __name__ == "__main__":
+    main()
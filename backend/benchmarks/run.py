@@ -0,0 +1,238 @@
+"""
+Benchmark runner - every scraper hot path, results as JSON for regression diffs
+
+    python -m benchmarks.run [--iterations 30] [--concurrency 8] [--latency-ms 20]
+        [--only html] [--output results.json] [--compare previous.json]
+
+Suites:
+- search:  search_all_free_sources, each free source, and LinkedIn (guest API)
+           and Indeed searches, all against the replay server (benchmarks.replay)
+           with `latency_ms` added per response, `concurrency` calls in flight
+- parse:   the RSS and RemoteOK JSON parsers and the Indeed/LinkedIn HTML card
+           and details extraction over the fixtures, in-process
+
+Each case reports throughput (calls/s), p50/p99 latency per call, and peak
+traced memory of one call (Python allocations only). Results are written to
+benchmarks/data/results-<commit>.json by default; with --compare, cases whose
+p50 or throughput got worse by more than --threshold are listed and the
+exit status is 1.
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+from app.core.config import settings
+from app.scrapers import FREE_SOURCES, bind_http_client, indeed_scraper, linkedin_scraper, search_all_free_sources
+from app.scrapers.circuit_breaker import get_breaker
+from app.scrapers.free_job_apis import parse_nodesk_feed, parse_weworkremotely_feed
+from app.scrapers.indeed_scraper import parse_job_details as parse_indeed_job, parse_search_page
+from app.scrapers.json_stream import iter_json_items
+from app.scrapers.linkedin_scraper import parse_job_details as parse_linkedin_job, parse_search_payloads
+from app.scrapers.parse_executor import parse_executor
+
+from benchmarks.fixtures import DATA_DIR, load_linkedin_search, load_page, load_remoteok, load_rss
+from benchmarks.replay import ReplayServer, replay_client
+
+KEYWORDS = "engineer"
+LIMIT = 20
+
+
+def _percentile(ordered: list[float], p: float) -> float:
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def _summary(latencies: list[float], wall: float, items: int, peak: int) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "iterations": len(latencies),
+        "items": items,
+        "throughput_per_s": round(len(latencies) / wall, 2) if wall else None,
+        "p50_ms": round(_percentile(ordered, 0.50) * 1000, 3),
+        "p99_ms": round(_percentile(ordered, 0.99) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def measure_sync(fn: Callable[[], list], iterations: int) -> dict:
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - call_start)
+    wall = time.perf_counter() - start
+
+    tracemalloc.start()
+    items = len(fn())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return _summary(latencies, wall, items, peak)
+
+
+async def measure_async(fn: Callable[[], Awaitable[list]], iterations: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def timed() -> None:
+        async with semaphore:
+            call_start = time.perf_counter()
+            await fn()
+            latencies.append(time.perf_counter() - call_start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(iterations)))
+    wall = time.perf_counter() - start
+
+    tracemalloc.start()
+    items = len(await fn())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return _summary(latencies, wall, items, peak)
+
+
+def parse_cases() -> dict[str, Callable[[], list]]:
+    wwr, nodesk = load_rss("weworkremotely"), load_rss("nodesk")
+    remoteok = json.dumps(load_remoteok()).encode()
+    document, fragments = load_linkedin_search()
+    indeed_search = load_page("indeed", "search_page")
+    indeed_job = load_page("indeed", "job_page")
+    linkedin_job = load_page("linkedin", "job_page")
+    return {
+        "parse.rss.weworkremotely": lambda: parse_weworkremotely_feed(wwr, KEYWORDS, 10**6),
+        "parse.rss.nodesk": lambda: parse_nodesk_feed(nodesk, KEYWORDS, 10**6),
+        "parse.json.remoteok": lambda: list(iter_json_items(remoteok)),
+        "parse.html.indeed_search": lambda: parse_search_page(indeed_search, 10**6, "ca.indeed.com"),
+        "parse.html.indeed_job": lambda: [parse_indeed_job(indeed_job, "job")],
+        "parse.html.linkedin_search": lambda: parse_search_payloads([document, *fragments], 10**6),
+        "parse.html.linkedin_job": lambda: [parse_linkedin_job(linkedin_job, "job")],
+    }
+
+
+def search_cases() -> dict[str, Callable[[], Awaitable[list]]]:
+    cases = {"search.all_free_sources": lambda: search_all_free_sources(KEYWORDS, LIMIT)}
+    for name, api in FREE_SOURCES.items():
+        cases[f"search.{name}"] = lambda api=api: api.search_jobs(KEYWORDS, limit=LIMIT)
+    cases["search.linkedin"] = lambda: linkedin_scraper.search_jobs_advanced(KEYWORDS, limit=LIMIT)
+    cases["search.indeed"] = lambda: indeed_scraper.search_jobs_advanced(KEYWORDS, country="canada", limit=LIMIT)
+    return cases
+
+
+async def run_search(cases: dict, iterations: int, concurrency: int, latency_ms: float) -> dict:
+    results = {}
+    with ReplayServer(latency_ms=latency_ms) as server:
+        client = replay_client(server)
+        bind_http_client(client)
+        try:
+            for name, fn in cases.items():
+                results[name] = await measure_async(fn, iterations, concurrency)
+        finally:
+            bind_http_client(None)
+            await client.aclose()
+    return results
+
+
+def run(
+    iterations: int = 30,
+    concurrency: int = 8,
+    latency_ms: float = 20,
+    only: Optional[str] = None,
+) -> dict:
+    # Every search fetches from the replay server: no feed cache, no LinkedIn browser
+    # fallback, parsing inline so it is what gets measured
+    settings.FEED_CACHE_TTLS = {}
+    settings.FEED_CACHE_DEFAULT_TTL = 0
+    settings.LINKEDIN_FETCH_MODE = "http"
+    parse_executor.workers = 0
+
+    results = {}
+    for name, fn in parse_cases().items():
+        if not only or only in name:
+            results[name] = measure_sync(fn, iterations)
+    searches = {name: fn for name, fn in search_cases().items() if not only or only in name}
+    if searches:
+        results.update(asyncio.run(run_search(searches, iterations, concurrency, latency_ms)))
+
+    tripped = [name for name in FREE_SOURCES if get_breaker(name).state != "closed"]
+    return {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "config": {
+            "iterations": iterations,
+            "concurrency": concurrency,
+            "latency_ms": latency_ms,
+            "html_parser_backend": settings.HTML_PARSER_BACKEND,
+        },
+        "breakers_tripped": tripped,
+        "results": results,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous: dict, current: dict, threshold: float) -> list[str]:
+    """Cases whose p50 latency or throughput got worse by more than `threshold`."""
+    regressions = []
+    for name, row in current["results"].items():
+        before = previous.get("results", {}).get(name)
+        if not before:
+            continue
+        if before["p50_ms"] and row["p50_ms"] > before["p50_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p50 {before['p50_ms']} -> {row['p50_ms']} ms")
+        if before["throughput_per_s"] and row["throughput_per_s"] < before["throughput_per_s"] / (1 + threshold):
+            regressions.append(f"{name}: throughput {before['throughput_per_s']} -> {row['throughput_per_s']}/s")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--concurrency", type=int, default=8, help="Searches in flight")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Replay server delay per response")
+    parser.add_argument("--only", help="Run cases whose name contains this, e.g. parse.html")
+    parser.add_argument("--output", help="Results file (default benchmarks/data/results-<commit>.json)")
+    parser.add_argument("--compare", help="Previous results file to diff against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before a regression")
+    args = parser.parse_args()
+
+    report = run(args.iterations, args.concurrency, args.latency_ms, args.only)
+
+    print(f"{'case':<30}{'items':>7}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>11}")
+    for name, row in report["results"].items():
+        print(
+            f"{name:<30}{row['items']:>7}{row['throughput_per_s']:>10}"
+            f"{row['p50_ms']:>10}{row['p99_ms']:>10}{row['peak_kib']:>11}"
+        )
+    if report["breakers_tripped"]:
+        print(f"Circuit breakers opened during the run: {', '.join(report['breakers_tripped'])}")
+
+    output = Path(args.output) if args.output else DATA_DIR / f"results-{report['commit'] or 'local'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Wrote {output}")
+
+    if args.compare:
+        regressions = compare(json.loads(Path(args.compare).read_text()), report, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
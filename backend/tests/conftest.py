@@ -0,0 +1,56 @@
+"""
+Shared fixtures: the replay server standing in for every job source.
+
+Tests are plain functions that drive coroutines with asyncio.run(); the
+`replay` fixture returns a runner that binds a replay client for the
+duration of one coroutine, so the real source adapters run unmodified and
+offline.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+import pytest
+from app.core.config import settings
+from app.scrapers import bind_http_client
+from app.scrapers import circuit_breaker
+from app.scrapers.parse_executor import parse_executor
+from benchmarks.replay import ReplayServer, replay_client
+
+T = TypeVar("T")
+
+
+@pytest.fixture(scope="session")
+def replay_server():
+    with ReplayServer() as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def offline_settings(monkeypatch):
+    # Every search reaches the replay server: no feed cache, no browser, no worker processes
+    monkeypatch.setattr(settings, "FEED_CACHE_TTLS", {})
+    monkeypatch.setattr(settings, "FEED_CACHE_DEFAULT_TTL", 0)
+    monkeypatch.setattr(settings, "LINKEDIN_FETCH_MODE", "http")
+    monkeypatch.setattr(settings, "SOURCE_LATENCY_BUDGETS_MS", {})
+    monkeypatch.setattr(parse_executor, "workers", 0)
+    # Breakers are module-global; start each test with fresh ones
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+
+
+@pytest.fixture
+def replay(replay_server) -> Callable[[Callable[[], Awaitable[T]]], T]:
+    """Run `make()` against the replay server and return its result."""
+
+    def run(make: Callable[[], Awaitable[T]]) -> T:
+        async def main() -> T:
+            client = replay_client(replay_server)
+            bind_http_client(client)
+            try:
+                return await make()
+            finally:
+                bind_http_client(None)
+                await client.aclose()
+
+        return asyncio.run(main())
+
+    return run
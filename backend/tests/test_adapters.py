@@ -0,0 +1,88 @@
+import math
+import pytest
+from app.scrapers import FREE_SOURCES, indeed_scraper, linkedin_scraper
+from app.scrapers.linkedin_scraper import LinkedInScraper, parse_search_payloads, results_fragment
+from app.scrapers.posting import JobPosting
+from app.services.job_search import job_overrides
+from benchmarks.fixtures import load_linkedin_guest_pages
+
+
+@pytest.mark.parametrize("source", sorted(FREE_SOURCES))
+def test_free_source_parses_postings(replay, source):
+    jobs = replay(lambda: FREE_SOURCES[source].search_jobs("python", limit=5))
+
+    assert 0 < len(jobs) <= 5
+    for job in jobs:
+        assert isinstance(job, JobPosting)
+        assert job.source == source
+        assert job.title and job.company
+        assert job.url
+
+
+@pytest.mark.parametrize("source", sorted(FREE_SOURCES))
+def test_free_source_match_all_keeps_only_matching_postings(replay, source):
+    jobs = replay(lambda: FREE_SOURCES[source].search_jobs("senior python", limit=10, match_all=True))
+
+    for job in jobs:
+        text = " ".join([job.title, job.company, *job.tags]).lower()
+        assert "senior" in text and "python" in text
+
+
+def test_linkedin_guest_search_pages_by_25(replay, replay_server):
+    before = replay_server.requests
+    jobs = replay(lambda: linkedin_scraper.search_jobs_advanced("python", limit=60))
+
+    assert len(jobs) == 60
+    assert replay_server.requests - before == math.ceil(60 / LinkedInScraper.GUEST_PAGE_SIZE)
+    assert len({job.source_job_id for job in jobs}) == 60
+    assert all(job.source == "linkedin" and job.title and job.company for job in jobs)
+
+
+def test_linkedin_guest_search_limit_within_first_page(replay, replay_server):
+    before = replay_server.requests
+    jobs = replay(lambda: linkedin_scraper.search_jobs_advanced("python", limit=10))
+
+    assert len(jobs) == 10
+    assert replay_server.requests - before == 1
+
+
+def test_linkedin_results_fragment_keeps_every_card():
+    document = load_linkedin_guest_pages()[0]
+    fragment = results_fragment(document)
+
+    assert len(fragment) < len(document)
+    assert parse_search_payloads([fragment], 100) == parse_search_payloads([document], 100)
+
+
+def test_linkedin_results_fragment_survives_nested_lists():
+    document = (
+        '<html><body><ul class="jobs-search__results-list">'
+        '<li><div class="base-card" data-entity-urn="urn:li:jobPosting:1">'
+        '<h3 class="base-search-card__title">First</h3><ul><li>Benefits</li></ul>'
+        '<h4 class="base-search-card__subtitle">Acme</h4></div></li>'
+        '<li><div class="base-card" data-entity-urn="urn:li:jobPosting:2">'
+        '<h3 class="base-search-card__title">Second</h3>'
+        '<h4 class="base-search-card__subtitle">Globex</h4></div></li>'
+        "</ul><footer>Footer</footer></body></html>"
+    )
+
+    jobs = parse_search_payloads([results_fragment(document)], 10)
+
+    assert [job.title for job in jobs] == ["First", "Second"]
+
+
+def test_indeed_search_parses_synthetic_page(replay):
+    jobs = replay(lambda: indeed_scraper.search_jobs_advanced("python", country="canada", limit=10))
+
+    assert len(jobs) == 10
+    assert all(job.source == "indeed" and job.title and job.company for job in jobs)
+
+
+def test_remote_only_sources_save_as_remote():
+    remote = JobPosting(title="Python Developer", company="Acme", source="remotive", location="", is_remote=False)
+    onsite = JobPosting(title="Python Developer", company="Acme", source="arbeitnow", location="Berlin")
+
+    job = remote.to_job(1, **job_overrides(remote))
+    assert (job.location, job.is_remote) == ("Remote", True)
+    job = onsite.to_job(1, **job_overrides(onsite))
+    assert (job.location, job.is_remote) == ("Berlin", False)
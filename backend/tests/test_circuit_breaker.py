@@ -0,0 +1,179 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from app.scrapers import circuit_breaker
+from app.scrapers.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, get_breaker, guarded,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def _breaker(**overrides) -> CircuitBreaker:
+    options = dict(
+        name="test", failure_threshold=3, error_rate_threshold=0.5, window_size=10, cooldown_seconds=30,
+    )
+    options.update(overrides)
+    return CircuitBreaker(**options)
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = _breaker()
+    for _ in range(2):
+        breaker.record_failure(10, "boom")
+    assert breaker.state == CLOSED
+
+    breaker.record_failure(10, "boom")
+
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert breaker.snapshot()["last_error"] == "boom"
+
+
+def test_success_resets_consecutive_failures(clock):
+    breaker = _breaker()
+    breaker.record_failure(10)
+    breaker.record_failure(10)
+    breaker.record_success(10)
+    breaker.record_failure(10)
+
+    assert breaker.state == CLOSED
+    assert breaker.consecutive_failures == 1
+
+
+def test_opens_on_error_rate_once_window_is_full(clock):
+    breaker = _breaker(failure_threshold=100, window_size=4)
+    breaker.record_failure(10)
+    breaker.record_success(10)
+    breaker.record_failure(10)
+    assert breaker.state == CLOSED  # Window not full yet
+
+    breaker.record_success(10)
+    breaker.record_failure(10)
+
+    assert breaker.state == OPEN
+
+
+def test_half_open_lets_one_probe_through_after_cooldown(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure(10)
+
+    clock.now += 29
+    assert not breaker.allow_request()
+
+    clock.now += 1
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()
+
+
+def test_half_open_probe_success_closes(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure(10)
+    clock.now += 30
+    assert breaker.allow_request()
+
+    breaker.record_success(10)
+
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure(10)
+    clock.now += 30
+    assert breaker.allow_request()
+
+    breaker.record_failure(10, "still down")
+
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    clock.now += 30
+    assert breaker.allow_request()
+
+
+def test_released_probe_lets_the_next_one_through(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure(10)
+    clock.now += 30
+    assert breaker.allow_request()
+
+    breaker.release_probe()
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+
+
+class _Source:
+    source_name = "flaky"
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    @guarded()
+    async def search(self):
+        return await self.outcome()
+
+    @guarded(fallback=list)
+    async def search_or_empty(self):
+        return await self.outcome()
+
+
+async def _fail():
+    raise RuntimeError("HTTP 503")
+
+
+async def _hang():
+    await asyncio.sleep(10)
+
+
+async def _ok():
+    return ["job"]
+
+
+def test_guarded_records_outcomes_and_raises_when_open():
+    source = _Source(_fail)
+    for _ in range(get_breaker("flaky").failure_threshold):
+        with pytest.raises(RuntimeError):
+            asyncio.run(source.search())
+
+    assert get_breaker("flaky").state == OPEN
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(source.search())
+    assert asyncio.run(source.search_or_empty()) == []
+
+
+def test_guarded_success_is_recorded():
+    assert asyncio.run(_Source(_ok).search()) == ["job"]
+    assert get_breaker("flaky").snapshot()["calls"] == 1
+
+
+def test_guarded_cancellation_is_not_a_failure():
+    async def cancelled():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(_Source(_hang).search(), 0.01)
+
+    for _ in range(10):
+        asyncio.run(cancelled())
+
+    breaker = get_breaker("flaky")
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["calls"] == 0
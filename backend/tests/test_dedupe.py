@@ -0,0 +1,115 @@
+from app.scrapers import FREE_SOURCES
+from app.scrapers.dedupe import DEFAULT_MAX_DISTANCE, FINGERPRINT_BITS, collapse_duplicates, fingerprint
+from app.scrapers.posting import JobPosting
+
+DESCRIPTION = (
+    "<p>We are hiring a backend engineer to build our Python and Django services, "
+    "own the Postgres schema, review pull requests and mentor two junior developers. "
+    "Experience with AWS, Docker and Celery is a plus.</p>"
+)
+
+
+def _posting(source: str, title: str, company: str, description: str = DESCRIPTION, **fields) -> JobPosting:
+    return JobPosting(
+        title=title, company=company, source=source, description=description,
+        url=f"https://{source}.example/{title.lower().replace(' ', '-')}", source_job_id=f"{source}-1", **fields,
+    )
+
+
+def test_same_job_on_several_boards_collapses():
+    postings = [
+        _posting("remotive", "Senior Python Developer", "Acme Inc"),
+        _posting("remoteok", "Senior Python Developer (Remote)", "Acme", salary_range="$120k"),
+        _posting("himalayas", "Senior Python Developer", "ACME, LLC"),
+    ]
+
+    collapsed = collapse_duplicates(postings)
+
+    assert len(collapsed) == 1
+    canonical = collapsed[0]
+    assert canonical.source == "remoteok"  # The copy with a salary is the most complete
+    assert {alternate["source"] for alternate in canonical.alternates} == {"remotive", "himalayas"}
+    assert postings[1].alternates == []  # Inputs are not mutated
+
+
+def test_reworded_description_stays_within_distance():
+    reworded = DESCRIPTION.replace("mentor two junior developers", "mentor junior engineers")
+    original = _posting("weworkremotely", "Backend Engineer", "Globex")
+    copy = _posting("nodesk", "Backend Engineer", "Globex", description=reworded)
+
+    assert (fingerprint(original) ^ fingerprint(copy)).bit_count() <= DEFAULT_MAX_DISTANCE
+    assert len(collapse_duplicates([original, copy])) == 1
+
+
+def test_different_employers_never_merge():
+    postings = [
+        _posting("remotive", "Senior Python Developer", "Acme"),
+        _posting("remoteok", "Senior Python Developer", "Initech"),
+    ]
+
+    assert len(collapse_duplicates(postings)) == 2
+
+
+def test_distinct_jobs_keep_feed_order():
+    postings = [
+        _posting("remotive", "Data Scientist", "Acme", description="<p>Models, notebooks and SQL.</p>"),
+        _posting("remotive", "Product Designer", "Hooli", description="<p>Figma, research and prototypes.</p>"),
+        _posting("remoteok", "Data Scientist", "Acme", description="<p>Models, notebooks and SQL.</p>"),
+        _posting("jobicy", "iOS Developer", "Pied Piper", description="<p>Swift and SwiftUI.</p>"),
+    ]
+
+    collapsed = collapse_duplicates(postings)
+
+    assert [posting.title for posting in collapsed] == ["Data Scientist", "Product Designer", "iOS Developer"]
+    assert [alternate["source"] for alternate in collapsed[0].alternates] == ["remoteok"]
+
+
+def test_replayed_feeds_collapse_across_boards_only(replay):
+    async def search() -> list[JobPosting]:
+        postings = []
+        for name in ("remotive", "jobicy", "himalayas", "findwork"):
+            postings.extend(await FREE_SOURCES[name].search_jobs("python", limit=20))
+        return postings
+
+    postings = replay(search)
+    collapsed = collapse_duplicates(postings)
+
+    assert len(collapsed) < len(postings)
+    assert len(collapsed) + sum(len(posting.alternates) for posting in collapsed) == len(postings)
+    for posting in collapsed:
+        sources = [posting.source, *(alternate["source"] for alternate in posting.alternates)]
+        assert len(sources) == len(set(sources))
+
+
+def test_same_role_in_several_cities_on_one_board_is_kept():
+    postings = [
+        _posting("arbeitnow", "Backend Engineer", "Acme", location="Berlin"),
+        _posting("arbeitnow", "Backend Engineer", "Acme", location="Munich"),
+        _posting("arbeitnow", "Backend Engineer", "Acme", location="Hamburg"),
+    ]
+
+    assert len(collapse_duplicates(postings)) == 3
+
+
+def test_company_less_posting_does_not_bridge_two_employers():
+    postings = [
+        _posting("remotive", "Senior Python Developer", "Acme"),
+        _posting("nodesk", "Senior Python Developer", ""),
+        _posting("remoteok", "Senior Python Developer", "Initech"),
+    ]
+
+    # A distance this loose pairs every posting, so only the cluster check keeps them apart
+    collapsed = collapse_duplicates(postings, max_distance=FINGERPRINT_BITS - 1)
+
+    assert len(collapsed) == 2
+    assert {posting.company for posting in collapsed} == {"Acme", "Initech"}
+
+
+def test_postings_without_tokens_are_not_merged():
+    postings = [
+        _posting("remotive", "Remote", "", description=""),
+        _posting("remoteok", "Remote", "", description=""),
+        _posting("himalayas", "Hiring", "Via NoDesk", description=""),
+    ]
+
+    assert len(collapse_duplicates(postings)) == 3
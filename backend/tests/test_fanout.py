@@ -0,0 +1,83 @@
+import asyncio
+from app.core.config import settings
+from app.scrapers import FREE_SOURCES
+from app.scrapers.circuit_breaker import CLOSED, OPEN, get_breaker, guarded
+from app.scrapers.fanout import fan_out, iter_fan_out
+
+
+async def _hung_search() -> list:
+    await asyncio.sleep(30)
+    return []
+
+
+async def _failing_search() -> list:
+    raise RuntimeError("HTTP 500")
+
+
+def test_deadline_returns_partial_results(replay):
+    searches = lambda: {
+        "remotive": FREE_SOURCES["remotive"].search_jobs("python", limit=5),
+        "nodesk": FREE_SOURCES["nodesk"].search_jobs("python", limit=5),
+        "hung": _hung_search(),
+    }
+    results = replay(lambda: fan_out(searches(), deadline_ms=500))
+
+    assert results["remotive"].status == "ok" and results["remotive"].jobs
+    assert results["nodesk"].status == "ok" and results["nodesk"].jobs
+    assert results["hung"].status == "timeout"
+    assert results["hung"].jobs == []
+    assert 500 <= results["hung"].elapsed_ms < 2000
+
+
+def test_results_stream_in_completion_order(replay):
+    async def slow() -> list:
+        await asyncio.sleep(0.2)
+        return ["slow"]
+
+    async def collect() -> list:
+        searches = {
+            "slow": slow(),
+            "remoteok": FREE_SOURCES["remoteok"].search_jobs("python", limit=3),
+        }
+        return [result.source async for result in iter_fan_out(searches, deadline_ms=5000)]
+
+    assert replay(collect) == ["remoteok", "slow"]
+
+
+def test_errors_are_reported_per_source(replay):
+    results = replay(lambda: fan_out({
+        "broken": _failing_search(),
+        "jobicy": FREE_SOURCES["jobicy"].search_jobs("python", limit=3),
+    }, deadline_ms=5000))
+
+    assert results["broken"].status == "error"
+    assert results["broken"].error == "HTTP 500"
+    assert results["jobicy"].status == "ok"
+
+
+class _HungSource:
+    source_name = "hung"
+
+    @guarded()
+    async def search_jobs(self) -> list:
+        return await _hung_search()
+
+
+def test_deadline_cancellation_leaves_breaker_closed():
+    for _ in range(settings.BREAKER_FAILURE_THRESHOLD + 1):
+        results = asyncio.run(fan_out({"hung": _HungSource().search_jobs()}, deadline_ms=50))
+        assert results["hung"].status == "timeout"
+
+    breaker = get_breaker("hung")
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["calls"] == 0
+
+
+def test_latency_budget_timeout_counts_against_breaker(monkeypatch):
+    monkeypatch.setitem(settings.SOURCE_LATENCY_BUDGETS_MS, "hung", 50)
+    for _ in range(settings.BREAKER_FAILURE_THRESHOLD):
+        results = asyncio.run(fan_out({"hung": _HungSource().search_jobs()}, deadline_ms=5000))
+        assert results["hung"].status == "timeout"
+
+    assert get_breaker("hung").state == OPEN
+
@@ -0,0 +1,62 @@
+import asyncio
+import httpx
+import pytest
+from app.core.config import settings
+from app.scrapers.feed_cache import FeedCache
+
+
+class _Feed:
+    """Transport serving one slow feed, counting requests."""
+
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.requests = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(self.status, content=b"feed", request=request)
+
+
+def _get_concurrently(cache: FeedCache, feed: _Feed, urls: list[str]) -> list:
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(feed)) as client:
+            return await asyncio.gather(
+                *(cache.get(client, "remoteok", url) for url in urls), return_exceptions=True,
+            )
+
+    return asyncio.run(main())
+
+
+@pytest.fixture(autouse=True)
+def cache_on(monkeypatch):
+    monkeypatch.setattr(settings, "FEED_CACHE_DEFAULT_TTL", 60)
+
+
+def test_concurrent_gets_share_one_fetch_and_drop_the_lock():
+    cache, feed = FeedCache(), _Feed()
+
+    entries = _get_concurrently(cache, feed, ["https://example.com/feed"] * 5)
+
+    assert feed.requests == 1
+    assert all(entry.body == b"feed" for entry in entries)
+    assert cache._locks == {} and cache._lock_users == {}
+
+
+def test_locks_do_not_outlive_their_fetches():
+    cache, feed = FeedCache(max_entries=4), _Feed()
+
+    _get_concurrently(cache, feed, [f"https://example.com/feed/{i}" for i in range(50)])
+
+    assert feed.requests == 50
+    assert len(cache._entries) == 4
+    assert cache._locks == {} and cache._lock_users == {}
+
+
+def test_failed_fetch_releases_the_lock():
+    cache, feed = FeedCache(), _Feed(status=503)
+
+    results = _get_concurrently(cache, feed, ["https://example.com/feed"] * 3)
+
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+    assert cache._locks == {} and cache._lock_users == {}
@@ -0,0 +1,39 @@
+import gc
+import json
+import asyncio
+import warnings
+from types import SimpleNamespace
+from app.api.v1.jobs import stream_free_sources
+from app.api.v1.schemas import FreeSourceSearch
+
+USER = SimpleNamespace(id=1)
+
+
+def _search() -> FreeSourceSearch:
+    return FreeSourceSearch(keywords="python", sources=["remoteok", "jobicy"], fresh=True, save_to_db=False)
+
+
+def test_stream_dropped_before_reading_leaves_nothing_unawaited():
+    async def open_and_drop():
+        response = await stream_free_sources(_search(), "ndjson", current_user=USER)
+        del response
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        asyncio.run(open_and_drop())
+        gc.collect()
+
+    assert not [warning for warning in caught if "never awaited" in str(warning.message)]
+
+
+def test_stream_emits_each_source_then_a_summary(replay):
+    async def read() -> list[dict]:
+        response = await stream_free_sources(_search(), "ndjson", current_user=USER)
+        return [json.loads(line) async for line in response.body_iterator]
+
+    records = replay(read)
+
+    assert sorted(record["source"] for record in records[:-1]) == ["jobicy", "remoteok"]
+    assert all(record["served_from"] == "live" and record["status"] == "ok" for record in records[:-1])
+    assert records[-1]["type"] == "summary"
+    assert records[-1]["total_found"] == sum(record["count"] for record in records[:-1])
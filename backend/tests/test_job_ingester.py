@@ -0,0 +1,42 @@
+from app.services.job_ingester import JobIngester, PostingStore
+from app.scrapers import FREE_SOURCES
+
+
+def _ingest(replay, limit_per_source: int) -> PostingStore:
+    store = PostingStore(max_age_seconds=3600)
+    replay(lambda: JobIngester(store, interval_seconds=600, limit_per_source=limit_per_source).ingest_once())
+    return store
+
+
+def test_server_side_search_sources_are_never_served_from_the_store(replay):
+    store = _ingest(replay, limit_per_source=1000)
+
+    assert not store.has("remotive")
+    assert not store.has("findwork")
+    assert "remotive" not in store.status()
+
+
+def test_only_whole_feeds_are_served_from_the_store(replay):
+    store = _ingest(replay, limit_per_source=1000)
+    status = store.status()
+
+    # 500-item synthetic feeds fit; RemoteOK's 5000-posting dump does not
+    assert store.has("weworkremotely") and status["weworkremotely"]["complete"]
+    assert store.has("himalayas")
+    assert not store.has("remoteok")
+    assert status["remoteok"] == {"postings": 1000, "complete": False, "age_seconds": 0}
+
+
+def test_store_answers_like_a_live_search_for_whole_feeds(replay):
+    store = _ingest(replay, limit_per_source=1000)
+
+    for source in ("weworkremotely", "nodesk", "arbeitnow", "jobicy"):
+        live = replay(lambda: FREE_SOURCES[source].search_jobs("python", limit=10))
+        stored = store.search(source, "python", limit=10)
+        assert [job.url for job in stored] == [job.url for job in live], source
+
+
+def test_truncated_snapshot_is_not_served(replay):
+    store = _ingest(replay, limit_per_source=100)
+
+    assert not any(store.has(source) for source in ("weworkremotely", "nodesk", "arbeitnow", "remoteok"))
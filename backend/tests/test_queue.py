@@ -0,0 +1,155 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from app.workers import queue as queue_module
+from app.workers.queue import ScrapeQueue
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(queue_module, "time", SimpleNamespace(time=clock))
+    return clock
+
+
+def _run(scenario):
+    """Run `scenario(queue)` against a fresh in-memory Redis."""
+
+    async def main():
+        queue = ScrapeQueue(prefix="test", lease_seconds=60, max_attempts=2, result_ttl_seconds=3600)
+        queue._redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        try:
+            return await scenario(queue)
+        finally:
+            await queue.close()
+
+    return asyncio.run(main())
+
+
+def test_tasks_are_reserved_in_order_and_completed(clock):
+    async def scenario(queue: ScrapeQueue):
+        first = await queue.enqueue("advanced_search", 1, {"keywords": "python"})
+        second = await queue.enqueue("saved_search", 2, {"saved_search_id": 7})
+
+        task = await queue.reserve("worker-a", timeout=0.1)
+        assert (task.id, task.kind, task.user_id, task.payload, task.attempts) == (
+            first, "advanced_search", 1, {"keywords": "python"}, 1,
+        )
+        assert (await queue.get(first))["status"] == "running"
+        assert await queue.status() == {"queued": 1, "processing": 1}
+
+        await queue.complete(task, {"jobs": 3})
+        done = await queue.get(first)
+        assert done["status"] == "done"
+        assert done["result"] == {"jobs": 3}
+        assert await queue.status() == {"queued": 1, "processing": 0}
+
+        assert (await queue.reserve("worker-a", timeout=0.1)).id == second
+        assert await queue.reserve("worker-a", timeout=0.1) is None
+
+    _run(scenario)
+
+
+def test_expired_lease_is_requeued_at_the_head(clock):
+    async def scenario(queue: ScrapeQueue):
+        stale = await queue.enqueue("advanced_search", 1, {})
+        task = await queue.reserve("worker-a", timeout=0.1)
+        waiting = await queue.enqueue("advanced_search", 1, {})
+
+        clock.now += 30
+        assert await queue.requeue_stale() == 0
+
+        clock.now += 31
+        assert await queue.requeue_stale() == 1
+        requeued = await queue.get(stale)
+        assert requeued["status"] == "queued"
+        assert requeued["error"] == "worker lease expired"
+
+        # It has waited already, so it runs before the task queued after it
+        retry = await queue.reserve("worker-b", timeout=0.1)
+        assert retry.id == task.id
+        assert retry.attempts == 2
+        assert (await queue.reserve("worker-b", timeout=0.1)).id == waiting
+
+    _run(scenario)
+
+
+def test_heartbeat_keeps_the_lease(clock):
+    async def scenario(queue: ScrapeQueue):
+        await queue.enqueue("advanced_search", 1, {})
+        task = await queue.reserve("worker-a", timeout=0.1)
+
+        for _ in range(3):
+            clock.now += 40
+            await queue.heartbeat(task.id)
+            assert await queue.requeue_stale() == 0
+
+        assert await queue.status() == {"queued": 0, "processing": 1}
+
+    _run(scenario)
+
+
+def test_unstamped_task_gets_one_sweep_of_grace(clock):
+    async def scenario(queue: ScrapeQueue):
+        task_id = await queue.enqueue("advanced_search", 1, {})
+        # A worker that died between taking the id and stamping its heartbeat
+        await queue._redis.lmove(queue._queue_key, queue._processing_key, "RIGHT", "LEFT")
+
+        assert await queue.requeue_stale() == 0
+        assert await queue.requeue_stale() == 1
+        assert (await queue.get(task_id))["status"] == "queued"
+
+    _run(scenario)
+
+
+def test_failed_task_is_retried_until_out_of_attempts(clock):
+    async def scenario(queue: ScrapeQueue):
+        task_id = await queue.enqueue("advanced_search", 1, {})
+
+        await queue.fail(await queue.reserve("worker-a", timeout=0.1), "HTTP 503")
+        assert (await queue.get(task_id))["status"] == "queued"
+
+        await queue.fail(await queue.reserve("worker-a", timeout=0.1), "HTTP 503")
+        failed = await queue.get(task_id)
+        assert failed["status"] == "failed"
+        assert failed["attempts"] == 2
+        assert failed["error"] == "HTTP 503"
+        assert await queue.status() == {"queued": 0, "processing": 0}
+
+    _run(scenario)
+
+
+def test_fail_without_retry_is_final(clock):
+    async def scenario(queue: ScrapeQueue):
+        task_id = await queue.enqueue("unknown", 1, {})
+        await queue.fail(await queue.reserve("worker-a", timeout=0.1), "Unknown task kind", retry=False)
+
+        assert (await queue.get(task_id))["status"] == "failed"
+
+    _run(scenario)
+
+
+def test_requeue_is_claimed_by_one_reaper(clock):
+    async def scenario(queue: ScrapeQueue):
+        await queue.enqueue("advanced_search", 1, {})
+        await queue.reserve("worker-a", timeout=0.1)
+        other = ScrapeQueue(prefix="test", lease_seconds=60, max_attempts=2, result_ttl_seconds=3600)
+        other._redis = queue._redis
+
+        clock.now += 61
+        counts = await asyncio.gather(queue.requeue_stale(), other.requeue_stale())
+
+        assert sorted(counts) == [0, 1]
+        assert await queue.status() == {"queued": 1, "processing": 0}
+
+    _run(scenario)
@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.api.v1.saved_searches import _feed
+from app.models import Base, Job, SavedSearch, SavedSearchHit, SavedSearchKind, User
+from app.models.job import JobSource, JobStatus
+
+pytest.importorskip("aiosqlite")
+
+HITS = 23
+LIMIT = 5
+
+
+async def _with_hits(scenario):
+    """Run `scenario(db, hit_ids)` on an in-memory database holding HITS hits for user 1."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+            db.add(User(id=1, email="user@example.com", hashed_password="x"))
+            db.add(SavedSearch(id=1, user_id=1, name="python", kind=SavedSearchKind.FREE, query={}))
+            jobs = [
+                Job(user_id=1, title=f"Job {i}", company_name="Acme", required_skills=[],
+                    source=JobSource.REMOTIVE, status=JobStatus.NEW)
+                for i in range(HITS)
+            ]
+            db.add_all(jobs)
+            await db.flush()
+            hits = [SavedSearchHit(saved_search_id=1, job_id=job.id, user_id=1) for job in jobs]
+            db.add_all(hits)
+            await db.commit()
+            return await scenario(db, [hit.id for hit in hits])
+    finally:
+        await engine.dispose()
+
+
+def test_polling_with_after_delivers_every_hit():
+    async def scenario(db, hit_ids):
+        first = await _feed(db, 1, None, after=hit_ids[2], before=None, limit=LIMIT)
+        delivered = [entry["job"].title for entry in first["jobs"]]
+        cursor = first["cursor"]
+        while True:
+            page = await _feed(db, 1, 1, after=cursor, before=None, limit=LIMIT)
+            delivered.extend(entry["job"].title for entry in page["jobs"])
+            cursor = page["cursor"]
+            if not page["has_more"]:
+                break
+
+        assert delivered == [f"Job {i}" for i in range(3, HITS)]
+        assert cursor == hit_ids[-1]
+        empty = await _feed(db, 1, None, after=cursor, before=None, limit=LIMIT)
+        assert empty["jobs"] == [] and empty["cursor"] == cursor
+
+    asyncio.run(_with_hits(scenario))
+
+
+def test_paging_back_with_before_reaches_the_oldest_hit():
+    async def scenario(db, hit_ids):
+        page = await _feed(db, 1, None, after=None, before=None, limit=LIMIT)
+        assert page["cursor"] == hit_ids[-1]
+        delivered = [entry["job"].title for entry in page["jobs"]]
+        while page["has_more"]:
+            page = await _feed(db, 1, None, after=None, before=page["before"], limit=LIMIT)
+            delivered.extend(entry["job"].title for entry in page["jobs"])
+
+        assert delivered == [f"Job {i}" for i in reversed(range(HITS))]
+
+    asyncio.run(_with_hits(scenario))
@@ -0,0 +1,107 @@
+from app.scrapers import FREE_SOURCES
+from app.scrapers.posting import JobPosting
+from app.services.saved_searches import narrow_window, posted_timestamp, take_new
+
+# 2024-01-10T12:00:00Z
+NOON = 1704888000
+
+
+def _posting(job_id: str, posted_date="", url: str = "") -> JobPosting:
+    return JobPosting(title="Python Developer", company="Acme", source="remotive",
+                      source_job_id=job_id, posted_date=posted_date, url=url)
+
+
+def test_posted_timestamp_formats():
+    assert posted_timestamp(NOON) == NOON
+    assert posted_timestamp(NOON * 1000) == NOON
+    assert posted_timestamp(str(NOON)) == NOON
+    assert posted_timestamp("2024-01-10T12:00:00") == NOON
+    assert posted_timestamp("2024-01-10T13:00:00+01:00") == NOON
+    assert posted_timestamp("Wed, 10 Jan 2024 12:00:00 +0000") == NOON
+    assert posted_timestamp("3 days ago") is None
+    assert posted_timestamp("") is None
+
+
+def test_first_run_takes_everything_and_sets_the_mark():
+    postings = [_posting("1", NOON - 60), _posting("2", NOON), _posting("3")]
+
+    new, mark = take_new(postings, None, seen_limit=100)
+
+    assert new == postings
+    assert mark["posted_at"] == NOON
+    assert set(mark["seen"]) == {"1", "2", "3"}
+
+
+def test_only_postings_past_the_mark_are_new():
+    _, mark = take_new([_posting("1", NOON - 60), _posting("2", NOON)], None, seen_limit=100)
+    postings = [
+        _posting("1", NOON - 60),   # Seen
+        _posting("2", NOON),        # Seen
+        _posting("0", NOON - 3600),  # Older than the mark
+        _posting("4", NOON + 60),   # New
+        _posting("5"),              # Undated, unseen
+    ]
+
+    new, mark = take_new(postings, mark, seen_limit=100)
+
+    assert [posting.source_job_id for posting in new] == ["4", "5"]
+    assert mark["posted_at"] == NOON + 60
+    assert mark["seen"][:2] == ["4", "5"]
+
+
+def test_posting_at_the_mark_but_unseen_is_new():
+    _, mark = take_new([_posting("1", NOON)], None, seen_limit=100)
+
+    new, _ = take_new([_posting("1", NOON), _posting("2", NOON)], mark, seen_limit=100)
+
+    assert [posting.source_job_id for posting in new] == ["2"]
+
+
+def test_undated_postings_rely_on_seen_keys():
+    _, mark = take_new([_posting("", url="https://example.com/a")], None, seen_limit=100)
+
+    new, _ = take_new(
+        [_posting("", url="https://example.com/a"), _posting("", url="https://example.com/b")], mark, seen_limit=100,
+    )
+
+    assert [posting.url for posting in new] == ["https://example.com/b"]
+
+
+def test_repeats_within_one_run_are_taken_once():
+    new, _ = take_new([_posting("1", NOON), _posting("1", NOON)], None, seen_limit=100)
+
+    assert len(new) == 1
+
+
+def test_seen_keys_are_capped_newest_first():
+    _, mark = take_new([_posting(str(i), NOON) for i in range(5)], None, seen_limit=3)
+    _, mark = take_new([_posting("9", NOON + 1)], mark, seen_limit=3)
+
+    assert mark["seen"] == ["9", "0", "1"]
+
+
+def test_mark_never_moves_back():
+    _, mark = take_new([_posting("1", NOON)], None, seen_limit=100)
+
+    _, mark = take_new([_posting("2", NOON - 3600)], mark, seen_limit=100)
+
+    assert mark["posted_at"] == NOON
+
+
+def test_rerun_of_a_replayed_search_finds_nothing_new(replay):
+    search = lambda: FREE_SOURCES["himalayas"].search_jobs("python", limit=10)
+    first = replay(search)
+
+    new, mark = take_new(first, None, seen_limit=100)
+    assert new == first
+
+    again, _ = take_new(replay(search), mark, seen_limit=100)
+    assert again == []
+
+
+def test_narrow_window():
+    assert narrow_window("any", None) == "any"
+    assert narrow_window("any", 3600) == "24h"
+    assert narrow_window("1month", 30 * 3600) == "48h"
+    assert narrow_window("24h", 3 * 24 * 3600) == "24h"  # Never wider than requested
+    assert narrow_window("any", 90 * 24 * 3600) == "any"